@@ -1,5 +1,6 @@
 import csv
 import json
+import os
 import sys
 import time
 from random import SystemRandom
@@ -7,6 +8,7 @@ from random import SystemRandom
 from apps import action
 from apps.messaging import Text, Message, send_message, Url, AcceptDecline
 from walkoff.executiondb.device import get_device_ids_by_fields
+from .csvreader import iter_csv_chunks
 
 
 @action
@@ -191,22 +193,56 @@ def accept_decline(action):
 
 @action
 def csv_to_json(path, separator=',', encoding='ascii', headers=None):
-    import sys
-    if sys.version[0] == '2':
-        from io import open
     try:
-        with open(path, encoding=encoding) as f:
-            results = []
-            if not headers:
-                headers = f.readline().split(separator)
-            for line in f.readlines():
-                line = line.strip('\r\n')
-                results.append({key: value for key, value in zip(headers, line.split(','))})
+        results = []
+        for rows, _, _ in iter_csv_chunks(path, separator=separator, encoding=encoding, headers=headers):
+            results.extend(rows)
         return results
     except (IOError, OSError) as e:
         return e, 'File Error'
 
 
+@action
+def read_csv_chunk(path, offset=0, chunk_size=1000, separator=',', encoding='ascii', headers=None):
+    try:
+        size = os.path.getsize(path)
+        for rows, headers, next_offset in iter_csv_chunks(path, chunk_size=chunk_size, separator=separator,
+                                                          encoding=encoding, headers=headers, offset=offset):
+            return {'rows': rows, 'headers': headers, 'offset': next_offset, 'done': next_offset >= size}
+        return {'rows': [], 'headers': headers or [], 'offset': size, 'done': True}
+    except (IOError, OSError) as e:
+        return e, 'File Error'
+
+
+@action
+def split_csv_to_json(path, directory, chunk_size=1000, separator=',', encoding='ascii', headers=None):
+    try:
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        base_name = os.path.splitext(os.path.basename(path))[0]
+        chunk_paths = []
+        chunks = iter_csv_chunks(path, chunk_size=chunk_size, separator=separator, encoding=encoding, headers=headers)
+        for i, (rows, _, _) in enumerate(chunks):
+            chunk_path = os.path.join(directory, '{0}-{1:06d}.json'.format(base_name, i))
+            with open(chunk_path, 'w') as chunk_file:
+                json.dump(rows, chunk_file)
+            chunk_paths.append(chunk_path)
+        return chunk_paths
+    except (IOError, OSError) as e:
+        return e, 'File Error'
+
+
+@action
+def read_json_file(path):
+    try:
+        with open(path) as json_file:
+            return json.load(json_file)
+    except (IOError, OSError) as e:
+        return e, 'File Error'
+    except ValueError as e:
+        return e, 'Invalid JSON'
+
+
 @action
 def mark_blacklist(data, blacklisted=True):
     for element in data:
@@ -0,0 +1,116 @@
+import operator
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+comparisons = {'g': operator.gt,
+               'ge': operator.ge,
+               'l': operator.lt,
+               'le': operator.le,
+               'e': operator.eq}
+
+
+def as_numeric(values):
+    """Converts a list of values to a numeric array. A NumPy array is used if NumPy is installed, otherwise a list of
+        floats is returned.
+
+    Args:
+        values (list|ndarray): The values to convert
+
+    Returns:
+        (ndarray|list[float]): The numeric array
+    """
+    if np is not None:
+        return np.asarray(values, dtype=float)
+    return [float(value) for value in values]
+
+
+def to_list(values):
+    """Converts the result of an array operation to a JSON-serializable list
+
+    Args:
+        values (ndarray|list): The values to convert
+
+    Returns:
+        (list): The values as a list
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        return values.tolist()
+    return list(values)
+
+
+def elementwise(values, func):
+    """Applies a function elementwise to a numeric array
+
+    Args:
+        values (list|ndarray): The input values
+        func (func): A function which can be applied to either a scalar or a NumPy array
+
+    Returns:
+        (list): The result of the function applied to each element
+    """
+    values = as_numeric(values)
+    if np is not None:
+        return to_list(func(values))
+    return [func(value) for value in values]
+
+
+def compare(values, operator_name, threshold):
+    """Compares each element of an array to a threshold
+
+    Args:
+        values (list|ndarray): The input values
+        operator_name (str): The comparison operator ('g', 'ge', 'l', 'le', or 'e')
+        threshold (float): The value with which to compare each element
+
+    Returns:
+        (list[bool]): A boolean mask of the elements which satisfy the comparison
+    """
+    comparison = comparisons.get(operator_name, operator.eq)
+    return elementwise(values, lambda value: comparison(value, threshold))
+
+
+def regex_match(values, regex):
+    """Matches each element of an array against a regular expression
+
+    Args:
+        values (list): The input values
+        regex (str): The regular expression
+
+    Returns:
+        (list[bool]): A boolean mask of the elements which match the regular expression
+    """
+    if regex == '*':
+        regex = '(.*)'
+    search = re.compile(regex).search
+    return [search(str(value)) is not None for value in values]
+
+
+def aggregate(mask, mode='any', ratio=0.5):
+    """Reduces a boolean mask to a single boolean
+
+    Args:
+        mask (list[bool]|ndarray): The boolean mask
+        mode (str, optional): 'any', 'all', or 'ratio'. Defaults to 'any'.
+        ratio (float, optional): The minimum fraction of True elements required in 'ratio' mode. Defaults to 0.5.
+
+    Returns:
+        (bool): The aggregated result
+    """
+    if np is not None:
+        mask = np.asarray(mask, dtype=bool)
+        if mode == 'all':
+            return bool(mask.all())
+        elif mode == 'ratio':
+            return bool(mask.size) and float(mask.mean()) >= ratio
+        return bool(mask.any())
+    else:
+        mask = [bool(element) for element in mask]
+        if mode == 'all':
+            return all(mask)
+        elif mode == 'ratio':
+            return bool(mask) and float(sum(mask)) / len(mask) >= ratio
+        return any(mask)
@@ -1,6 +1,7 @@
 import re
 
 from apps import condition
+from .arrays import aggregate, compare, regex_match
 
 
 @condition
@@ -61,3 +62,33 @@ def reverse_boolean(value):
 def accept_decline(value):
     r = value.lower() == 'accept'
     return r, "Accepted" if r else "Declined"
+
+
+@condition
+def count_array(values, operator, threshold, mode='any', ratio=0.5):
+    """Compares each element of an array to a threshold and aggregates the results
+
+    Returns:
+        True if any, all, or the given ratio of the elements (depending on the mode) satisfy the comparison
+    """
+    return aggregate(compare(values, operator, threshold), mode=mode, ratio=ratio)
+
+
+@condition
+def regMatch_array(values, regex, mode='any', ratio=0.5):
+    """Matches each element of an array against a regular expression and aggregates the results
+
+    Returns:
+        True if any, all, or the given ratio of the elements (depending on the mode) match
+    """
+    return aggregate(regex_match(values, regex), mode=mode, ratio=ratio)
+
+
+@condition
+def aggregate_mask(mask, mode='any', ratio=0.5):
+    """Aggregates a boolean mask, such as the output of the "compare array" or "regex match array" transforms
+
+    Returns:
+        True if any, all, or the given ratio of the elements (depending on the mode) are True
+    """
+    return aggregate(mask, mode=mode, ratio=ratio)
@@ -0,0 +1,59 @@
+import csv
+import mmap
+import os
+import sys
+from contextlib import closing
+
+
+def _lines(mapped, encoding):
+    """Lazily reads lines from a memory-mapped file
+
+    Args:
+        mapped (mmap): The memory-mapped file
+        encoding (str): The encoding of the file
+
+    Yields:
+        (str): The next line of the file
+    """
+    while True:
+        line = mapped.readline()
+        if not line:
+            return
+        yield line if sys.version_info[0] == 2 else line.decode(encoding)
+
+
+def iter_csv_chunks(path, chunk_size=1000, separator=',', encoding='ascii', headers=None, offset=0):
+    """Iterates over a CSV file in fixed-size chunks of rows. The file is memory-mapped and parsed lazily, so only one
+        chunk of rows is held in memory at a time.
+
+    Args:
+        path (str): Path to the CSV file
+        chunk_size (int, optional): The maximum number of rows in each chunk. Defaults to 1000.
+        separator (str, optional): The field separator. Defaults to ','.
+        encoding (str, optional): The encoding of the file. Defaults to 'ascii'.
+        headers (list[str], optional): The headers for the CSV. If none are provided, the first line of the CSV is used
+        offset (int, optional): The byte offset of the first row to read. An offset of 0 skips the header line if no
+            headers are provided. Defaults to 0.
+
+    Yields:
+        (tuple(list[dict], list[str], int)): The rows of the chunk, the headers used, and the byte offset of the row
+            following the chunk
+    """
+    with open(path, 'rb') as csv_file:
+        if os.fstat(csv_file.fileno()).st_size == 0:
+            return
+        with closing(mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ)) as mapped:
+            if not headers:
+                headers = next(csv.reader(_lines(mapped, encoding), delimiter=str(separator)), [])
+                offset = max(offset, mapped.tell())
+            mapped.seek(offset)
+            chunk = []
+            for row in csv.reader(_lines(mapped, encoding), delimiter=str(separator)):
+                if not row:
+                    continue
+                chunk.append(dict(zip(headers, row)))
+                if len(chunk) >= chunk_size:
+                    yield chunk, headers, mapped.tell()
+                    chunk = []
+            if chunk:
+                yield chunk, headers, mapped.tell()
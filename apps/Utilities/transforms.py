@@ -1,4 +1,5 @@
 from apps import transform
+from .arrays import compare, elementwise, regex_match, to_list
 
 
 @transform
@@ -52,3 +53,55 @@ def json_select(json_in, element):
 @transform
 def list_select(list_in, index):
     return json.loads(list_in)[index]
+
+
+@transform
+def length_array(values):
+    """Gets the length of each element of an array. Elements which have no length are returned unmodified if they are
+        integers and as None otherwise."""
+    return [length(value) for value in values]
+
+
+@transform
+def linear_scale_array(values, min_value, max_value, low_scale, high_scale):
+    """Scales each element of an array linearly from [min_value, max_value] to [low_scale, high_scale]. Elements
+        outside of [min_value, max_value] are clipped. If min_value equals max_value, elements up to it are scaled to
+        low_scale and elements above it to high_scale."""
+    value_range = float(max_value - min_value)
+    output_range = high_scale - low_scale
+
+    def scale(value):
+        if value_range == 0:
+            return low_scale + (value > max_value) * 1.0 * output_range
+        percentage_of_value_range = (value - min_value) / value_range
+        if isinstance(percentage_of_value_range, float):
+            percentage_of_value_range = min(max(percentage_of_value_range, 0.0), 1.0)
+        else:
+            percentage_of_value_range = percentage_of_value_range.clip(0.0, 1.0)
+        return low_scale + percentage_of_value_range * output_range
+
+    return elementwise(values, scale)
+
+
+@transform
+def multiply_array(values, multiplier):
+    """Multiplies each element of an array"""
+    return elementwise(values, lambda value: value * multiplier)
+
+
+@transform
+def add_array(values, addend):
+    """Adds a number to each element of an array"""
+    return elementwise(values, lambda value: value + addend)
+
+
+@transform
+def compare_array(values, operator, threshold):
+    """Compares each element of an array to a threshold, returning a boolean mask"""
+    return compare(values, operator, threshold)
+
+
+@transform
+def regex_match_array(values, regex):
+    """Matches each element of an array against a regular expression, returning a boolean mask"""
+    return to_list(regex_match(values, regex))
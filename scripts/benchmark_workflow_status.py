@@ -0,0 +1,159 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from timeit import default_timer
+
+sys.path.append(os.path.abspath('.'))
+from walkoff.executiondb import ExecutionDatabase, WorkflowStatusEnum, ActionStatusEnum
+from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
+from walkoff.server.endpoints.workflowqueue import read_workflow_status_page, decode_workflow_status_cursor
+
+ITEMS_PER_PAGE = 20
+
+status_weights = [(WorkflowStatusEnum.completed, 90), (WorkflowStatusEnum.aborted, 5),
+                  (WorkflowStatusEnum.running, 3), (WorkflowStatusEnum.paused, 1),
+                  (WorkflowStatusEnum.awaiting_data, 1)]
+
+status_indexes = ['ix_workflow_status_status_started_at', 'ix_workflow_status_status_completed_at',
+                  'ix_workflow_status_workflow_id_started_at', 'ix_action_status_workflow_status_id_started_at']
+
+
+def cmd_line():
+    parser = argparse.ArgumentParser('Benchmark the queries behind the workflow status endpoints')
+    parser.add_argument('-r', '--rows', type=int, default=1000000, help='number of workflow statuses to insert')
+    parser.add_argument('-a', '--actions', type=int, default=2, help='number of action statuses per workflow')
+    parser.add_argument('-w', '--workflows', type=int, default=100, help='number of distinct workflows')
+    parser.add_argument('-n', '--repeat', type=int, default=5, help='number of times to run each query')
+    parser.add_argument('-p', '--path', help='path to the SQLite database. Defaults to a temporary file')
+    parser.add_argument('--binary-uuids', action='store_true', help='store UUIDs as bytes')
+    parser.add_argument('--no-indexes', action='store_true', help='drop the status table indexes before querying')
+    return parser.parse_args()
+
+
+def choose_status():
+    value = random.randint(1, sum(weight for _, weight in status_weights))
+    for status, weight in status_weights:
+        value -= weight
+        if value <= 0:
+            return status
+
+
+def populate(execution_db, rows, actions, workflows, batch_size=10000):
+    workflow_ids = [uuid.uuid4() for _ in range(workflows)]
+    start = datetime.utcnow() - timedelta(seconds=rows)
+    for batch_start in range(0, rows, batch_size):
+        workflow_rows = []
+        action_rows = []
+        for i in range(batch_start, min(batch_start + batch_size, rows)):
+            status = choose_status()
+            started_at = start + timedelta(seconds=i)
+            completed = status in (WorkflowStatusEnum.completed, WorkflowStatusEnum.aborted)
+            execution_id = uuid.uuid4()
+            workflow_rows.append({'execution_id': execution_id,
+                                  'workflow_id': random.choice(workflow_ids),
+                                  'name': 'workflow',
+                                  'status': status,
+                                  'started_at': started_at,
+                                  'completed_at': started_at + timedelta(seconds=1) if completed else None})
+            for action in range(actions):
+                action_rows.append({'execution_id': uuid.uuid4(),
+                                    'action_id': uuid.uuid4(),
+                                    'name': 'action{}'.format(action),
+                                    'app_name': 'HelloWorld',
+                                    'action_name': 'helloWorld',
+                                    'result': '"Hello World"',
+                                    'arguments': '[]',
+                                    'status': ActionStatusEnum.success,
+                                    'started_at': started_at + timedelta(milliseconds=action),
+                                    'completed_at': started_at + timedelta(milliseconds=action + 1),
+                                    '_workflow_status_id': execution_id})
+        with execution_db.engine.begin() as connection:
+            connection.execute(WorkflowStatus.__table__.insert(), workflow_rows)
+            if action_rows:
+                connection.execute(ActionStatus.__table__.insert(), action_rows)
+    return workflow_ids
+
+
+def get_queries(execution_db, workflow_ids, rows):
+    session = execution_db.session
+
+    def list_page(page):
+        query = session.query(WorkflowStatus).order_by(WorkflowStatus.status, WorkflowStatus.started_at.desc()). \
+            limit(ITEMS_PER_PAGE).offset((page - 1) * ITEMS_PER_PAGE)
+        return [workflow_status.as_json() for workflow_status in query]
+
+    deep_page = rows // ITEMS_PER_PAGE // 2
+    offset = (deep_page - 1) * ITEMS_PER_PAGE
+    deep_cursor = None
+    if offset:
+        _, deep_cursor = read_workflow_status_page(session, [], offset)
+        deep_cursor = decode_workflow_status_cursor(deep_cursor)
+
+    def cursor_page(cursor):
+        workflow_statuses, _ = read_workflow_status_page(session, [], ITEMS_PER_PAGE, cursor=cursor)
+        return [workflow_status.as_json() for workflow_status in workflow_statuses]
+
+    def waiting_workflows():
+        return [str(execution_id) for execution_id, in
+                session.query(WorkflowStatus.execution_id).filter_by(status=WorkflowStatusEnum.awaiting_data).all()]
+
+    execution_id = session.query(WorkflowStatus.execution_id).order_by(WorkflowStatus.started_at.desc()).first()[0]
+
+    def workflow_status():
+        session.expire_all()
+        return session.query(WorkflowStatus).filter_by(execution_id=execution_id).first().as_json(full_actions=True)
+
+    def workflow_history():
+        return [workflow_status.as_json() for workflow_status in
+                session.query(WorkflowStatus).filter_by(workflow_id=workflow_ids[0]).
+                order_by(WorkflowStatus.started_at.desc()).limit(ITEMS_PER_PAGE)]
+
+    def recently_completed():
+        return session.query(WorkflowStatus).filter_by(status=WorkflowStatusEnum.completed). \
+            order_by(WorkflowStatus.completed_at.desc()).limit(ITEMS_PER_PAGE).all()
+
+    return OrderedDict([('list workflow status (first page)', lambda: list_page(1)),
+                        ('list workflow status (page {})'.format(deep_page), lambda: list_page(deep_page)),
+                        ('list workflow status (cursor, first page)', lambda: cursor_page(None)),
+                        ('list workflow status (cursor, page {})'.format(deep_page), lambda: cursor_page(deep_cursor)),
+                        ('waiting workflows', waiting_workflows),
+                        ('workflow status with actions', workflow_status),
+                        ('workflow history', workflow_history),
+                        ('recently completed', recently_completed)])
+
+
+def time_query(query, repeat):
+    times = []
+    for _ in range(repeat):
+        start = default_timer()
+        query()
+        times.append(default_timer() - start)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def benchmark(args):
+    path = args.path or os.path.join(tempfile.mkdtemp(), 'execution.db')
+    execution_db = ExecutionDatabase('sqlite', path, binary_uuids=args.binary_uuids)
+    start = default_timer()
+    workflow_ids = populate(execution_db, args.rows, args.actions, args.workflows)
+    print('Inserted {0} workflow statuses and {1} action statuses in {2:.1f}s'.format(
+        args.rows, args.rows * args.actions, default_timer() - start))
+    if args.no_indexes:
+        for index in status_indexes:
+            execution_db.engine.execute('DROP INDEX IF EXISTS {}'.format(index))
+    execution_db.engine.execute('ANALYZE')
+    for name, query in get_queries(execution_db, workflow_ids, args.rows).items():
+        print('{0:>10.2f}ms  {1}'.format(time_query(query, args.repeat) * 1000, name))
+    execution_db.tear_down()
+    if not args.path:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    benchmark(cmd_line())
@@ -0,0 +1,28 @@
+"""event search indexes
+
+Revision ID: 5a1e8c3f2b7d
+Revises: 047bc4300282
+Create Date: 2026-10-19 14:02:41.118392
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5a1e8c3f2b7d'
+down_revision = '047bc4300282'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_event_timestamp', 'event', ['timestamp'], unique=False)
+    op.create_index('ix_event_type', 'event', ['type'], unique=False)
+    op.create_index('ix_event_originator', 'event', ['originator'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_event_originator', table_name='event')
+    op.drop_index('ix_event_type', table_name='event')
+    op.drop_index('ix_event_timestamp', table_name='event')
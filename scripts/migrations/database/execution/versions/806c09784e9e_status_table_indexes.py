@@ -0,0 +1,34 @@
+"""status table indexes
+
+Revision ID: 806c09784e9e
+Revises: de7dd1e1487c
+Create Date: 2026-10-19 11:30:12.417204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '806c09784e9e'
+down_revision = 'de7dd1e1487c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_workflow_status_status_started_at', 'workflow_status',
+                    ['status', sa.text('started_at DESC')], unique=False)
+    op.create_index('ix_workflow_status_status_completed_at', 'workflow_status',
+                    ['status', sa.text('completed_at DESC')], unique=False)
+    op.create_index('ix_workflow_status_workflow_id_started_at', 'workflow_status',
+                    ['workflow_id', sa.text('started_at DESC')], unique=False)
+    op.create_index('ix_action_status_workflow_status_id_started_at', 'action_status',
+                    ['_workflow_status_id', 'started_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_action_status_workflow_status_id_started_at', table_name='action_status')
+    op.drop_index('ix_workflow_status_workflow_id_started_at', table_name='workflow_status')
+    op.drop_index('ix_workflow_status_status_completed_at', table_name='workflow_status')
+    op.drop_index('ix_workflow_status_status_started_at', table_name='workflow_status')
@@ -1,6 +1,7 @@
 __all__ = ['test_action',
            'test_app_action_event_dispatcher',
            'test_app_api_server',
+           'test_app_api_spec_cache',
            'test_app_api_validation',
            'test_app_base',
            'test_app_blueprint',
@@ -8,11 +9,13 @@ __all__ = ['test_action',
            'test_app_event_dispatcher',
            'test_app_instance',
            'test_app_utilities',
+           'test_archive_server',
            'test_argument',
            'test_authentication',
            'test_branch',
            'test_callback_container',
            'test_case_database',
+           'test_case_event_writer',
            'test_case_logger',
            'test_case_server',
            'test_case_subscriptions',
@@ -28,6 +31,8 @@ __all__ = ['test_action',
            'test_disk_subscription',
            'test_event_dispatcher',
            'test_events',
+           'test_execution_db_pool',
+           'test_execution_db_load_options',
            'test_environment_variable',
            'test_transform',
            'test_condition',
@@ -39,6 +44,8 @@ __all__ = ['test_action',
            'test_interface_event_dispatch_helpers',
            'test_interface_event_dispatcher',
            'test_make_cache',
+           'test_near_cache_adapter',
+           'test_memory_pubsub_cache',
            'test_message',
            'test_message_db',
            'test_message_history_database',
@@ -47,8 +54,10 @@ __all__ = ['test_action',
            'test_metrics_server',
            'test_notification_stream',
            'test_playbook',
+           'test_playbook_import_manifest',
            'test_redis_cache_adapter',
            'test_redis_subscription',
+           'test_retention',
            'test_problem',
            'test_roles_pages_database',
            'test_roles_server',
@@ -58,6 +67,9 @@ __all__ = ['test_action',
            'test_scheduler',
            'test_simple_workflow',
            'test_sse_stream',
+           'test_status_tables',
+           'test_startup_profiler',
+           'test_streaming_workflow',
            'test_streamable_blueprint',
            'test_system_server',
            'test_trigger_helpers',
@@ -70,6 +82,7 @@ __all__ = ['test_action',
            'test_workflow_manipulation',
            'test_workflow_execution_controller',
            'test_workflow_receiver',
+           'test_worker_launcher',
            'test_workflow_results_handler',
            'test_workflow_results_stream',
            'test_workflow_server',
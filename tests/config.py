@@ -16,6 +16,9 @@ class TestConfig(walkoff.config.Config):
     DEFAULT_CASE_EXPORT_PATH = join(DATA_PATH, 'cases.json')
     BASIC_APP_API = join('.', 'tests', 'schemas', 'basic_app_api.yaml')
     CACHE_PATH = join('.', 'tests', 'tmp', 'cache')
+    ARCHIVE_PATH = join('.', 'tests', 'tmp', 'archive')
+    APP_API_CACHE_PATH = join('.', 'tests', 'tmp', 'app_api_cache.json')
+    WORKFLOW_IMPORT_MANIFEST_PATH = join('.', 'tests', 'tmp', 'workflow_import_manifest.json')
     CASE_DB_PATH = abspath(join('.', 'tests', 'tmp', 'events_test.db'))
     DB_PATH = abspath(join('.', 'tests', 'tmp', 'walkoff_test.db'))
     EXECUTION_DB_PATH = abspath(join('.', 'tests', 'tmp', 'execution_test.db'))
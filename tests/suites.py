@@ -7,7 +7,7 @@ def add_tests_to_suite(suite, test_modules):
     suite.addTests([TestLoader().loadTestsFromModule(test_module) for test_module in test_modules])
 
 
-__case_tests = [test_case_subscriptions, test_case_database, test_case_logger]
+__case_tests = [test_case_subscriptions, test_case_database, test_case_logger, test_case_event_writer]
 case_suite = TestSuite()
 add_tests_to_suite(case_suite, __case_tests)
 
@@ -19,23 +19,28 @@ __server_tests = [test_workflow_server, test_app_api_server, test_case_server, t
                   test_redis_cache_adapter, test_redis_subscription, test_disk_subscription, test_sse_stream,
                   test_filtered_sse_stream, test_notification_stream, test_workflow_status, test_problem,
                   test_workflow_results_stream, test_streamable_blueprint, test_console_stream, test_disk_pubsub_cache,
-                  test_make_cache, test_health_endpoint]
+                  test_memory_pubsub_cache, test_make_cache, test_near_cache_adapter, test_health_endpoint,
+                  test_status_tables, test_archive_server]
 server_suite = TestSuite()
 add_tests_to_suite(server_suite, __server_tests)
 
 __execution_tests = [test_validatable, test_argument, test_action, test_helper_functions,
-                     test_workflow_results_handler, test_make_cache, test_disk_pubsub_cache,
+                     test_workflow_results_handler, test_make_cache, test_near_cache_adapter, test_disk_pubsub_cache,
                      test_workflow_communication_receiver, test_workflow_receiver,
                      test_transform, test_condition, test_branch, test_app_instance, test_metrics, test_app_utilities,
                      test_input_validation, test_decorators, test_app_api_validation, test_playbook,
                      test_condition_transform_validation, test_roles_pages_database, test_users_roles_database,
                      test_scheduler, test_walkoff_tag, test_app_cache, test_app_base, test_console_logging_handler,
-                     test_workflow_execution_controller, test_device_database, test_device_field_database]
+                     test_workflow_execution_controller, test_device_database, test_device_field_database,
+                     test_app_api_spec_cache, test_worker_launcher, test_startup_profiler,
+                     test_playbook_import_manifest, test_execution_db_pool, test_retention,
+                     test_execution_db_load_options]
 
 execution_suite = TestSuite()
 add_tests_to_suite(execution_suite, __execution_tests)
 
-__workflow_tests = [test_simple_workflow, test_workflow_manipulation, test_environment_variable]
+__workflow_tests = [test_simple_workflow, test_workflow_manipulation, test_environment_variable,
+                    test_streaming_workflow]
 workflow_suite = TestSuite()
 add_tests_to_suite(workflow_suite, __workflow_tests)
 
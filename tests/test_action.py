@@ -1,9 +1,10 @@
 import unittest
+from uuid import uuid4
 
 import walkoff.appgateway
 from tests.util import execution_db_help
 from tests.util import initialize_test_config
-from walkoff.appgateway.actionresult import ActionResult
+from walkoff.appgateway.actionresult import ActionResult, StreamingActionResult
 from walkoff.appgateway.appinstance import AppInstance
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb.action import Action
@@ -178,6 +179,41 @@ class TestAction(unittest.TestCase):
         self.assertEqual(result.status, 'Success')
         self.assertEqual(action._output, result)
 
+    def test_execute_streaming_result(self):
+        action = Action(app_name='HelloWorld', action_name='Count Up', name='helloWorld',
+                        arguments=[Argument('limit', value=3)])
+        events = []
+
+        def callback_is_sent(sender, **kwargs):
+            if isinstance(sender, Action):
+                events.append((kwargs['event'], kwargs.get('data')))
+
+        WalkoffEvent.CommonWorkflowSignal.connect(callback_is_sent)
+        result = action.execute({})
+        self.assertIsInstance(result, StreamingActionResult)
+        self.assertEqual(result.status, 'Success')
+        self.assertListEqual([event for event, _ in events], [WalkoffEvent.ActionStarted])
+
+        self.assertListEqual([chunk.result for chunk in result], [0, 1, 2])
+        chunk_events = [data for event, data in events if event == WalkoffEvent.ActionResultChunk]
+        self.assertListEqual(chunk_events, [{'result': number, 'status': 'Success', 'index': number}
+                                            for number in range(3)])
+        self.assertEqual(events[-1], (WalkoffEvent.ActionExecutionSuccess, {'result': 2, 'status': 'Success'}))
+        self.assertEqual(action.get_output().result, 2)
+
+    def test_accepts_stream_from(self):
+        action_id = uuid4()
+        action = Action(app_name='HelloWorld', action_name='Sum Stream', name='helloWorld',
+                        arguments=[Argument('numbers', reference=action_id)])
+        self.assertTrue(action.accepts_stream_from(action_id))
+        self.assertFalse(action.accepts_stream_from(uuid4()))
+
+    def test_accepts_stream_from_selection(self):
+        action_id = uuid4()
+        action = Action(app_name='HelloWorld', action_name='Sum Stream', name='helloWorld',
+                        arguments=[Argument('numbers', reference=action_id, selection=['a'])])
+        self.assertFalse(action.accepts_stream_from(action_id))
+
     def test_execute_sends_callbacks(self):
         action = Action(app_name='HelloWorld', action_name='Add Three', name='helloWorld',
                         arguments=[Argument('num1', value='-5.6'),
@@ -0,0 +1,93 @@
+import json
+import os
+import shutil
+import unittest
+
+from mock import patch
+
+import walkoff.config
+from tests.util import initialize_test_config
+from walkoff.appgateway.apispeccache import AppApiSpecCache
+
+
+class TestAppApiSpecCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+
+    def setUp(self):
+        self.directory = os.path.join('.', 'tests', 'tmp', 'spec_cache')
+        self.app_path = os.path.join(self.directory, 'App1')
+        os.makedirs(self.app_path)
+        self.spec_path = os.path.join(self.app_path, 'api.yaml')
+        self.cache_path = os.path.join(self.directory, 'cache.json')
+        self.schema_path = os.path.join(self.directory, 'schema.json')
+        self.write(self.spec_path, 'walkoff: 0.1')
+        self.write(os.path.join(self.app_path, 'main.py'), 'x = 1')
+        self.write(self.schema_path, '{}')
+        self.api = {'walkoff': '0.1', 'actions': {}}
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def write(path, contents):
+        with open(path, 'w') as file_:
+            file_.write(contents)
+
+    def read_spec(self):
+        with open(self.spec_path, 'rb') as spec_file:
+            return spec_file.read()
+
+    def cache_api(self):
+        cache = AppApiSpecCache(self.cache_path, self.schema_path)
+        cache.set(self.spec_path, self.read_spec(), self.app_path, self.api)
+        cache.save()
+
+    def get_cached_api(self):
+        return AppApiSpecCache(self.cache_path, self.schema_path).get(self.spec_path, self.read_spec(), self.app_path)
+
+    def test_get_empty(self):
+        self.assertIsNone(self.get_cached_api())
+
+    def test_get_cached(self):
+        self.cache_api()
+        self.assertDictEqual(self.get_cached_api(), self.api)
+
+    def test_get_spec_changed(self):
+        self.cache_api()
+        self.write(self.spec_path, 'walkoff: 0.2')
+        self.assertIsNone(self.get_cached_api())
+
+    def test_get_app_source_changed(self):
+        self.cache_api()
+        self.write(os.path.join(self.app_path, 'actions.py'), 'y = 2')
+        self.assertIsNone(self.get_cached_api())
+
+    def test_get_schema_changed(self):
+        self.cache_api()
+        self.write(self.schema_path, '{"type": "object"}')
+        self.assertIsNone(self.get_cached_api())
+
+    def test_get_corrupted_cache(self):
+        self.write(self.cache_path, '{"schema": ')
+        self.assertIsNone(self.get_cached_api())
+
+    def test_save_unchanged_does_not_write(self):
+        AppApiSpecCache(self.cache_path, self.schema_path).save()
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_set_not_serializable(self):
+        cache = AppApiSpecCache(self.cache_path, self.schema_path)
+        cache.set(self.spec_path, self.read_spec(), self.app_path, {'walkoff': object()})
+        cache.save()
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_load_app_apis_skips_validation_of_cached_apis(self):
+        walkoff.config.load_app_apis()
+        expected = json.loads(json.dumps(walkoff.config.app_apis))
+        walkoff.config.app_apis = {}
+        with patch('walkoff.appgateway.validator.validate_app_spec') as mock_validate:
+            walkoff.config.load_app_apis()
+        mock_validate.assert_not_called()
+        self.assertDictEqual(walkoff.config.app_apis, expected)
@@ -1,11 +1,14 @@
+import threading
+import time
 from importlib import import_module
 from unittest import TestCase
 
 import os.path
+from mock import patch
 
 from walkoff.appgateway.appcache import (AppCache, WalkoffTag,
                                          _get_qualified_class_name, _get_qualified_function_name,
-                                         _strip_base_module_from_qualified_name)
+                                         _strip_base_module_from_qualified_name, _get_api_modules)
 from walkoff.appgateway.decorators import action
 from walkoff.appgateway.apiutil import UnknownApp, UnknownAppAction
 
@@ -143,6 +146,58 @@ class TestAppCache(TestCase):
         self.assert_cache_has_apps({'HelloWorldBounded', 'HelloWorld', 'DailyQuote'})
         self.assert_cached_app_has_actions(app='DailyQuote', actions=daily_quote_expected)
 
+    def test_cache_apps_lazy(self):
+        self.cache.cache_apps(os.path.join('.', 'tests', 'testapps'), lazy=True)
+        self.assert_cache_has_apps(set())
+        self.assertSetEqual(set(self.cache.get_app_names()), {'HelloWorldBounded', 'HelloWorld', 'DailyQuote'})
+        from tests.testapps.HelloWorldBounded.main import Main
+        self.assertEqual(self.cache.get_app_action('HelloWorldBounded', 'main.Main.helloWorld'), Main.helloWorld)
+        self.assert_cache_has_apps({'HelloWorldBounded'})
+        self.assertTrue(self.cache.is_app_action_bound('HelloWorldBounded', 'main.Main.helloWorld'))
+        self.assertFalse(self.cache.is_app_action_bound('HelloWorldBounded', 'actions.global2'))
+        self.assertIn('conditions.top_level_flag', self.cache.get_app_condition_names('HelloWorldBounded'))
+        self.assertSetEqual(set(self.cache.get_app_names()), {'HelloWorldBounded', 'HelloWorld', 'DailyQuote'})
+
+    def test_cache_apps_lazy_warm_up(self):
+        self.cache.cache_apps(os.path.join('.', 'tests', 'testapps'), lazy=True, warm_up=['DailyQuote', 'Invalid'])
+        self.assert_cache_has_apps({'DailyQuote'})
+
+    def test_cache_apps_lazy_unknown_app(self):
+        self.cache.cache_apps(os.path.join('.', 'tests', 'testapps'), lazy=True)
+        with self.assertRaises(UnknownApp):
+            self.cache.get_app_action('Invalid', 'main.Main.helloWorld')
+
+    def test_cache_apps_lazy_concurrent_load(self):
+        self.cache.cache_apps(os.path.join('.', 'tests', 'testapps'), lazy=True)
+        cache_module = self.cache._cache_module
+        results = []
+
+        def slow_cache_module(*args):
+            time.sleep(0.05)
+            cache_module(*args)
+
+        def get_action_names():
+            results.append(set(self.cache.get_app_action_names('HelloWorldBounded')))
+
+        with patch.object(self.cache, '_cache_module', side_effect=slow_cache_module) as mock_cache_module:
+            threads = [threading.Thread(target=get_action_names) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(results), 3)
+        self.assertIn('main.Main.helloWorld', results[0])
+        self.assertTrue(all(result == results[0] for result in results))
+        modules = {call[0][0].__name__ for call in mock_cache_module.call_args_list}
+        self.assertEqual(len(modules), mock_cache_module.call_count)
+
+    def test_get_api_modules(self):
+        api = {'actions': {'a': {'run': 'main.Main.pause'}, 'b': {'run': 'main.global1'}},
+               'conditions': {'c': {'run': 'conditions.regMatch'}},
+               'transforms': {'d': {'run': 'missing.function'}}}
+        self.assertListEqual(_get_api_modules('tests.testapps.HelloWorldBounded', api),
+                             ['tests.testapps.HelloWorldBounded.main', 'tests.testapps.HelloWorldBounded.conditions'])
+
     def test_clear_cache_empty_cache(self):
         self.cache.clear()
         self.assertDictEqual(self.cache._cache, {})
@@ -1,5 +1,12 @@
+import os
+import shutil
+import tempfile
 import unittest
 
+from mock import patch
+
+from apps.Utilities import actions, arrays, conditions, transforms
+from apps.Utilities.csvreader import iter_csv_chunks
 from tests.util import execution_db_help, initialize_test_config
 from walkoff.executiondb.device import get_device, get_all_devices_for_app, \
     get_all_devices_of_type_from_app, App, Device
@@ -96,3 +103,121 @@ class TestAppUtilities(unittest.TestCase):
         devices = [self.device1, self.device2, self.device3, self.device4]
         self.add_test_app(devices=devices)
         self.assertEqual(get_device(self.app_name, self.device1.id), self.device1)
+
+
+class TestUtilitiesArrays(unittest.TestCase):
+
+    def check_with_and_without_numpy(self, func, expected):
+        self.assertEqual(func(), expected)
+        with patch.object(arrays, 'np', None):
+            self.assertEqual(func(), expected)
+
+    def test_length_array(self):
+        self.assertListEqual(transforms.length_array(['abc', [1, 2], 4, None]), [3, 2, 4, None])
+
+    def test_linear_scale_array(self):
+        self.check_with_and_without_numpy(lambda: transforms.linear_scale_array([0, 5, 10], 0, 10, 0, 100),
+                                          [0.0, 50.0, 100.0])
+
+    def test_linear_scale_array_clips(self):
+        self.check_with_and_without_numpy(lambda: transforms.linear_scale_array([-5, 15], 0, 10, 0, 100),
+                                          [0.0, 100.0])
+
+    def test_linear_scale_array_zero_range(self):
+        self.check_with_and_without_numpy(lambda: transforms.linear_scale_array([1, 2, 3], 2, 2, 0, 10),
+                                          [0.0, 0.0, 10.0])
+
+    def test_multiply_add_array(self):
+        self.check_with_and_without_numpy(lambda: transforms.multiply_array([1, 2], 3), [3.0, 6.0])
+        self.check_with_and_without_numpy(lambda: transforms.add_array([1, 2], 3), [4.0, 5.0])
+
+    def test_compare_array(self):
+        self.check_with_and_without_numpy(lambda: transforms.compare_array([1, 2, 3], 'ge', 2), [False, True, True])
+        self.check_with_and_without_numpy(lambda: transforms.compare_array([1, 2, 3], 'e', 2), [False, True, False])
+
+    def test_regex_match_array(self):
+        self.assertListEqual(transforms.regex_match_array(['abc', 'xyz', 12], '^[a-c]|2'), [True, False, True])
+        self.assertListEqual(transforms.regex_match_array(['abc', ''], '*'), [True, True])
+
+    def test_aggregate(self):
+        for mode, expected in (('any', True), ('all', False), ('ratio', True)):
+            self.check_with_and_without_numpy(lambda: arrays.aggregate([True, False, True], mode=mode), expected)
+        self.check_with_and_without_numpy(lambda: arrays.aggregate([True, False, False], mode='ratio'), False)
+        self.check_with_and_without_numpy(lambda: arrays.aggregate([], mode='ratio'), False)
+
+    def test_count_array(self):
+        self.assertTrue(conditions.count_array([1, 5, 10], 'g', 4))
+        self.assertFalse(conditions.count_array([1, 5, 10], 'g', 4, mode='all'))
+        self.assertTrue(conditions.count_array([1, 5, 10], 'g', 4, mode='ratio', ratio=0.6))
+
+    def test_regMatch_array(self):
+        self.assertTrue(conditions.regMatch_array(['abc', 'xyz'], '^a'))
+        self.assertFalse(conditions.regMatch_array(['abc', 'xyz'], '^a', mode='all'))
+
+    def test_aggregate_mask(self):
+        self.assertTrue(conditions.aggregate_mask([False, True]))
+        self.assertFalse(conditions.aggregate_mask([False, True], mode='all'))
+
+
+class TestUtilitiesCsv(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'data.csv')
+        with open(self.path, 'w') as csv_file:
+            csv_file.write('a,b\n1,2\n"3,4",5\n\n6,7\n')
+        self.rows = [{'a': '1', 'b': '2'}, {'a': '3,4', 'b': '5'}, {'a': '6', 'b': '7'}]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_iter_csv_chunks(self):
+        chunks = list(iter_csv_chunks(self.path, chunk_size=2))
+        self.assertListEqual([rows for rows, _, _ in chunks], [self.rows[:2], self.rows[2:]])
+        self.assertListEqual(chunks[0][1], ['a', 'b'])
+        self.assertEqual(chunks[-1][2], os.path.getsize(self.path))
+
+    def test_iter_csv_chunks_from_offset(self):
+        (_, _, offset), _ = list(iter_csv_chunks(self.path, chunk_size=2))
+        chunks = list(iter_csv_chunks(self.path, offset=offset))
+        self.assertListEqual([rows for rows, _, _ in chunks], [self.rows[2:]])
+
+    def test_iter_csv_chunks_headers(self):
+        rows, headers, _ = next(iter_csv_chunks(self.path, headers=['x', 'y']))
+        self.assertListEqual(headers, ['x', 'y'])
+        self.assertDictEqual(rows[0], {'x': 'a', 'y': 'b'})
+
+    def test_iter_csv_chunks_empty_file(self):
+        open(self.path, 'w').close()
+        self.assertListEqual(list(iter_csv_chunks(self.path)), [])
+
+    def test_csv_to_json(self):
+        self.assertListEqual(actions.csv_to_json(self.path).result, self.rows)
+
+    def test_read_csv_chunk(self):
+        chunk = actions.read_csv_chunk(self.path, chunk_size=2).result
+        self.assertListEqual(chunk['rows'], self.rows[:2])
+        self.assertFalse(chunk['done'])
+        chunk = actions.read_csv_chunk(self.path, offset=chunk['offset'], chunk_size=2,
+                                      headers=chunk['headers']).result
+        self.assertListEqual(chunk['rows'], self.rows[2:])
+        self.assertTrue(chunk['done'])
+        chunk = actions.read_csv_chunk(self.path, offset=chunk['offset'], headers=chunk['headers']).result
+        self.assertDictEqual(chunk, {'rows': [], 'headers': ['a', 'b'], 'offset': os.path.getsize(self.path),
+                                     'done': True})
+
+    def test_read_csv_chunk_file_error(self):
+        self.assertEqual(actions.read_csv_chunk(os.path.join(self.directory, 'invalid.csv')).status, 'File Error')
+
+    def test_split_csv_to_json(self):
+        output = os.path.join(self.directory, 'output')
+        paths = actions.split_csv_to_json(self.path, output, chunk_size=2).result
+        self.assertListEqual(paths, [os.path.join(output, 'data-00000{}.json'.format(i)) for i in range(2)])
+        self.assertListEqual([actions.read_json_file(path).result for path in paths], [self.rows[:2], self.rows[2:]])
+
+    def test_read_json_file_invalid(self):
+        path = os.path.join(self.directory, 'invalid.json')
+        with open(path, 'w') as json_file:
+            json_file.write('{')
+        self.assertEqual(actions.read_json_file(path).status, 'Invalid JSON')
+        self.assertEqual(actions.read_json_file(os.path.join(self.directory, 'dne.json')).status, 'File Error')
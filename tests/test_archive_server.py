@@ -0,0 +1,49 @@
+import json
+import shutil
+from datetime import datetime
+
+from flask import current_app
+
+from tests.util.servertestcase import ServerTestCase
+from walkoff.server.returncodes import *
+
+
+class TestArchiveServer(ServerTestCase):
+    def setUp(self):
+        self.archive = current_app.running_context.archive
+        self.archive.write('workflow_status', [(datetime(2018, 5, day), {'execution_id': str(day)})
+                                               for day in range(1, 4)])
+        self.archive.write('event', [(datetime(2018, 5, 1), {'id': i}) for i in range(25)])
+
+    def tearDown(self):
+        shutil.rmtree(self.archive.path, ignore_errors=True)
+
+    def test_read_archive_partitions(self):
+        response = self.get_with_status_check('/api/archive', headers=self.headers)
+        self.assertListEqual([(partition['table'], partition['date']) for partition in response],
+                             [('event', '2018-05-01'), ('workflow_status', '2018-05-01'),
+                              ('workflow_status', '2018-05-02'), ('workflow_status', '2018-05-03')])
+
+    def test_read_archive_partitions_of_table(self):
+        response = self.get_with_status_check('/api/archive?table=event', headers=self.headers)
+        self.assertEqual(len(response), 1)
+        self.assertEqual(response[0]['table'], 'event')
+
+    def test_read_archived_records_date_range(self):
+        response = self.get_with_status_check(
+            '/api/archive/workflow_status?start_date=2018-05-02&end_date=2018-05-03', headers=self.headers)
+        self.assertListEqual(response, [{'execution_id': '2'}, {'execution_id': '3'}])
+
+    def test_read_archived_records_pages(self):
+        first_page = self.get_with_status_check('/api/archive/event', headers=self.headers)
+        self.assertListEqual(first_page, [{'id': i} for i in range(current_app.config['ITEMS_PER_PAGE'])])
+        second_page = self.get_with_status_check('/api/archive/event?page=2', headers=self.headers)
+        self.assertListEqual(second_page, [{'id': i} for i in range(current_app.config['ITEMS_PER_PAGE'], 25)])
+
+    def test_read_archived_records_invalid_date(self):
+        self.get_with_status_check('/api/archive/event?start_date=05/01/2018', headers=self.headers,
+                                   error=True, status_code=BAD_REQUEST)
+
+    def test_read_archived_records_unknown_table(self):
+        response = self.test_client.get('/api/archive/workflow', headers=self.headers)
+        self.assertEqual(response.status_code, BAD_REQUEST)
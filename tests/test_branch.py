@@ -1,5 +1,7 @@
 import unittest
 
+from mock import patch
+
 import walkoff.appgateway
 from tests.util import execution_db_help, initialize_test_config
 from walkoff.appgateway.actionresult import ActionResult
@@ -9,6 +11,7 @@ from walkoff.executiondb.argument import Argument
 from walkoff.executiondb.branch import Branch
 from walkoff.executiondb.condition import Condition
 from walkoff.executiondb.conditionalexpression import ConditionalExpression
+from walkoff.executiondb.transform import Transform
 from walkoff.executiondb.workflow import Workflow
 
 
@@ -161,3 +164,26 @@ class TestBranch(unittest.TestCase):
         self.assertEqual(branch._counter, 1)
         self.assertIn(branch.id, accumulator)
         self.assertEqual(accumulator[branch.id], 1)
+
+    def test_get_branch_shares_transform_results(self):
+        action = Action('HelloWorld', 'helloWorld', 'helloWorld', id=1)
+        action2 = Action('HelloWorld', 'helloWorld', 'helloWorld', id=2)
+        action3 = Action('HelloWorld', 'helloWorld', 'helloWorld', id=3)
+
+        def make_condition(regex):
+            transforms = [Transform('HelloWorld', 'select json', arguments=[Argument('element', value='message')])]
+            return ConditionalExpression(
+                'and',
+                conditions=[Condition('HelloWorld', action_name='regMatch', arguments=[Argument('regex', value=regex)],
+                                      transforms=transforms)])
+
+        branch_one = Branch(source_id=action.id, destination_id=2, condition=make_condition('nope'), priority=1)
+        branch_two = Branch(source_id=action.id, destination_id=3, condition=make_condition('aaa'), priority=2)
+
+        action._output = ActionResult(result={'message': 'aaa'}, status='Success')
+        workflow = Workflow('test', 1, actions=[action, action2, action3], branches=[branch_one, branch_two])
+
+        with patch.object(Transform, 'execute', autospec=True,
+                          side_effect=lambda self, data_in, acc: data_in['message']) as mock_execute:
+            self.assertEqual(workflow.get_branch(action, {}), 3)
+        self.assertEqual(mock_execute.call_count, 1)
@@ -1,8 +1,9 @@
 import json
 import unittest
+from datetime import datetime
 
 from tests.util import execution_db_help, initialize_test_config
-from walkoff.case.database import Case, Event
+from walkoff.case.database import Case, Event, _CaseEventLink
 
 
 class TestCaseDatabase(unittest.TestCase):
@@ -17,6 +18,7 @@ class TestCaseDatabase(unittest.TestCase):
         cls.case_db.tear_down()
 
     def tearDown(self):
+        self.case_db.session.query(_CaseEventLink).delete()
         self.case_db.session.query(Event).delete()
         self.case_db.session.query(Case).delete()
         self.case_db.session.commit()
@@ -153,3 +155,106 @@ class TestCaseDatabase(unittest.TestCase):
         for event in event_json_list:
             self.assertIn(event['message'], input_output)
             self.assertEqual(event['data'], input_output[event['message']])
+
+    def add_case_events(self):
+        self.__construct_basic_db()
+        case1, case2 = self.get_case_ids(['case1', 'case2'])
+        for i in range(6):
+            event = Event(type=('SYSTEM', 'WORKFLOW')[i % 2], message=str(i), timestamp=datetime(2018, 5, 1 + i))
+            self.case_db.add_event(event=event, case_ids=[case1] if i != 3 else [case1, case2])
+        return case1, case2
+
+    def test_case_events_query(self):
+        case1, case2 = self.add_case_events()
+        self.assertListEqual([event.message for event in self.case_db.case_events_query(case1)],
+                             ['0', '1', '2', '3', '4', '5'])
+        self.assertListEqual([event.message for event in self.case_db.case_events_query(case2)], ['3'])
+        events = self.case_db.case_events_query(case1, event_types=['WORKFLOW'], start_time=datetime(2018, 5, 3),
+                                                end_time=datetime(2018, 5, 6))
+        self.assertListEqual([event.message for event in events], ['3'])
+
+    def test_read_case_events(self):
+        case1, _ = self.add_case_events()
+        events, has_more = self.case_db.read_case_events(case1, 4)
+        self.assertListEqual([event.message for event in events], ['0', '1', '2', '3'])
+        self.assertTrue(has_more)
+        events, has_more = self.case_db.read_case_events(case1, 4, after_id=events[-1].id)
+        self.assertListEqual([event.message for event in events], ['4', '5'])
+        self.assertFalse(has_more)
+
+    def test_iter_case_events(self):
+        case1, _ = self.add_case_events()
+        events = self.case_db.iter_case_events(case1, batch_size=2, event_types=['SYSTEM'])
+        self.assertListEqual([event.as_json()['message'] for event in events], ['0', '2', '4'])
+
+    def test_case_exists(self):
+        case1, _ = self.add_case_events()
+        self.assertTrue(self.case_db.case_exists(case1))
+        self.assertFalse(self.case_db.case_exists(case1 + 100))
+
+    def add_search_events(self):
+        self.__construct_basic_db()
+        case1, case2 = self.get_case_ids(['case1', 'case2'])
+        events = [Event(type='WORKFLOW', originator='a', message='Workflow execution started'),
+                  Event(type='ACTION', originator='b', message='Action executed successfully', data='{"result": 42}'),
+                  Event(type='ACTION', originator='b', message='Action failed', note='timeout_error'),
+                  Event(type='WORKFLOW', originator='a', message='Workflow execution completed')]
+        for i, event in enumerate(events):
+            event.timestamp = datetime(2018, 5, 1 + i)
+            self.case_db.add_event(event=event, case_ids=[case1] if i < 3 else [case2])
+        return case1, case2
+
+    def search_messages(self, **kwargs):
+        events, _ = self.case_db.search_events(10, **kwargs)
+        return [event.message for event in events]
+
+    def assert_search_results(self):
+        case1, case2 = self.add_search_events()
+        self.assertListEqual(self.search_messages(search='workflow execution'),
+                             ['Workflow execution completed', 'Workflow execution started'])
+        self.assertListEqual(self.search_messages(search='exec*'),
+                             ['Workflow execution completed', 'Action executed successfully',
+                              'Workflow execution started'])
+        self.assertListEqual(self.search_messages(search='42'), ['Action executed successfully'])
+        self.assertListEqual(self.search_messages(search='timeout_error'), ['Action failed'])
+        self.assertListEqual(self.search_messages(search='"unbalanced'), [])
+        self.assertListEqual(self.search_messages(search='workflow', case_id=case1), ['Workflow execution started'])
+        self.assertListEqual(self.search_messages(search='action', originator='b', start_time=datetime(2018, 5, 3)),
+                             ['Action failed'])
+
+    def test_search_events(self):
+        self.assertTrue(self.case_db.full_text_search)
+        self.assert_search_results()
+
+    def test_search_events_without_full_text_index(self):
+        self.case_db.full_text_search = False
+        try:
+            self.assert_search_results()
+        finally:
+            self.case_db.full_text_search = True
+
+    def test_search_events_filters(self):
+        case1, case2 = self.add_search_events()
+        self.assertListEqual(self.search_messages(event_types=['WORKFLOW']),
+                             ['Workflow execution completed', 'Workflow execution started'])
+        self.assertListEqual(self.search_messages(case_id=case2), ['Workflow execution completed'])
+        self.assertListEqual(self.search_messages(end_time=datetime(2018, 5, 2)), ['Workflow execution started'])
+
+    def test_search_events_pages(self):
+        self.add_search_events()
+        events, has_more = self.case_db.search_events(3)
+        self.assertTrue(has_more)
+        events, has_more = self.case_db.search_events(3, before_id=events[-1].id)
+        self.assertListEqual([event.message for event in events], ['Workflow execution started'])
+        self.assertFalse(has_more)
+
+    def test_search_index_follows_updates_and_deletes(self):
+        self.add_search_events()
+        event = self.case_db.session.query(Event).filter_by(message='Action failed').first()
+        self.case_db.edit_event_note(event.id, 'investigated')
+        self.assertListEqual(self.search_messages(search='investigated'), ['Action failed'])
+        self.assertListEqual(self.search_messages(search='timeout_error'), [])
+        self.case_db.session.query(_CaseEventLink).delete()
+        self.case_db.session.query(Event).delete()
+        self.case_db.session.commit()
+        self.assertListEqual(self.search_messages(search='action'), [])
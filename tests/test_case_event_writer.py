@@ -0,0 +1,107 @@
+import unittest
+
+from mock import patch
+
+from tests.util import execution_db_help, initialize_test_config
+from walkoff.case.database import Case, Event, _CaseEventLink
+from walkoff.case.writer import CaseEventWriter, make_case_event_writer
+
+
+class TestCaseEventWriter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+        _, cls.case_db = execution_db_help.setup_dbs()
+
+    @classmethod
+    def tearDownClass(cls):
+        execution_db_help.tear_down_execution_db()
+        cls.case_db.tear_down()
+
+    def setUp(self):
+        self.cases = [Case(name='case{}'.format(i)) for i in range(3)]
+        self.case_db.session.add_all(self.cases)
+        self.case_db.session.commit()
+        self.writer = CaseEventWriter(self.case_db, max_queue_size=5, batch_size=3, flush_interval=0.01)
+
+    def tearDown(self):
+        self.writer.stop()
+        self.case_db.session.query(_CaseEventLink).delete()
+        self.case_db.session.query(Event).delete()
+        self.case_db.session.query(Case).delete()
+        self.case_db.session.commit()
+        self.case_db.session.expunge_all()
+
+    def get_case_events(self, case):
+        self.case_db.session.expire_all()
+        return [event.message for event in self.case_db.session.query(Case).get(case.id).events.order_by(Event.id)]
+
+    def test_write(self):
+        self.writer.write(Event(type='SYSTEM', originator='a', message='message1', data='{}'),
+                          {self.cases[0].id, self.cases[1].id})
+        self.writer.write(Event(type='WORKFLOW', originator='b', message='message2'), {self.cases[1].id})
+        self.writer.flush()
+        self.assertListEqual(self.get_case_events(self.cases[0]), ['message1'])
+        self.assertListEqual(self.get_case_events(self.cases[1]), ['message1', 'message2'])
+        self.assertListEqual(self.get_case_events(self.cases[2]), [])
+        event = self.case_db.session.query(Event).filter_by(message='message1').first()
+        self.assertEqual(event.type, 'SYSTEM')
+        self.assertEqual(event.originator, 'a')
+        self.assertIsNotNone(event.timestamp)
+        self.assertEqual(self.writer.stats['written'], 2)
+
+    def test_write_in_batches(self):
+        with patch.object(self.writer, '_write_batch', wraps=self.writer._write_batch) as mock_write_batch:
+            for i in range(5):
+                self.writer._queue.put_nowait(({'type': 'SYSTEM', 'message': str(i)}, [self.cases[0].id]))
+            self.writer.start()
+            self.writer.flush()
+        self.assertListEqual([len(call[0][0]) for call in mock_write_batch.call_args_list], [3, 2])
+        self.assertListEqual(self.get_case_events(self.cases[0]), [str(i) for i in range(5)])
+
+    def test_write_deleted_case(self):
+        case_id = self.cases[2].id
+        self.case_db.session.delete(self.cases[2])
+        self.case_db.session.commit()
+        self.writer.write(Event(type='SYSTEM', message='message'), {self.cases[0].id, case_id})
+        self.writer.flush()
+        self.assertListEqual(self.get_case_events(self.cases[0]), ['message'])
+        self.assertEqual(self.case_db.session.query(_CaseEventLink).count(), 1)
+
+    def test_write_full_queue(self):
+        self.writer._thread = 'not started'
+        for i in range(5):
+            self.assertTrue(self.writer.write(Event(type='SYSTEM', message=str(i)), {self.cases[0].id}))
+        self.assertFalse(self.writer.write(Event(type='SYSTEM', message='dropped'), {self.cases[0].id}))
+        self.assertDictEqual(self.writer.stats, {'queued': 5, 'written': 0, 'overflows': 1, 'dropped': 1, 'failed': 0})
+        self.writer._thread = None
+
+    def test_write_full_queue_block(self):
+        self.writer.block_on_overflow = True
+        self.writer.overflow_timeout = 0.01
+        self.writer._thread = 'not started'
+        for i in range(6):
+            self.writer.write(Event(type='SYSTEM', message=str(i)), {self.cases[0].id})
+        self.assertEqual(self.writer.stats['overflows'], 1)
+        self.assertEqual(self.writer.stats['dropped'], 1)
+        self.writer._thread = None
+
+    def test_failed_batch(self):
+        with patch.object(self.case_db.engine, 'begin', side_effect=Exception):
+            self.writer.write(Event(type='SYSTEM', message='message'), {self.cases[0].id})
+            self.writer.flush()
+        self.assertEqual(self.writer.stats['failed'], 1)
+        self.writer.write(Event(type='SYSTEM', message='message2'), {self.cases[0].id})
+        self.writer.flush()
+        self.assertListEqual(self.get_case_events(self.cases[0]), ['message2'])
+
+    def test_stop_writes_queued_events(self):
+        self.writer.write(Event(type='SYSTEM', message='message'), {self.cases[0].id})
+        self.writer.stop()
+        self.assertListEqual(self.get_case_events(self.cases[0]), ['message'])
+
+    def test_make_case_event_writer(self):
+        writer = make_case_event_writer(self.case_db, {'enabled': True, 'batch_size': 10})
+        self.assertIsInstance(writer, CaseEventWriter)
+        self.assertEqual(writer.batch_size, 10)
+        self.assertIsNone(make_case_event_writer(self.case_db, {'enabled': False, 'batch_size': 10}))
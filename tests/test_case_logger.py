@@ -7,6 +7,7 @@ from mock import patch, create_autospec
 from walkoff.case.database import CaseDatabase
 from walkoff.case.logger import CaseLogger
 from walkoff.case.subscription import SubscriptionCache, Subscription
+from walkoff.case.writer import CaseEventWriter
 from walkoff.events import WalkoffEvent, EventType
 
 
@@ -106,3 +107,14 @@ class TestCaseLogger(TestCase):
         uid = uuid.uuid4()
         self.logger.log(event, uid)
         self.assert_mock_called_once_with(mock_get_cases_subscribed, str(uid), event.signal_name)
+
+    @patch.object(SubscriptionCache, 'get_cases_subscribed', return_value={1, 2})
+    def test_log_with_writer(self, mock_get_cases_subscribed):
+        writer = create_autospec(CaseEventWriter)
+        logger = CaseLogger(create_autospec(CaseDatabase), SubscriptionCache(), writer)
+        event = WalkoffEvent.WorkflowExecutionStart
+        logger.log(event, uuid.uuid4())
+        writer.write.assert_called_once()
+        self.assertEqual(writer.write.call_args[0][0].message, event.value.message)
+        self.assertSetEqual(writer.write.call_args[0][1], {1, 2})
+        logger._repository.add_event.assert_not_called()
@@ -1,5 +1,6 @@
 import json
 import os
+from datetime import datetime
 from uuid import uuid4
 
 from flask import current_app
@@ -484,3 +485,95 @@ class TestCaseServer(ServerTestCase):
         response = self.get_with_status_check('/api/events/{}'.format(event.id), headers=self.headers)
         self.assertEqual(response['id'], event.id)
         self.assertEqual(response['note'], 'CHANGE NOTE')
+
+    def add_case_events(self, number_events, types=('SYSTEM', 'WORKFLOW')):
+        case = Case(name='test_case')
+        current_app.running_context.case_db.session.add(case)
+        current_app.running_context.case_db.session.commit()
+        for i in range(number_events):
+            event = Event(type=types[i % len(types)], message=str(i), timestamp=datetime(2018, 5, 1 + i))
+            current_app.running_context.case_db.add_event(event, [case.id])
+        return case.id
+
+    def test_read_all_events(self):
+        case_id = self.add_case_events(3)
+        response = self.get_with_status_check('/api/cases/{}/events'.format(case_id), headers=self.headers)
+        self.assertListEqual([event['message'] for event in response], ['0', '1', '2'])
+
+    def test_read_all_events_case_does_not_exist(self):
+        self.get_with_status_check('/api/cases/404/events', headers=self.headers, error=True,
+                                   status_code=OBJECT_DNE_ERROR)
+
+    def test_read_events_cursor(self):
+        case_id = self.add_case_events(5)
+        messages = []
+        url = '/api/cases/{}/events?limit=2'.format(case_id)
+        while True:
+            response = self.test_client.get(url, headers=self.headers)
+            self.assertEqual(response.status_code, SUCCESS)
+            messages.append([event['message'] for event in json.loads(response.get_data(as_text=True))])
+            cursor = response.headers.get('X-Next-Cursor')
+            if not cursor:
+                break
+            url = '/api/cases/{}/events?limit=2&cursor={}'.format(case_id, cursor)
+        self.assertListEqual(messages, [['0', '1'], ['2', '3'], ['4']])
+
+    def test_read_events_filters(self):
+        case_id = self.add_case_events(6)
+        response = self.get_with_status_check(
+            '/api/cases/{}/events?type=SYSTEM&start_time=2018-05-02&end_time=2018-05-05T00:00:00Z'.format(case_id),
+            headers=self.headers)
+        self.assertListEqual([event['message'] for event in response], ['2'])
+
+    def test_read_events_invalid_cursor(self):
+        case_id = self.add_case_events(1)
+        self.get_with_status_check('/api/cases/{}/events?cursor=invalid'.format(case_id), headers=self.headers,
+                                   error=True, status_code=BAD_REQUEST)
+        self.get_with_status_check('/api/cases/{}/events?start_time=yesterday'.format(case_id), headers=self.headers,
+                                   error=True, status_code=BAD_REQUEST)
+
+    def test_export_events(self):
+        case_id = self.add_case_events(4)
+        response = self.test_client.get('/api/cases/{}/events/export?type=WORKFLOW'.format(case_id),
+                                        headers=self.headers)
+        self.assertEqual(response.status_code, SUCCESS)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        self.assertIn('attachment', response.headers['Content-Disposition'])
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertListEqual([json.loads(line)['message'] for line in lines], ['1', '3'])
+
+    def test_export_events_case_does_not_exist(self):
+        self.get_with_status_check('/api/cases/404/events/export', headers=self.headers, error=True,
+                                   status_code=OBJECT_DNE_ERROR)
+
+    def test_export_case_with_events(self):
+        case_id = self.add_case_events(3)
+        case = self.get_with_status_check('api/cases/{}?mode=export'.format(case_id), headers=self.headers)
+        self.assertEqual(case['name'], 'test_case')
+        self.assertListEqual([event['message'] for event in case['events']], ['0', '1', '2'])
+
+    def test_search_events(self):
+        case_id = self.add_case_events(5)
+        messages = []
+        url = '/api/events?type=SYSTEM&limit=2&case_id={}'.format(case_id)
+        while True:
+            response = self.test_client.get(url, headers=self.headers)
+            self.assertEqual(response.status_code, SUCCESS)
+            messages.append([event['message'] for event in json.loads(response.get_data(as_text=True))])
+            cursor = response.headers.get('X-Next-Cursor')
+            if not cursor:
+                break
+            url = '/api/events?type=SYSTEM&limit=2&case_id={}&cursor={}'.format(case_id, cursor)
+        self.assertListEqual(messages, [['4', '2'], ['0']])
+
+    def test_search_events_text(self):
+        self.add_case_events(3)
+        current_app.running_context.case_db.edit_event_note(
+            current_app.running_context.case_db.session.query(Event).filter_by(message='1').first().id,
+            'suspicious login')
+        response = self.get_with_status_check('/api/events?q=suspicious', headers=self.headers)
+        self.assertListEqual([event['note'] for event in response], ['suspicious login'])
+
+    def test_search_events_invalid_filter(self):
+        self.get_with_status_check('/api/events?end_time=tomorrow', headers=self.headers, error=True,
+                                   status_code=BAD_REQUEST)
@@ -105,3 +105,38 @@ class TestCaseSubscriptions(unittest.TestCase):
         self.subs.update_subscriptions(1, self.case1)
         self.subs.clear()
         self.assertDictEqual(self.subs._subscriptions, {})
+
+    def test_remove_cases_removes_empty_senders(self):
+        self.subs.add_subscriptions(1, self.case1)
+        self.subs.add_subscriptions(2, self.case2)
+        self.subs.delete_case(1)
+        self.assertSetEqual(set(self.subs._subscriptions), {self.ids[0]})
+        self.assertSetEqual(set(self.subs._subscriptions[self.ids[0]]), {'e2', 'e3'})
+        self.assertNotIn(1, self.subs._case_subscriptions)
+
+    def test_case_subscriptions_index(self):
+        self.subs.add_subscriptions(1, self.case2)
+        self.subs.add_subscriptions(1, self.case4)
+        self.assertSetEqual(self.subs._case_subscriptions[1],
+                            {(self.ids[0], 'e2'), (self.ids[0], 'e3'), (self.ids[0], 'a'), (self.ids[0], 'b')})
+        self.subs.update_subscriptions(1, self.case3)
+        self.assertSetEqual(self.subs._case_subscriptions[1],
+                            {(self.ids[2], 'e'), (self.ids[2], 'b'), (self.ids[2], 'c'), (self.ids[3], 'd')})
+        self.assertNotIn(self.ids[0], self.subs._subscriptions)
+
+    def test_get_cases_subscribed_not_changed_by_updates(self):
+        self.subs.add_subscriptions(1, self.case2)
+        subscriptions = self.subs._subscriptions
+        cases = self.subs.get_cases_subscribed(self.ids[0], 'e2')
+        self.subs.add_subscriptions(2, self.case2)
+        self.subs.delete_case(1)
+        self.assertSetEqual(cases, {1})
+        self.assertSetEqual(subscriptions[self.ids[0]]['e2'], {1})
+        self.assertSetEqual(self.subs.get_cases_subscribed(self.ids[0], 'e2'), {2})
+
+    def test_clear_case_subscriptions_index(self):
+        self.subs.update_subscriptions(1, self.case1)
+        self.subs.clear()
+        self.assertDictEqual(self.subs._case_subscriptions, {})
+        self.subs.delete_case(1)
+        self.assertDictEqual(self.subs._subscriptions, {})
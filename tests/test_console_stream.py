@@ -9,6 +9,7 @@ from tests.util.mock_objects import MockRedisCacheAdapter
 from tests.util.servertestcase import ServerTestCase
 from walkoff.server.blueprints.console import *
 from walkoff.server.returncodes import SUCCESS
+from walkoff.sse import SseEvent, SubscriberQueue
 
 
 class TestConsoleStream(ServerTestCase):
@@ -28,6 +29,15 @@ class TestConsoleStream(ServerTestCase):
         expected['level'] = logging.getLevelName(logging.WARN)
         self.assertEqual(format_console_data(sender, data=data), expected)
 
+    def test_coalesce_key(self):
+        queue = SubscriberQueue(2, overflow_policy='coalesce', coalesce_key=console_stream.coalesce_key)
+        for event_id in range(4):
+            queue.put(event_id, SseEvent('log', {'message': 'line {}'.format(event_id)}).serialize())
+        queue.close()
+        self.assertListEqual([event_id for event_id, _ in queue], [2, 3])
+        self.assertEqual(queue._stats['coalesced'], 0)
+        self.assertEqual(queue._stats['dropped'], 2)
+
     @patch.object(console_stream, 'publish')
     def test_console_log_callback(self, mock_publish):
         sender = {'name': 'workflow1', 'execution_id': 'abc-def-ghi'}
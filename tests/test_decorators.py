@@ -32,6 +32,20 @@ class TestDecorators(unittest.TestCase):
 
         self.assertEqual(add_three(1, 2, 3), ActionResult(6, 'Custom'))
 
+    def test_action_wraps_generator_in_stream(self):
+        @action
+        def count(limit):
+            for number in range(limit):
+                yield number, 'Counting' if number < limit - 1 else 'Done'
+
+        result = count(3)
+        self.assertIsInstance(result, StreamingActionResult)
+        self.assertFalse(result.is_consumed)
+        self.assertListEqual(list(result), [ActionResult(0, 'Counting'), ActionResult(1, 'Counting'),
+                                            ActionResult(2, 'Done')])
+        self.assertTrue(result.is_consumed)
+        self.assertEqual((result.result, result.status), (2, 'Done'))
+
     def test_flag_decorator_is_tagged(self):
         @condition
         def is_even(x):
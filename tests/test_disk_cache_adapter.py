@@ -100,6 +100,19 @@ class TestDiskCacheAdapter(TestCase):
         self.assertEqual(self.cache.lpop('big2'), 11)
         self.assertEqual(self.cache.lpop('big2'), 12)
 
+    def test_push_many(self):
+        self.cache.rpush_many([('queue1', 1), ('queue2', 2), ('queue1', 3)])
+        self.cache.lpush_many([('queue1', 4)])
+        self.assertEqual(self.cache.lpop('queue1'), 4)
+        self.assertEqual(self.cache.rpop('queue1'), 3)
+        self.assertEqual(self.cache.rpop('queue2'), 2)
+
+    def test_blocking_pop(self):
+        self.cache.rpush('queue', 10, 11)
+        self.assertEqual(self.cache.brpop('queue', timeout=1), 11)
+        self.assertEqual(self.cache.blpop('queue', timeout=1), 10)
+        self.assertIsNone(self.cache.brpop('queue', timeout=0.1))
+
     def test_convert_expire_to_seconds_timedelta(self):
         self.assertEqual(DiskCacheAdapter._convert_expire_to_seconds(timedelta(seconds=10, milliseconds=500)), 10.5)
 
@@ -120,6 +133,11 @@ class TestDiskCacheAdapter(TestCase):
         self.cache.publish('channel1', 87)
         self.assertDictEqual(self.cache.pubsub_cache.published, {'channel1': [87]})
 
+    def test_publish_many(self):
+        self.cache.pubsub_cache = PubSubCacheSpy()
+        self.cache.publish_many([('channel1', 87), ('channel2', 88), ('channel1', 89)])
+        self.assertDictEqual(self.cache.pubsub_cache.published, {'channel1': [87, 89], 'channel2': [88]})
+
     def test_unsubscribe(self):
         self.cache.pubsub_cache = PubSubCacheSpy()
         self.cache.unsubscribe('channel1')
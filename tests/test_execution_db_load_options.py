@@ -0,0 +1,134 @@
+import unittest
+from uuid import uuid4
+
+from sqlalchemy import event
+
+import walkoff.appgateway
+from tests.util import execution_db_help, initialize_test_config
+from walkoff.executiondb.action import Action
+from walkoff.executiondb.argument import Argument
+from walkoff.executiondb.branch import Branch
+from walkoff.executiondb.condition import Condition
+from walkoff.executiondb.conditionalexpression import ConditionalExpression
+from walkoff.executiondb.environment_variable import EnvironmentVariable
+from walkoff.executiondb.loadoptions import workflow_load_options, playbook_load_options
+from walkoff.executiondb.playbook import Playbook
+from walkoff.executiondb.position import Position
+from walkoff.executiondb.schemas import PlaybookSchema, WorkflowSchema
+from walkoff.executiondb.transform import Transform
+from walkoff.executiondb.workflow import Workflow
+
+
+class QueryCounter(object):
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self.increment)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        event.remove(self.engine, 'before_cursor_execute', self.increment)
+
+    def increment(self, *args, **kwargs):
+        self.count += 1
+
+
+def make_condition():
+    return ConditionalExpression(
+        conditions=[Condition('HelloWorld', 'regMatch', arguments=[Argument('regex', value='.*')],
+                              transforms=[Transform('HelloWorld', 'Top Transform')])],
+        child_expressions=[ConditionalExpression(
+            operator='or', conditions=[Condition('HelloWorld', 'regMatch', arguments=[Argument('regex', value='a')])])])
+
+
+def make_workflow(name, number_actions):
+    actions = [Action('HelloWorld', 'repeatBackToMe', 'action{}'.format(i), id=uuid4(),
+                      arguments=[Argument('call', value=i)], position=Position(i, i),
+                      trigger=make_condition() if i == 0 else None)
+               for i in range(number_actions)]
+    branches = [Branch(source.id, destination.id, condition=make_condition())
+                for source, destination in zip(actions, actions[1:])]
+    return Workflow(name, actions[0].id, actions=actions, branches=branches,
+                    environment_variables=[EnvironmentVariable(value='a', name='env')])
+
+
+class TestLoadOptions(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+        cls.execution_db, _ = execution_db_help.setup_dbs()
+
+    @classmethod
+    def tearDownClass(cls):
+        walkoff.appgateway.clear_cache()
+        execution_db_help.tear_down_execution_db()
+
+    def tearDown(self):
+        execution_db_help.cleanup_execution_db()
+
+    def add_playbook(self, name, workflow_sizes):
+        playbook = Playbook(name, workflows=[make_workflow('workflow{}'.format(i), size)
+                                             for i, size in enumerate(workflow_sizes)])
+        self.execution_db.session.add(playbook)
+        self.execution_db.session.commit()
+        ids = playbook.id, [workflow.id for workflow in playbook.workflows]
+        self.execution_db.session.expunge_all()
+        return ids
+
+    def count_workflow_queries(self, workflow_id, options=()):
+        self.execution_db.session.expunge_all()
+        with QueryCounter(self.execution_db.engine) as counter:
+            workflow = self.execution_db.session.query(Workflow).options(*options).filter_by(id=workflow_id).first()
+            dumped = WorkflowSchema().dump(workflow).data
+        return counter.count, dumped
+
+    def count_playbook_queries(self, playbook_id, options=()):
+        self.execution_db.session.expunge_all()
+        with QueryCounter(self.execution_db.engine) as counter:
+            playbook = self.execution_db.session.query(Playbook).options(*options).filter_by(id=playbook_id).first()
+            dumped = PlaybookSchema().dump(playbook).data
+        return counter.count, dumped
+
+    def test_workflow_queries_do_not_depend_on_size(self):
+        _, (small_id,) = self.add_playbook('small', [2])
+        _, (large_id,) = self.add_playbook('large', [20])
+        small_count, _ = self.count_workflow_queries(small_id, workflow_load_options())
+        large_count, _ = self.count_workflow_queries(large_id, workflow_load_options())
+        self.assertEqual(small_count, large_count)
+        lazy_count, _ = self.count_workflow_queries(large_id)
+        self.assertGreater(lazy_count, 10 * large_count)
+
+    def test_workflow_loaded_eagerly_matches_lazily(self):
+        _, (workflow_id,) = self.add_playbook('playbook', [5])
+        _, eager = self.count_workflow_queries(workflow_id, workflow_load_options())
+        _, lazy = self.count_workflow_queries(workflow_id)
+        self.assertDictEqual(eager, lazy)
+
+    def test_playbook_queries_do_not_depend_on_number_of_workflows(self):
+        small_id, _ = self.add_playbook('small', [2])
+        large_id, _ = self.add_playbook('large', [3, 5, 8, 13])
+        small_count, _ = self.count_playbook_queries(small_id, playbook_load_options())
+        large_count, dumped = self.count_playbook_queries(large_id, playbook_load_options())
+        self.assertEqual(small_count, large_count)
+        self.assertEqual(len(dumped['workflows']), 4)
+
+    def test_playbook_workflows_only(self):
+        playbook_id, _ = self.add_playbook('playbook', [3, 5])
+        self.execution_db.session.expunge_all()
+        with QueryCounter(self.execution_db.engine) as counter:
+            playbook = self.execution_db.session.query(Playbook).options(
+                *playbook_load_options(full=False)).filter_by(id=playbook_id).first()
+            names = sorted(workflow.name for workflow in playbook.workflows)
+        self.assertListEqual(names, ['workflow0', 'workflow1'])
+        self.assertEqual(counter.count, 2)
+
+    def test_loaded_workflow_accumulator(self):
+        _, (workflow_id,) = self.add_playbook('playbook', [3])
+        self.execution_db.session.expunge_all()
+        workflow = self.execution_db.session.query(Workflow).options(
+            *workflow_load_options()).filter_by(id=workflow_id).first()
+        accumulator = workflow.get_accumulator()
+        self.assertSetEqual(set(accumulator), {branch.id for branch in workflow.branches} |
+                            {env_var.id for env_var in workflow.environment_variables})
@@ -0,0 +1,80 @@
+import os
+import unittest
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool, QueuePool, SingletonThreadPool, StaticPool
+
+from walkoff.executiondb import get_pool_args, set_sqlite_pragmas, protect_pool_across_fork
+from walkoff.helpers import format_db_path
+
+
+class TestExecutionDbPool(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.abspath(os.path.join('.', 'tests', 'tmp', 'pool_test.db'))
+
+    def tearDown(self):
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+
+    def create_engine(self, pool_options=None):
+        return create_engine(format_db_path('sqlite', self.path), connect_args={'check_same_thread': False},
+                             **get_pool_args('sqlite', self.path, pool_options))
+
+    def test_get_pool_args_no_options(self):
+        self.assertDictEqual(get_pool_args('sqlite', self.path), {'poolclass': NullPool})
+
+    def test_get_pool_args_queue(self):
+        options = {'pool_class': 'queue', 'pool_size': 3, 'max_overflow': 2, 'pool_timeout': 10, 'pool_recycle': 60}
+        self.assertDictEqual(get_pool_args('postgresql', 'walkoff', options),
+                             {'poolclass': QueuePool, 'pool_size': 3, 'max_overflow': 2, 'pool_timeout': 10,
+                              'pool_recycle': 60})
+
+    def test_get_pool_args_queue_sqlite_memory(self):
+        options = {'pool_class': 'queue', 'pool_size': 3, 'max_overflow': 2}
+        self.assertDictEqual(get_pool_args('sqlite', ':memory:', options),
+                             {'poolclass': SingletonThreadPool, 'pool_size': 3})
+
+    def test_get_pool_args_static(self):
+        self.assertDictEqual(get_pool_args('sqlite', self.path, {'pool_class': 'static', 'pool_size': 3}),
+                             {'poolclass': StaticPool})
+
+    def test_get_pool_args_unknown_pool_class(self):
+        self.assertDictEqual(get_pool_args('sqlite', self.path, {'pool_class': 'invalid'}), {'poolclass': NullPool})
+
+    def test_set_sqlite_pragmas(self):
+        engine = self.create_engine({'pool_class': 'queue'})
+        set_sqlite_pragmas(engine, {'journal_mode': 'WAL', 'busy_timeout': 1234, 'synchronous': 'NORMAL',
+                                    'cache_size': -2000})
+        with engine.connect() as connection:
+            self.assertEqual(connection.execute('PRAGMA journal_mode').scalar(), 'wal')
+            self.assertEqual(connection.execute('PRAGMA busy_timeout').scalar(), 1234)
+            self.assertEqual(connection.execute('PRAGMA synchronous').scalar(), 1)
+            self.assertEqual(connection.execute('PRAGMA cache_size').scalar(), -2000)
+        engine.dispose()
+
+    def test_set_sqlite_pragmas_ignores_invalid(self):
+        engine = self.create_engine()
+        set_sqlite_pragmas(engine, {'busy_timeout': '1; DROP TABLE x', 'cache_size': -2000})
+        with engine.connect() as connection:
+            self.assertEqual(connection.execute('PRAGMA cache_size').scalar(), -2000)
+        engine.dispose()
+
+    def test_pool_reuses_connections(self):
+        engine = self.create_engine({'pool_class': 'queue', 'pool_size': 1})
+        with engine.connect() as connection:
+            first = connection.connection.connection
+        with engine.connect() as connection:
+            self.assertIs(connection.connection.connection, first)
+        engine.dispose()
+
+    def test_protect_pool_across_fork(self):
+        engine = self.create_engine({'pool_class': 'queue', 'pool_size': 1})
+        protect_pool_across_fork(engine)
+        with engine.connect() as connection:
+            first = connection.connection.connection
+            connection.connection._connection_record.info['pid'] = -1
+        with engine.connect() as connection:
+            self.assertIsNot(connection.connection.connection, first)
+            self.assertEqual(connection.connection._connection_record.info['pid'], os.getpid())
+        engine.dispose()
@@ -1,3 +1,7 @@
+import json
+import os
+import shutil
+import tempfile
 import unittest
 
 import walkoff.appgateway
@@ -5,7 +9,8 @@ import walkoff.config
 from tests.util import initialize_test_config
 from tests.util.assertwrappers import orderless_list_compare
 from walkoff.appgateway.apiutil import get_app_action_api, get_condition_api, get_transform_api, UnknownApp, \
-    UnknownAppAction, UnknownCondition, UnknownTransform
+    UnknownAppAction, UnknownCondition, UnknownTransform, get_app_action_metadata, get_app_action_default_return, \
+    get_app_action_return_is_failure
 from walkoff.helpers import *
 from walkoff.server.blueprints.root import handle_database_errors, handle_generic_server_error
 
@@ -98,6 +103,32 @@ class TestHelperFunctions(unittest.TestCase):
         with self.assertRaises(UnknownAppAction):
             get_app_action_api('HelloWorld', 'invalid')
 
+    def test_get_app_action_metadata(self):
+        action_api = get_app_action_metadata('HelloWorld', 'dummy action')
+        self.assertEqual(action_api.run, 'main.dummy_action')
+        self.assertEqual(action_api.default_return, 'Success')
+        self.assertEqual(action_api.returns, frozenset({'Success', 'Failure'}))
+        self.assertEqual(action_api.failure_returns, frozenset({'Failure'}))
+        self.assertListEqual([param['name'] for param in action_api.parameters], ['status', 'other'])
+
+    def test_get_app_action_metadata_is_cached(self):
+        self.assertIs(get_app_action_metadata('HelloWorld', 'pause'), get_app_action_metadata('HelloWorld', 'pause'))
+
+    def test_get_app_action_metadata_rebuilt_on_reload(self):
+        original = get_app_action_metadata('HelloWorld', 'pause')
+        walkoff.config.load_app_apis()
+        self.assertIsNot(get_app_action_metadata('HelloWorld', 'pause'), original)
+        self.assertEqual(get_app_action_metadata('HelloWorld', 'pause'), original)
+
+    def test_get_app_action_return_is_failure(self):
+        self.assertTrue(get_app_action_return_is_failure('HelloWorld', 'dummy action', 'Failure'))
+        self.assertFalse(get_app_action_return_is_failure('HelloWorld', 'dummy action', 'Success'))
+        self.assertEqual(get_app_action_default_return('HelloWorld', 'dummy action'), 'Success')
+
+    def test_get_app_action_return_is_failure_unknown_status(self):
+        with self.assertRaises(UnknownAppAction):
+            get_app_action_return_is_failure('HelloWorld', 'dummy action', 'Invalid')
+
     def assert_params_tuple_equal(self, actual, expected):
         self.assertEqual(len(actual), len(expected))
         self.assertEqual(len(actual), 2)
@@ -407,4 +438,31 @@ class TestHelperFunctions(unittest.TestCase):
             ]
         }
         strip_argument_ids_from_conditional(conditional)
-        self.assertDictEqual(conditional, expected)
\ No newline at end of file
+        self.assertDictEqual(conditional, expected)
+    def test_write_json_atomically(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'file.json')
+            write_json_atomically(path, {'a': [1, 2]})
+            write_json_atomically(path, {'b': 3})
+            with open(path) as json_file:
+                self.assertDictEqual(json.load(json_file), {'b': 3})
+            self.assertListEqual(os.listdir(directory), ['file.json'])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_parse_query_timestamp(self):
+        self.assertEqual(parse_query_timestamp('2018-05-01T10:20:30.000001Z', 'start'),
+                         datetime(2018, 5, 1, 10, 20, 30, 1))
+        self.assertEqual(parse_query_timestamp('2018-05-01T10:20:30Z', 'start'), datetime(2018, 5, 1, 10, 20, 30))
+        self.assertEqual(parse_query_timestamp('2018-05-01', 'start'), datetime(2018, 5, 1))
+        with self.assertRaises(ValueError):
+            parse_query_timestamp('yesterday', 'start')
+
+    def test_encode_decode_cursor(self):
+        self.assertDictEqual(decode_cursor(encode_cursor({'id': 3, 'name': 'a'})), {'id': 3, 'name': 'a'})
+        self.assertIsNone(decode_cursor(''))
+        self.assertIsNone(decode_cursor(None))
+        for cursor in ('invalid', encode_cursor([1, 2]), u'é'):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor)
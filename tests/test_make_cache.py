@@ -4,7 +4,7 @@ import walkoff.cache
 import walkoff.config
 from tests.util import initialize_test_config
 from tests.util.mock_objects import MockRedisCacheAdapter
-from walkoff.cache import DiskCacheAdapter, make_cache
+from walkoff.cache import DiskCacheAdapter, MemoryCacheAdapter, NearCacheAdapter, make_cache
 
 
 class TestMakeCache(TestCase):
@@ -38,11 +38,32 @@ class TestMakeCache(TestCase):
         self.assertIsInstance(cache, DiskCacheAdapter)
         self.assertEqual(cache.directory, walkoff.config.Config.CACHE_PATH)
 
+    def test_memory_type(self):
+        config = {'type': 'memory', 'directory': walkoff.config.Config.CACHE_PATH, 'buffer_size': 10}
+        cache = make_cache(config)
+        self.assertIsInstance(cache, MemoryCacheAdapter)
+        self.assertEqual(cache.directory, walkoff.config.Config.CACHE_PATH)
+        self.assertEqual(cache.pubsub_cache.buffer_size, 10)
+        cache.shutdown()
+
     def test_redis(self):
         config = {'type': 'redis'}
         cache = make_cache(config)
         self.assertIsInstance(cache, MockRedisCacheAdapter)
 
+    def test_near_cache(self):
+        config = {'type': 'redis', 'near_cache': {'enabled': True, 'max_size': 10, 'ttl': 5}}
+        cache = make_cache(config)
+        self.assertIsInstance(cache, NearCacheAdapter)
+        self.assertIsInstance(cache.cache, MockRedisCacheAdapter)
+        self.assertEqual(cache.max_size, 10)
+        self.assertEqual(cache.ttl, 5)
+        cache.shutdown()
+
+    def test_near_cache_disabled(self):
+        config = {'type': 'redis', 'near_cache': {'enabled': False, 'max_size': 10}}
+        self.assertIsInstance(make_cache(config), MockRedisCacheAdapter)
+
     def test_bad_import(self):
         class CustomCacheAdapter(object):
             _requires = ['something_strange']
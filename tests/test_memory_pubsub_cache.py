@@ -0,0 +1,109 @@
+from unittest import TestCase
+
+import gevent
+from gevent.monkey import patch_all
+
+from walkoff.cache import MemoryPubSubCache, unsubscribe_message
+
+
+class TestMemoryCachePubSub(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        patch_all()
+
+    def setUp(self):
+        self.cache = MemoryPubSubCache(buffer_size=3, max_channels=2)
+
+    def tearDown(self):
+        self.cache.shutdown()
+
+    def listen(self, subscription, result):
+        def listen():
+            for x in subscription.listen():
+                result.append((subscription.event_id, x))
+
+        thread = gevent.spawn(listen)
+        thread.start()
+        gevent.sleep(0)
+        return thread
+
+    def test_init(self):
+        self.assertEqual(self.cache.buffer_size, 3)
+        self.assertEqual(self.cache.max_channels, 2)
+
+    def test_publish_no_subscribers(self):
+        self.assertEqual(self.cache.publish('channel1', '42'), 0)
+        self.assertListEqual(list(self.cache._channels['channel1']['buffer']), [(1, '42')])
+
+    def test_subscribe(self):
+        subscription = self.cache.subscribe('channel1')
+        self.assertEqual(subscription.channel, 'channel1')
+        self.assertEqual(len(self.cache._subscribers['channel1']), 1)
+        self.assertEqual(self.cache.publish('channel1', '42'), 1)
+
+    def test_pub_sub_multiple_subs(self):
+        result1, result2 = [], []
+        threads = [self.listen(self.cache.subscribe('channel1'), result1),
+                   self.listen(self.cache.subscribe('channel1'), result2)]
+        for value in (10, 2, 'a', unsubscribe_message):
+            self.cache.publish('channel1', value)
+        for thread in threads:
+            thread.join(timeout=2)
+        self.assertListEqual(result1, [(1, 10), (2, 2), (3, 'a')])
+        self.assertListEqual(result2, result1)
+        self.assertNotIn('channel1', self.cache._subscribers)
+
+    def test_pub_sub_separate_channels(self):
+        result1, result2 = [], []
+        threads = [self.listen(self.cache.subscribe('channel1'), result1),
+                   self.listen(self.cache.subscribe('channel2'), result2)]
+        self.cache.publish('channel1', 'a')
+        self.cache.publish('channel2', 'b')
+        self.cache.publish('channel1', 'c')
+        self.cache.publish('channel1', unsubscribe_message)
+        self.cache.publish('channel2', unsubscribe_message)
+        for thread in threads:
+            thread.join(timeout=2)
+        self.assertListEqual(result1, [(1, 'a'), (2, 'c')])
+        self.assertListEqual(result2, [(1, 'b')])
+
+    def test_replay_after_last_event_id(self):
+        for value in 'abcd':
+            self.cache.publish('channel1', value)
+        result = []
+        thread = self.listen(self.cache.subscribe('channel1', last_event_id=2), result)
+        self.cache.publish('channel1', 'e')
+        self.cache.publish('channel1', unsubscribe_message)
+        thread.join(timeout=2)
+        self.assertListEqual(result, [(3, 'c'), (4, 'd'), (5, 'e')])
+
+    def test_replay_is_limited_to_buffer(self):
+        for value in 'abcde':
+            self.cache.publish('channel1', value)
+        result = []
+        thread = self.listen(self.cache.subscribe('channel1', last_event_id=0), result)
+        self.cache.publish('channel1', unsubscribe_message)
+        thread.join(timeout=2)
+        self.assertListEqual(result, [(3, 'c'), (4, 'd'), (5, 'e')])
+
+    def test_unsubscribe_message_not_buffered(self):
+        self.cache.publish('channel1', 'a')
+        self.cache.publish('channel1', unsubscribe_message)
+        self.assertListEqual(list(self.cache._channels['channel1']['buffer']), [(1, 'a')])
+
+    def test_least_recently_published_channel_evicted(self):
+        self.cache.publish('channel1', 'a')
+        self.cache.publish('channel2', 'b')
+        self.cache.publish('channel1', 'c')
+        self.cache.publish('channel3', 'd')
+        self.assertListEqual(list(self.cache._channels), ['channel1', 'channel3'])
+
+    def test_shutdown_closes_subscriptions(self):
+        result = []
+        thread = self.listen(self.cache.subscribe('channel1'), result)
+        self.cache.publish('channel1', 'a')
+        self.cache.shutdown()
+        thread.join(timeout=2)
+        self.assertTrue(thread.dead)
+        self.assertListEqual(result, [(1, 'a')])
@@ -131,3 +131,11 @@ class MetricsServerTest(ServerTestCase):
         self.assertEqual(response.status_code, 200)
         response = json.loads(response.get_data(as_text=True))
         self.assertDictEqual(response, _convert_workflow_time_averages())
+
+    def test_stream_metrics(self):
+        response = self.test_client.get('/api/metrics/streams', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        streams = {stream.pop('channel'): stream for stream in json.loads(response.get_data(as_text=True))['streams']}
+        self.assertIn('action_results', streams)
+        self.assertSetEqual(set(streams['action_results']),
+                            {'subscribers', 'dropped', 'coalesced', 'disconnected', 'rejected'})
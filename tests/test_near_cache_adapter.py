@@ -0,0 +1,139 @@
+import time
+from datetime import timedelta
+from unittest import TestCase
+
+from mock import patch
+
+import walkoff.config
+from tests.util.mock_objects import MockRedisCacheAdapter
+from walkoff.cache import DiskCacheAdapter, NearCacheAdapter
+
+
+class TestNearCacheAdapter(TestCase):
+
+    def setUp(self):
+        self.backend = MockRedisCacheAdapter()
+        self.cache = NearCacheAdapter(self.backend, max_size=2)
+
+    def tearDown(self):
+        self.cache.clear()
+        self.cache.shutdown()
+
+    def wait_for_invalidations(self, cache, count):
+        for _ in range(50):
+            if cache.stats['invalidations'] >= count:
+                return
+            time.sleep(0.05)
+
+    def test_init(self):
+        self.assertIs(self.cache.cache, self.backend)
+        self.assertEqual(self.cache.max_size, 2)
+        self.assertEqual(self.cache.ttl, NearCacheAdapter.default_ttl)
+        self.assertEqual(self.cache.invalidation_channel, '__near_cache_invalidations__')
+
+    def test_get(self):
+        self.backend.set('alice', 'something')
+        self.assertEqual(self.cache.get('alice'), 'something')
+        self.backend.set('alice', 'something else')
+        self.assertEqual(self.cache.get('alice'), 'something')
+        self.assertDictEqual(self.cache.stats,
+                             {'size': 1, 'hits': 1, 'misses': 1, 'evictions': 0, 'invalidations': 0})
+
+    def test_get_key_dne(self):
+        self.assertIsNone(self.cache.get('invalid_key'))
+        self.assertIsNone(self.cache.get('invalid_key'))
+        self.assertEqual(self.cache.stats['misses'], 2)
+        self.assertEqual(self.cache.stats['size'], 0)
+
+    def test_get_evicts_least_recently_used(self):
+        for key in ('a', 'b', 'c'):
+            self.backend.set(key, key)
+        self.cache.get('a')
+        self.cache.get('b')
+        self.cache.get('a')
+        self.cache.get('c')
+        self.assertListEqual(list(self.cache._entries), ['a', 'c'])
+        self.assertEqual(self.cache.stats['evictions'], 1)
+
+    def test_get_ttl(self):
+        self.cache.ttl = 0.05
+        self.backend.set('alice', 1)
+        self.cache.get('alice')
+        self.backend.set('alice', 2)
+        time.sleep(0.1)
+        self.assertEqual(self.cache.get('alice'), '2')
+
+    def test_get_per_key_ttl(self):
+        self.cache.ttl = 10
+        self.backend.set('alice', 1)
+        self.cache.get('alice', ttl=0.05)
+        self.backend.set('alice', 2)
+        time.sleep(0.1)
+        self.assertEqual(self.cache.get('alice'), '2')
+
+    def test_init_disk_cache_needs_ttl(self):
+        backend = DiskCacheAdapter(walkoff.config.Config.CACHE_PATH)
+        try:
+            with self.assertRaises(ValueError):
+                NearCacheAdapter(backend, ttl=None, invalidation_channel=None)
+            self.assertIsNone(NearCacheAdapter(self.backend, ttl=None, invalidation_channel=None).ttl)
+        finally:
+            backend.shutdown()
+
+    def test_get_returns_copies(self):
+        with patch.object(self.backend, 'get', return_value=['a']):
+            self.cache.get('alice').append('b')
+            value = self.cache.get('alice')
+            self.assertListEqual(value, ['a'])
+            value.append('c')
+            self.assertListEqual(self.cache.get('alice'), ['a'])
+        self.assertEqual(self.cache.stats['hits'], 2)
+
+    def test_get_capped_at_expire(self):
+        self.cache.ttl = 10
+        self.cache.set('alice', 1, expire=50)
+        self.assertEqual(self.cache.get('alice'), '1')
+        self.backend.set('alice', 2)
+        time.sleep(0.1)
+        self.assertEqual(self.cache.get('alice'), '2')
+        self.cache.set('bob', 1, expire=timedelta(seconds=10))
+        self.cache.get('bob')
+        self.assertLessEqual(self.cache._entries['bob'][1], time.time() + 10)
+        self.cache.set('bob', 1)
+        self.assertNotIn('bob', self.cache._expirations)
+
+    def test_write_invalidates(self):
+        self.cache.set('count', 1)
+        self.assertEqual(self.cache.get('count'), '1')
+        self.assertEqual(self.cache.incr('count'), 2)
+        self.assertEqual(self.cache.get('count'), '2')
+        self.assertEqual(self.cache.decr('count', amount=2), 0)
+        self.assertEqual(self.cache.get('count'), '0')
+        self.assertFalse(self.cache.add('count', 5))
+        self.assertEqual(self.cache.get('count'), '0')
+
+    def test_invalidation_from_other_near_cache(self):
+        other = NearCacheAdapter(self.backend)
+        try:
+            self.cache.set('alice', 1)
+            self.assertEqual(self.cache.get('alice'), '1')
+            other.set('alice', 2)
+            self.wait_for_invalidations(self.cache, 1)
+            self.assertEqual(self.cache.get('alice'), '2')
+            other.clear()
+            self.cache.get('alice')
+            self.wait_for_invalidations(self.cache, 2)
+            self.assertEqual(self.cache.stats['size'], 0)
+        finally:
+            other.shutdown()
+
+    def test_no_invalidation_channel(self):
+        cache = NearCacheAdapter(self.backend, invalidation_channel=None)
+        self.assertIsNone(cache._listener)
+        cache.set('alice', 1)
+        self.assertEqual(cache.get('alice'), '1')
+
+    def test_passes_through_other_operations(self):
+        self.cache.rpush('queue', 10, 11)
+        self.assertEqual(self.cache.rpop('queue'), '11')
+        self.assertEqual(self.cache.lpop('queue'), '10')
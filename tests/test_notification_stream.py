@@ -7,6 +7,7 @@ from tests.util.mock_objects import MockRedisCacheAdapter
 from tests.util.servertestcase import ServerTestCase
 from walkoff.server.blueprints.notifications import *
 from walkoff.server.returncodes import SUCCESS
+from walkoff.sse import SseEvent, SubscriberQueue
 
 
 class MockUser:
@@ -53,6 +54,17 @@ class TestNotificationStream(ServerTestCase):
         self.assert_timestamp_is_not_none(formatted)
         self.assertDictEqual(formatted, {'id': 1, 'username': 'uname2'})
 
+    def test_coalesce_key(self):
+        queue = SubscriberQueue(3, overflow_policy='coalesce', coalesce_key=sse_stream.coalesce_key)
+        events = [('created', {'id': 1}), ('read', {'id': 1, 'username': 'a'}), ('read', {'id': 1, 'username': 'b'}),
+                  ('created', {'id': 2}), ('read', {'id': 1, 'username': 'b'}), ('created', {'id': 2})]
+        for event_id, (event, data) in enumerate(events):
+            queue.put(event_id, SseEvent(event, data).serialize())
+        queue.close()
+        self.assertListEqual([event_id for event_id, _ in queue], [1, 4, 5])
+        self.assertEqual(queue._stats['coalesced'], 2)
+        self.assertEqual(queue._stats['dropped'], 1)
+
     @patch.object(sse_stream, 'publish')
     def test_message_created_callback(self, mock_publish):
         message, user = self.get_standard_message_and_user()
@@ -0,0 +1,50 @@
+import os
+import unittest
+
+from walkoff.executiondb.importmanifest import PlaybookImportManifest
+
+
+class TestPlaybookImportManifest(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join('.', 'tests', 'tmp', 'import_manifest.json')
+        self.contents = b'{"name": "play1", "workflows": []}'
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_unknown_file_is_not_imported(self):
+        manifest = PlaybookImportManifest(self.path)
+        self.assertFalse(manifest.is_imported('play1.playbook', self.contents, {'play1'}))
+
+    def test_record(self):
+        manifest = PlaybookImportManifest(self.path)
+        manifest.record('play1.playbook', self.contents, 'play1')
+        self.assertTrue(manifest.is_imported('play1.playbook', self.contents, {'play1'}))
+
+    def test_changed_file_is_not_imported(self):
+        manifest = PlaybookImportManifest(self.path)
+        manifest.record('play1.playbook', self.contents, 'play1')
+        self.assertFalse(manifest.is_imported('play1.playbook', b'{"name": "play2"}', {'play1'}))
+
+    def test_playbook_removed_from_database_is_not_imported(self):
+        manifest = PlaybookImportManifest(self.path)
+        manifest.record('play1.playbook', self.contents, 'play1')
+        self.assertFalse(manifest.is_imported('play1.playbook', self.contents, {'play2'}))
+
+    def test_save_and_load(self):
+        manifest = PlaybookImportManifest(self.path)
+        manifest.record('play1.playbook', self.contents, 'play1')
+        manifest.save()
+        manifest = PlaybookImportManifest(self.path)
+        self.assertTrue(manifest.is_imported('play1.playbook', self.contents, {'play1'}))
+
+    def test_save_unchanged_does_not_write(self):
+        PlaybookImportManifest(self.path).save()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_load_invalid_manifest(self):
+        with open(self.path, 'w') as manifest_file:
+            manifest_file.write('not json')
+        manifest = PlaybookImportManifest(self.path)
+        self.assertFalse(manifest.is_imported('play1.playbook', self.contents, {'play1'}))
@@ -84,6 +84,34 @@ class TestRedisCacheAdapter(TestCase):
         self.assertEqual(self.cache.lpop('big'), '10')
         self.assertEqual(self.cache.rpop('big'), '12')
 
+    def test_push_many(self):
+        self.assertListEqual(self.cache.rpush_many([('queue1', 1), ('queue2', 2), ('queue1', 3)]), [1, 1, 2])
+        self.assertListEqual(self.cache.lpush_many([('queue1', 4)]), [3])
+        self.assertEqual(self.cache.lpop('queue1'), '4')
+        self.assertEqual(self.cache.rpop('queue1'), '3')
+        self.assertEqual(self.cache.rpop('queue2'), '2')
+
+    def test_blocking_pop(self):
+        self.cache.rpush('queue', 10, 11)
+        self.assertEqual(self.cache.brpop('queue', timeout=1), '11')
+        self.assertEqual(self.cache.blpop('queue', timeout=1), '10')
+        self.assertIsNone(self.cache.brpop('queue', timeout=1))
+
+    def test_init_connection_pool(self):
+        from redis import BlockingConnectionPool, ConnectionPool
+        from walkoff.cache import RedisCacheAdapter
+        cache = RedisCacheAdapter(host='localhost', port=6380, max_connections=5)
+        self.assertIsInstance(cache.cache.connection_pool, ConnectionPool)
+        self.assertEqual(cache.cache.connection_pool.max_connections, 5)
+        cache = RedisCacheAdapter(host='localhost', port=6380, max_connections=5, pool_timeout=2)
+        pool = cache.cache.connection_pool
+        self.assertIsInstance(pool, BlockingConnectionPool)
+        self.assertEqual(pool.max_connections, 5)
+        self.assertEqual(pool.timeout, 2)
+        self.assertEqual(pool.connection_kwargs['port'], 6380)
+        cache = RedisCacheAdapter(host='localhost', port=6380, pool_timeout=2)
+        self.assertEqual(cache.cache.connection_pool.max_connections, RedisCacheAdapter.default_blocking_pool_size)
+
     def test_subscribe(self):
         sub = self.cache.subscribe('channel1')
         self.assertEqual(sub.channel, 'channel1')
@@ -94,6 +122,12 @@ class TestRedisCacheAdapter(TestCase):
         result = sub._pubsub.get_message()
         self.assertEqual(result['data'], b'42')
 
+    def test_publish_many(self):
+        sub = self.cache.subscribe('channel_a')
+        self.assertListEqual(self.cache.publish_many([('channel_a', '42'), ('channel_b', '43')]), [1, 0])
+        result = sub._pubsub.get_message()
+        self.assertEqual(result['data'], b'42')
+
     def test_unsubscribe(self):
         sub = self.cache.subscribe('channel_a')
         self.cache.unsubscribe('channel_a')
@@ -0,0 +1,243 @@
+import gzip
+import json
+import os
+import shutil
+import unittest
+import uuid
+from datetime import datetime, timedelta, date
+
+from tests.util import execution_db_help, initialize_test_config
+from walkoff.case.database import Case, Event, _CaseEventLink
+from walkoff.executiondb import WorkflowStatusEnum, ActionStatusEnum
+from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
+from walkoff.retention import Archive, RetentionManager, RetentionPolicy, InvalidRetentionPolicy
+
+
+class TestArchive(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join('.', 'tests', 'tmp', 'archive_test')
+        self.archive = Archive(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_list_partitions_no_archive(self):
+        self.assertListEqual(self.archive.list_partitions(), [])
+
+    def test_write_partitions_by_date(self):
+        self.archive.write('event', [(datetime(2018, 5, 1, 10), {'id': 1}),
+                                     (datetime(2018, 5, 2, 10), {'id': 2}),
+                                     (datetime(2018, 5, 1, 11), {'id': 3})])
+        partitions = self.archive.list_partitions()
+        self.assertListEqual([(partition['table'], partition['date']) for partition in partitions],
+                             [('event', '2018-05-01'), ('event', '2018-05-02')])
+        with gzip.open(os.path.join(self.path, 'event', '2018-05-01.ndjson.gz'), 'rb') as archive_file:
+            self.assertListEqual([json.loads(line.decode('utf-8')) for line in archive_file], [{'id': 1}, {'id': 3}])
+
+    def test_write_appends(self):
+        self.archive.write('event', [(datetime(2018, 5, 1), {'id': 1})])
+        self.archive.write('event', [(datetime(2018, 5, 1), {'id': 2})])
+        self.assertListEqual(list(self.archive.read('event')), [{'id': 1}, {'id': 2}])
+
+    def test_list_partitions_of_table(self):
+        self.archive.write('event', [(datetime(2018, 5, 1), {'id': 1})])
+        self.archive.write('workflow_status', [(datetime(2018, 5, 1), {'execution_id': 'a'})])
+        self.assertListEqual([partition['table'] for partition in self.archive.list_partitions('workflow_status')],
+                             ['workflow_status'])
+        self.assertListEqual(self.archive.list_partitions('action_status'), [])
+
+    def test_query_date_range(self):
+        self.archive.write('event', [(datetime(2018, 5, day), {'id': day}) for day in range(1, 6)])
+        self.assertListEqual(self.archive.query('event', date(2018, 5, 2), date(2018, 5, 4)),
+                             [{'id': 2}, {'id': 3}, {'id': 4}])
+        self.assertListEqual(self.archive.query('event', start_date=date(2018, 5, 4)), [{'id': 4}, {'id': 5}])
+
+    def test_query_page(self):
+        self.archive.write('event', [(datetime(2018, 5, 1), {'id': i}) for i in range(10)])
+        self.assertListEqual(self.archive.query('event', offset=4, limit=3), [{'id': 4}, {'id': 5}, {'id': 6}])
+
+
+class TestRetentionPolicy(unittest.TestCase):
+    def test_from_json(self):
+        policy = RetentionPolicy.from_json({'max_age_days': 30, 'statuses': ['completed']})
+        self.assertEqual(policy.max_age_days, 30)
+        self.assertIsNone(policy.max_count)
+        self.assertListEqual(policy.statuses, ['completed'])
+        self.assertTrue(policy.is_enabled)
+
+    def test_from_json_unknown_option(self):
+        with self.assertRaises(InvalidRetentionPolicy):
+            RetentionPolicy.from_json({'max_age': 30})
+
+    def test_negative_limits(self):
+        with self.assertRaises(InvalidRetentionPolicy):
+            RetentionPolicy(max_age_days=-1)
+        with self.assertRaises(InvalidRetentionPolicy):
+            RetentionPolicy(max_count=-1)
+
+    def test_empty_policy_disabled(self):
+        self.assertFalse(RetentionPolicy().is_enabled)
+
+
+class TestRetentionManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+        cls.execution_db, cls.case_db = execution_db_help.setup_dbs()
+
+    @classmethod
+    def tearDownClass(cls):
+        execution_db_help.tear_down_execution_db()
+        cls.case_db.tear_down()
+
+    def setUp(self):
+        self.path = os.path.join('.', 'tests', 'tmp', 'archive_test')
+        self.archive = Archive(self.path)
+        self.now = datetime(2018, 6, 1)
+
+    def tearDown(self):
+        execution_db_help.cleanup_execution_db()
+        self.case_db.session.query(_CaseEventLink).delete()
+        self.case_db.session.query(Event).delete()
+        self.case_db.session.query(Case).delete()
+        self.case_db.session.commit()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def get_manager(self, policies, batch_size=1000):
+        return RetentionManager(self.execution_db, self.case_db, self.archive, policies, batch_size=batch_size)
+
+    def add_workflow_status(self, days_ago, status=WorkflowStatusEnum.completed, actions=1):
+        workflow_status = WorkflowStatus(uuid.uuid4(), uuid.uuid4(), 'workflow')
+        workflow_status.status = status
+        workflow_status.started_at = self.now - timedelta(days=days_ago, minutes=1)
+        if status in (WorkflowStatusEnum.completed, WorkflowStatusEnum.aborted):
+            workflow_status.completed_at = self.now - timedelta(days=days_ago)
+        for i in range(actions):
+            action_status = ActionStatus(uuid.uuid4(), uuid.uuid4(), 'action', 'HelloWorld', 'helloWorld')
+            action_status.status = ActionStatusEnum.success
+            action_status.result = '"hello"'
+            action_status.started_at = workflow_status.started_at
+            action_status.completed_at = workflow_status.completed_at or workflow_status.started_at
+            workflow_status._action_statuses.append(action_status)
+        self.execution_db.session.add(workflow_status)
+        self.execution_db.session.commit()
+        return str(workflow_status.execution_id)
+
+    def add_event(self, days_ago, cases=()):
+        event = Event(type='SYSTEM', message='message', timestamp=self.now - timedelta(days=days_ago))
+        event.cases = list(cases)
+        self.case_db.session.add(event)
+        self.case_db.session.commit()
+        return event.id
+
+    def get_execution_ids(self):
+        return {str(execution_id) for execution_id, in self.execution_db.session.query(WorkflowStatus.execution_id)}
+
+    def test_unknown_table(self):
+        with self.assertRaises(InvalidRetentionPolicy):
+            self.get_manager({'workflow': {'max_age_days': 1}})
+
+    def test_unknown_status(self):
+        self.add_workflow_status(10)
+        manager = self.get_manager({'workflow_status': {'max_age_days': 1, 'statuses': ['finished']}})
+        with self.assertRaises(InvalidRetentionPolicy):
+            manager.enforce(now=self.now)
+
+    def test_no_policies(self):
+        self.add_workflow_status(100)
+        manager = self.get_manager(None)
+        self.assertFalse(manager.is_enabled)
+        self.assertDictEqual(manager.enforce(now=self.now), {})
+        self.assertEqual(len(self.get_execution_ids()), 1)
+
+    def test_workflow_status_max_age(self):
+        old = {self.add_workflow_status(days_ago) for days_ago in (40, 35, 31)}
+        new = {self.add_workflow_status(days_ago) for days_ago in (29, 1)}
+        manager = self.get_manager({'workflow_status': {'max_age_days': 30}}, batch_size=2)
+        self.assertDictEqual(manager.enforce(now=self.now), {'workflow_status': 3})
+        self.execution_db.session.expire_all()
+        self.assertSetEqual(self.get_execution_ids(), new)
+        self.assertEqual(self.execution_db.session.query(ActionStatus).count(), 2)
+        records = list(self.archive.read('workflow_status'))
+        self.assertSetEqual({record['execution_id'] for record in records}, old)
+        for record in records:
+            self.assertEqual(len(record['action_statuses']), 1)
+            self.assertEqual(record['action_statuses'][0]['result'], 'hello')
+
+    def test_workflow_status_partitioned_by_completion_date(self):
+        self.add_workflow_status(40)
+        self.add_workflow_status(35)
+        self.get_manager({'workflow_status': {'max_age_days': 30}}).enforce(now=self.now)
+        self.assertListEqual([partition['date'] for partition in self.archive.list_partitions('workflow_status')],
+                             ['2018-04-22', '2018-04-27'])
+
+    def test_workflow_status_only_finished_statuses(self):
+        self.add_workflow_status(40, status=WorkflowStatusEnum.completed)
+        aborted = self.add_workflow_status(40, status=WorkflowStatusEnum.aborted)
+        running = self.add_workflow_status(40, status=WorkflowStatusEnum.running)
+        manager = self.get_manager({'workflow_status': {'max_age_days': 30, 'statuses': ['completed']}})
+        self.assertDictEqual(manager.enforce(now=self.now), {'workflow_status': 1})
+        self.execution_db.session.expire_all()
+        self.assertSetEqual(self.get_execution_ids(), {aborted, running})
+
+    def test_workflow_status_max_count(self):
+        for days_ago in (5, 4, 3):
+            self.add_workflow_status(days_ago)
+        newest = {self.add_workflow_status(days_ago) for days_ago in (2, 1)}
+        running = self.add_workflow_status(6, status=WorkflowStatusEnum.running)
+        manager = self.get_manager({'workflow_status': {'max_count': 2}})
+        self.assertDictEqual(manager.enforce(now=self.now), {'workflow_status': 3})
+        self.execution_db.session.expire_all()
+        self.assertSetEqual(self.get_execution_ids(), newest | {running})
+
+    def test_workflow_status_max_age_and_count(self):
+        for days_ago in (40, 3):
+            self.add_workflow_status(days_ago)
+        newest = {self.add_workflow_status(days_ago) for days_ago in (2, 1)}
+        manager = self.get_manager({'workflow_status': {'max_age_days': 30, 'max_count': 2}})
+        self.assertDictEqual(manager.enforce(now=self.now), {'workflow_status': 2})
+        self.execution_db.session.expire_all()
+        self.assertSetEqual(self.get_execution_ids(), newest)
+
+    def test_action_status_compaction(self):
+        execution_id = self.add_workflow_status(40, actions=3)
+        manager = self.get_manager({'action_status': {'max_age_days': 30}})
+        self.assertDictEqual(manager.enforce(now=self.now), {'action_status': 3})
+        self.execution_db.session.expire_all()
+        self.assertSetEqual(self.get_execution_ids(), {execution_id})
+        self.assertEqual(self.execution_db.session.query(ActionStatus).count(), 0)
+        records = list(self.archive.read('action_status'))
+        self.assertEqual(len(records), 3)
+        self.assertTrue(all(record['workflow_execution_id'] == execution_id for record in records))
+
+    def test_event_max_age(self):
+        case = Case(name='case1')
+        self.case_db.session.add(case)
+        self.case_db.session.commit()
+        old = self.add_event(10, cases=[case])
+        new = self.add_event(1, cases=[case])
+        manager = self.get_manager({'event': {'max_age_days': 5}})
+        self.assertDictEqual(manager.enforce(now=self.now), {'event': 1})
+        self.case_db.session.expire_all()
+        self.assertListEqual([event.id for event in self.case_db.session.query(Event)], [new])
+        self.assertListEqual([event_id for event_id, in self.case_db.session.query(_CaseEventLink.event_id)], [new])
+        records = list(self.archive.read('event'))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['id'], old)
+        self.assertEqual(records[0]['cases'][0]['name'], 'case1')
+
+    def test_event_max_count(self):
+        for days_ago in range(10, 0, -1):
+            self.add_event(days_ago)
+        manager = self.get_manager({'event': {'max_count': 4}}, batch_size=3)
+        self.assertDictEqual(manager.enforce(now=self.now), {'event': 6})
+        self.case_db.session.expire_all()
+        self.assertEqual(self.case_db.session.query(Event).count(), 4)
+        self.assertEqual(len(list(self.archive.read('event'))), 6)
+
+    def test_enforce_nothing_expired(self):
+        self.add_workflow_status(1)
+        self.add_event(1)
+        manager = self.get_manager({'workflow_status': {'max_age_days': 30}, 'event': {'max_count': 10}})
+        self.assertDictEqual(manager.enforce(now=self.now), {'workflow_status': 0, 'event': 0})
+        self.assertListEqual(self.archive.list_partitions(), [])
@@ -8,8 +8,13 @@ from gevent.monkey import patch_all
 import walkoff.config
 from tests.util import initialize_test_config
 from tests.util.mock_objects import MockRedisCacheAdapter
-from walkoff.cache import DiskCacheAdapter
-from walkoff.sse import SseEvent, SseStream, InterfaceSseStream, create_interface_channel_name
+from flask import Flask
+from mock import patch
+
+from walkoff.cache import DiskCacheAdapter, MemoryCacheAdapter
+from walkoff.sse import (SseEvent, SseStream, InterfaceSseStream, SerializedJson, StreamLimiter, SubscriberQueue,
+                         create_interface_channel_name, format_serialized_event, get_event_and_fields, get_event_name,
+                         get_last_event_id, stream_limiter)
 
 
 class TestSseEvent(TestCase):
@@ -46,6 +51,30 @@ class TestSseEvent(TestCase):
         event = SseEvent('ev', data)
         self.assertEqual(event.format(11), 'id: 11\nevent: ev\ndata: {}\n\n'.format(str(data)))
 
+    def test_format_serialized_json_data(self):
+        event = SseEvent('ev', {'a': 1, 'b': SerializedJson('[1, 2]')})
+        self.assertEqual(event.format(11), 'id: 11\nevent: ev\ndata: {"a": 1, "b": [1, 2]}\n\n')
+        event = SseEvent('ev', {'b': SerializedJson('{"c": "d"}')})
+        self.assertEqual(json.loads(event.serialize().split('data: ')[1]), {'b': {'c': 'd'}})
+
+    def test_serialize_once(self):
+        event = SseEvent('ev', {'a': 1})
+        self.assertEqual(event.serialize(), 'event: ev\ndata: {"a": 1}\n\n')
+        event.data['a'] = 2
+        self.assertEqual(event.format(1), 'id: 1\nevent: ev\ndata: {"a": 1}\n\n')
+
+    def test_format_serialized_event_with_retry(self):
+        self.assertEqual(format_serialized_event('event: ev\ndata: abc\n\n', 42, retry=50),
+                         'id: 42\nevent: ev\nretry: 50\ndata: abc\n\n')
+        self.assertEqual(format_serialized_event('data: abc\n\n', 42, retry=50), 'id: 42\nretry: 50\ndata: abc\n\n')
+
+    def test_serialized_json_dumps(self):
+        class A: pass
+
+        self.assertEqual(SerializedJson.dumps({'a': [1]}).json, '{"a": [1]}')
+        value = A()
+        self.assertEqual(SerializedJson.dumps(value).json, json.dumps(str(value)))
+
 
 class SseStreamTestBase(object):
 
@@ -220,6 +249,184 @@ class TestRedisSseStream(TestCase, SseStreamTestBase):
         self.cache.clear()
 
 
+class TestMemorySseStream(TestCase, SseStreamTestBase):
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+        if not os.path.exists(walkoff.config.Config.CACHE_PATH):
+            os.mkdir(walkoff.config.Config.CACHE_PATH)
+        patch_all()
+
+    def setUp(self):
+        self.cache = MemoryCacheAdapter(directory=walkoff.config.Config.CACHE_PATH, buffer_size=5)
+        self.channel = 'channel1'
+        self.stream = SseStream(self.channel, self.cache)
+
+    def tearDown(self):
+        self.cache.clear()
+        self.cache.shutdown()
+
+    def test_send_resumes_from_last_event_id(self):
+        for i in range(1, 4):
+            self.stream.publish({'a': i}, event='event1')
+
+        result = []
+
+        def listen():
+            for event in self.stream.send(last_event_id=1):
+                result.append(event)
+
+        thread = gevent.spawn(listen)
+        thread.start()
+        gevent.sleep(0)
+        self.stream.publish({'a': 4}, event='event1')
+        self.stream.unsubscribe()
+        thread.join(timeout=2)
+        self.assertListEqual(result, [SseEvent('event1', {'a': i}).format(i) for i in range(2, 5)])
+
+    def test_get_last_event_id(self):
+        app = Flask(__name__)
+        self.assertIsNone(get_last_event_id())
+        with app.test_request_context(headers={'Last-Event-ID': '12'}):
+            self.assertEqual(get_last_event_id(), 12)
+        with app.test_request_context(headers={'Last-Event-ID': 'abc'}):
+            self.assertIsNone(get_last_event_id())
+        with app.test_request_context():
+            self.assertIsNone(get_last_event_id())
+
+
+    def publish_to_slow_client(self, count):
+        result = []
+
+        def listen():
+            for event in self.stream.send():
+                result.append(event)
+                gevent.sleep(0.01)
+
+        thread = gevent.spawn(listen)
+        thread.start()
+        gevent.sleep(0)
+        for i in range(1, count + 1):
+            self.stream.publish({'a': i}, event='event{}'.format(i % 2))
+        self.stream.unsubscribe()
+        thread.join(timeout=2)
+        return result
+
+    def test_send_slow_client_drop_oldest(self):
+        self.stream.max_queue_size = 2
+        result = self.publish_to_slow_client(6)
+        self.assertListEqual(result, [SseEvent('event{}'.format(i % 2), {'a': i}).format(i) for i in (5, 6)])
+        self.assertEqual(self.stream.stats['dropped'], 4)
+        self.assertEqual(self.stream.stats['subscribers'], 0)
+
+    def test_send_slow_client_coalesce(self):
+        self.stream.max_queue_size = 3
+        self.stream.overflow_policy = 'coalesce'
+        result = self.publish_to_slow_client(6)
+        self.assertListEqual(result, [SseEvent('event{}'.format(i % 2), {'a': i}).format(i) for i in (3, 5, 6)])
+        self.assertEqual(self.stream.stats['coalesced'], 3)
+
+    def test_send_slow_client_disconnect(self):
+        self.stream.max_queue_size = 2
+        self.stream.overflow_policy = 'disconnect'
+        result = self.publish_to_slow_client(6)
+        self.assertListEqual(result, [])
+        self.assertEqual(self.stream.stats['disconnected'], 1)
+        self.assertNotIn(self.channel, self.cache.pubsub_cache._subscribers)
+
+
+class TestSubscriberQueue(TestCase):
+    def test_put(self):
+        queue = SubscriberQueue(3)
+        self.assertTrue(queue.put(1, 'a'))
+        queue.put(None, 'b')
+        queue.close()
+        self.assertListEqual(list(queue), [(1, 'a'), (None, 'b')])
+        self.assertFalse(queue.put(2, 'c'))
+
+    def test_drop_oldest(self):
+        queue = SubscriberQueue(2)
+        for i in range(4):
+            queue.put(i, str(i))
+        queue.close()
+        self.assertListEqual(list(queue), [(2, '2'), (3, '3')])
+
+    def test_coalesce(self):
+        queue = SubscriberQueue(2, overflow_policy='coalesce')
+        queue.put(1, 'event: a\ndata: 1\n\n')
+        queue.put(2, 'event: b\ndata: 2\n\n')
+        queue.put(3, 'event: a\ndata: 3\n\n')
+        queue.put(4, 'data: 4\n\n')
+        queue.close()
+        self.assertListEqual([event_id for event_id, _ in queue], [3, 4])
+
+    def test_coalesce_by_fields(self):
+        queue = SubscriberQueue(2, overflow_policy='coalesce', coalesce_key=get_event_and_fields('execution_id'))
+        queue.put(1, 'event: a\ndata: {"execution_id": "x"}\n\n')
+        queue.put(2, 'event: a\ndata: {"execution_id": "y"}\n\n')
+        queue.put(3, 'event: a\ndata: {"execution_id": "x"}\n\n')
+        queue.put(4, 'event: a\ndata: {"execution_id": "z"}\n\n')
+        queue.close()
+        self.assertListEqual([event_id for event_id, _ in queue], [3, 4])
+
+    def test_disconnect(self):
+        queue = SubscriberQueue(1, overflow_policy='disconnect')
+        queue.put(1, 'a')
+        self.assertFalse(queue.put(2, 'b'))
+        self.assertTrue(queue.disconnected)
+        self.assertListEqual(list(queue), [])
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            SubscriberQueue(1, overflow_policy='invalid')
+
+    def test_fill(self):
+        queue = SubscriberQueue(5)
+        queue.fill([1, b'event: a\n\n', 'data: 1\n\n'])
+        self.assertListEqual(list(queue), [(None, 'event: a\n\n'), (None, 'data: 1\n\n')])
+
+    def test_get_event_name(self):
+        self.assertEqual(get_event_name('event: a\ndata: 1\n\n'), 'a')
+
+    def test_get_event_and_fields(self):
+        get_key = get_event_and_fields('execution_id', 'action_id')
+        self.assertEqual(get_key('event: a\ndata: {"execution_id": "x", "action_id": 1}\n\n'), ('a', 'x', 1))
+        self.assertEqual(get_key('event: a\ndata: {"execution_id": "x"}\n\n'), ('a', 'x', None))
+        self.assertIsNone(get_key('data: {"execution_id": "x"}\n\n'))
+        self.assertIsNone(get_key('event: a\ndata: 1\n\n'))
+        self.assertIsNone(get_key('event: a\n\n'))
+        self.assertIsNone(get_event_name('data: 1\n\n'))
+
+
+class TestStreamLimiter(TestCase):
+    def test_acquire_release(self):
+        limiter = StreamLimiter()
+        self.assertTrue(limiter.acquire('user', 2))
+        self.assertTrue(limiter.acquire('user', 2))
+        self.assertFalse(limiter.acquire('user', 2))
+        self.assertTrue(limiter.acquire('other', 2))
+        limiter.release('user')
+        self.assertEqual(limiter.count('user'), 1)
+        self.assertTrue(limiter.acquire('user', 2))
+
+    def test_no_limit(self):
+        limiter = StreamLimiter()
+        for _ in range(5):
+            self.assertTrue(limiter.acquire('user', 0))
+
+    @patch('walkoff.sse.get_stream_user', return_value='user')
+    def test_stream_rejected(self, _):
+        stream = SseStream('limited', MockRedisCacheAdapter())
+        stream.max_streams_per_user = 1
+        response = stream.stream()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(stream.stream().status_code, 429)
+        self.assertEqual(stream.stats['rejected'], 1)
+        response.close()
+        self.assertEqual(stream_limiter.count('user'), 0)
+        stream.stream().close()
+
+
 class TestInterfaceSseStream(TestCase):
 
     def test_create_interface_channel_name(self):
@@ -0,0 +1,70 @@
+import os
+import sys
+import unittest
+
+from walkoff.startupprofiler import ImportTimer, StartupProfiler, _resolve_name
+
+report_path = os.path.join('.', 'tests', 'tmp', 'startup_profile.txt')
+
+
+class TestStartupProfiler(unittest.TestCase):
+    def setUp(self):
+        sys.modules.pop('colorsys', None)
+
+    def tearDown(self):
+        if os.path.exists(report_path):
+            os.remove(report_path)
+
+    def test_resolve_name(self):
+        self.assertEqual(_resolve_name('json', None, 0), 'json')
+        self.assertEqual(_resolve_name('worker', {'__package__': 'walkoff.multiprocessedexecutor'}, 1),
+                         'walkoff.multiprocessedexecutor.worker')
+        self.assertEqual(_resolve_name('config', {'__package__': 'walkoff.multiprocessedexecutor'}, 2),
+                         'walkoff.config')
+        self.assertEqual(_resolve_name('', {'__package__': 'walkoff.case'}, 1), 'walkoff.case')
+
+    def test_import_timer(self):
+        timer = ImportTimer()
+        timer.install()
+        try:
+            import colorsys
+            import json
+        finally:
+            timer.uninstall()
+        self.assertIn('colorsys', timer.modules)
+        self.assertNotIn('json', timer.modules)
+        cumulative, self_time = timer.modules['colorsys']
+        self.assertGreaterEqual(cumulative, self_time)
+        self.assertEqual(timer.sorted_modules()[0][1], max(module[0] for module in timer.modules.values()))
+
+    def test_uninstall_restores_import(self):
+        try:
+            import builtins
+        except ImportError:
+            import __builtin__ as builtins
+        original = builtins.__import__
+        timer = ImportTimer()
+        timer.install()
+        self.assertNotEqual(builtins.__import__, original)
+        timer.uninstall()
+        self.assertEqual(builtins.__import__, original)
+
+    def test_write_report(self):
+        profiler = StartupProfiler(enabled=True)
+        with profiler.phase('fast'):
+            pass
+        with profiler.phase('slow'):
+            import colorsys
+        profiler.phases = [('fast', 0.1), ('slow', 0.5)]
+        profiler.write_report(report_path)
+        with open(report_path) as report_file:
+            report = report_file.read()
+        self.assertLess(report.index('slow'), report.index('fast'))
+        self.assertIn('colorsys', report)
+
+    def test_write_report_disabled(self):
+        profiler = StartupProfiler()
+        with profiler.phase('phase'):
+            pass
+        profiler.write_report(report_path)
+        self.assertFalse(os.path.exists(report_path))
@@ -0,0 +1,73 @@
+import os
+import unittest
+import uuid
+
+from sqlalchemy import create_engine, inspect
+
+from walkoff.executiondb import Execution_Base, uses_binary_uuids
+from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus, StatusUUIDType
+from walkoff.helpers import format_db_path
+
+
+class TestStatusTables(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.abspath(os.path.join('.', 'tests', 'tmp', 'status_test.db'))
+        self.engine = create_engine(format_db_path('sqlite', self.path))
+
+    def tearDown(self):
+        self.engine.dispose()
+        StatusUUIDType.binary_storage = False
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def create_tables(self, binary):
+        StatusUUIDType.binary_storage = binary
+        Execution_Base.metadata.create_all(self.engine,
+                                           tables=[WorkflowStatus.__table__, ActionStatus.__table__])
+
+    def test_indexes_created(self):
+        self.create_tables(False)
+        inspector = inspect(self.engine)
+        workflow_indexes = {index['name']: index['column_names'] for index in inspector.get_indexes('workflow_status')}
+        self.assertEqual(workflow_indexes['ix_workflow_status_status_started_at'], ['status', 'started_at'])
+        self.assertEqual(workflow_indexes['ix_workflow_status_status_completed_at'], ['status', 'completed_at'])
+        self.assertEqual(workflow_indexes['ix_workflow_status_workflow_id_started_at'], ['workflow_id', 'started_at'])
+        action_indexes = {index['name']: index['column_names'] for index in inspector.get_indexes('action_status')}
+        self.assertEqual(action_indexes['ix_action_status_workflow_status_id_started_at'],
+                         ['_workflow_status_id', 'started_at'])
+
+    def test_uses_binary_uuids_new_database(self):
+        self.assertTrue(uses_binary_uuids(self.engine, True))
+        self.assertFalse(uses_binary_uuids(self.engine, False))
+
+    def test_uses_binary_uuids_existing_string_database(self):
+        self.create_tables(False)
+        self.assertFalse(uses_binary_uuids(self.engine, True))
+
+    def test_uses_binary_uuids_existing_binary_database(self):
+        self.create_tables(True)
+        self.assertTrue(uses_binary_uuids(self.engine, False))
+
+    def test_binary_uuid_storage(self):
+        self.create_tables(True)
+        execution_id = uuid.uuid4()
+        workflow_id = uuid.uuid4()
+        with self.engine.begin() as connection:
+            connection.execute(WorkflowStatus.__table__.insert(),
+                               {'execution_id': execution_id, 'workflow_id': workflow_id, 'name': 'workflow',
+                                'status': 'pending'})
+            stored = connection.execute('SELECT execution_id FROM workflow_status').scalar()
+            self.assertEqual(stored, execution_id.bytes)
+            row = connection.execute(WorkflowStatus.__table__.select().where(
+                WorkflowStatus.__table__.c.execution_id == execution_id)).first()
+        self.assertEqual(row['workflow_id'], workflow_id)
+
+    def test_string_uuid_storage(self):
+        self.create_tables(False)
+        execution_id = uuid.uuid4()
+        with self.engine.begin() as connection:
+            connection.execute(WorkflowStatus.__table__.insert(),
+                               {'execution_id': execution_id, 'workflow_id': uuid.uuid4(), 'name': 'workflow',
+                                'status': 'pending'})
+            self.assertEqual(connection.execute('SELECT execution_id FROM workflow_status').scalar(),
+                             execution_id.hex)
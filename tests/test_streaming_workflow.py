@@ -0,0 +1,102 @@
+import unittest
+from uuid import uuid4
+
+import walkoff.appgateway
+from tests.util import execution_db_help
+from tests.util import initialize_test_config
+from walkoff.appgateway.actionresult import StreamingActionResult
+from walkoff.appgateway.appinstancerepo import AppInstanceRepo
+from walkoff.events import WalkoffEvent
+from walkoff.executiondb.action import Action
+from walkoff.executiondb.argument import Argument
+from walkoff.executiondb.branch import Branch
+from walkoff.executiondb.condition import Condition
+from walkoff.executiondb.conditionalexpression import ConditionalExpression
+from walkoff.executiondb.workflow import Workflow
+
+
+class TestStreamingWorkflow(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+        execution_db_help.setup_dbs()
+
+    @classmethod
+    def tearDownClass(cls):
+        walkoff.appgateway.clear_cache()
+        execution_db_help.tear_down_execution_db()
+
+    def setUp(self):
+        self.events = []
+        WalkoffEvent.CommonWorkflowSignal.connect(self.record_event)
+        self.producer = Action('HelloWorld', 'Count Up', 'producer', id=uuid4(),
+                               arguments=[Argument('limit', value=4)])
+        self.consumer = Action('HelloWorld', 'Sum Stream', 'consumer', id=uuid4(),
+                               arguments=[Argument('numbers', reference=self.producer.id)])
+
+    def record_event(self, sender, **kwargs):
+        if isinstance(sender, Action):
+            self.events.append((sender.name, kwargs['event'], kwargs.get('data')))
+
+    def execute_workflow(self, actions, branches=None):
+        workflow = Workflow('streaming', self.producer.id, actions=actions, branches=branches)
+        workflow._instance_repo = AppInstanceRepo()
+        workflow.execute(uuid4())
+        return workflow
+
+    def get_event_index(self, name, event):
+        return next(i for i, (sender, event_, _) in enumerate(self.events) if (sender, event_) == (name, event))
+
+    def test_stream_consumed_by_next_action(self):
+        workflow = self.execute_workflow(
+            [self.producer, self.consumer],
+            branches=[Branch(source_id=self.producer.id, destination_id=self.consumer.id)])
+        self.assertEqual(workflow.get_accumulator()[self.producer.id], 3)
+        self.assertEqual(workflow.get_accumulator()[self.consumer.id], 6)
+        self.assertLess(self.get_event_index('consumer', WalkoffEvent.ActionStarted),
+                        self.get_event_index('producer', WalkoffEvent.ActionResultChunk))
+        self.assertLess(self.get_event_index('producer', WalkoffEvent.ActionExecutionSuccess),
+                        self.get_event_index('consumer', WalkoffEvent.ActionExecutionSuccess))
+
+    def test_stream_without_consumer(self):
+        workflow = self.execute_workflow([self.producer])
+        chunks = [data['result'] for _, event, data in self.events if event == WalkoffEvent.ActionResultChunk]
+        self.assertListEqual(chunks, [0, 1, 2, 3])
+        self.assertEqual(workflow.get_accumulator()[self.producer.id], 3)
+
+    def test_stream_with_conditional_branch_is_consumed_first(self):
+        condition = ConditionalExpression(
+            'and',
+            conditions=[Condition('HelloWorld', action_name='regMatch', arguments=[Argument('regex', value='3')])])
+        workflow = self.execute_workflow(
+            [self.producer, self.consumer],
+            branches=[Branch(source_id=self.producer.id, destination_id=self.consumer.id, condition=condition)])
+        self.assertLess(self.get_event_index('producer', WalkoffEvent.ActionExecutionSuccess),
+                        self.get_event_index('consumer', WalkoffEvent.ActionStarted))
+        self.assertEqual(workflow.get_accumulator()[self.producer.id], 3)
+
+    def fail_midway(self, limit):
+        def stream():
+            yield 1
+            yield 2
+            raise ValueError('stream failed')
+
+        return StreamingActionResult(stream())
+
+    def test_stream_failing_midway_fails_consumer(self):
+        self.producer._action_executable = self.fail_midway
+        workflow = self.execute_workflow(
+            [self.producer, self.consumer],
+            branches=[Branch(source_id=self.producer.id, destination_id=self.consumer.id)])
+        self.assertLess(self.get_event_index('producer', WalkoffEvent.ActionExecutionError),
+                        self.get_event_index('consumer', WalkoffEvent.ActionExecutionError))
+        self.assertNotIn(('consumer', WalkoffEvent.ActionExecutionSuccess),
+                         [(sender, event) for sender, event, _ in self.events])
+        self.assertIn('stream failed', workflow.get_accumulator()[self.consumer.id])
+
+    def test_stream_failing_midway_without_consumer(self):
+        self.producer._action_executable = self.fail_midway
+        workflow = self.execute_workflow([self.producer])
+        self.assertIn(('producer', WalkoffEvent.ActionExecutionError),
+                      [(sender, event) for sender, event, _ in self.events])
+        self.assertIn('stream failed', workflow.get_accumulator()[self.producer.id])
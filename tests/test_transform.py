@@ -1,9 +1,11 @@
 import unittest
 
+from mock import patch
+
 import walkoff.appgateway
 from tests.util import initialize_test_config
 from walkoff.executiondb.argument import Argument
-from walkoff.executiondb.transform import Transform
+from walkoff.executiondb.transform import Transform, TransformCache
 
 
 class TestTransform(unittest.TestCase):
@@ -92,3 +94,42 @@ class TestTransform(unittest.TestCase):
             Transform('HelloWorld', action_name='mod1_filter2', arguments=[Argument('arg1', value='10.3')]).execute(
                 'invalid', {}),
             'invalid')
+
+    def test_cache_key_same_for_identical_transforms(self):
+        transform1 = Transform('HelloWorld', action_name='mod1_filter2', arguments=[Argument('arg1', value='10.3')])
+        transform2 = Transform('HelloWorld', action_name='mod1_filter2', arguments=[Argument('arg1', value='10.3')])
+        self.assertEqual(transform1.get_cache_key(), transform2.get_cache_key())
+
+    def test_cache_key_different_for_different_arguments(self):
+        transform1 = Transform('HelloWorld', action_name='mod1_filter2', arguments=[Argument('arg1', value='10.3')])
+        transform2 = Transform('HelloWorld', action_name='mod1_filter2', arguments=[Argument('arg1', value='10.4')])
+        self.assertNotEqual(transform1.get_cache_key(), transform2.get_cache_key())
+
+    def test_transform_cache_executes_identical_transforms_once(self):
+        cache = TransformCache()
+        data = {'a': [1, 2, 3]}
+        transform1 = Transform('HelloWorld', action_name='select json', arguments=[Argument('element', value='a')])
+        transform2 = Transform('HelloWorld', action_name='select json', arguments=[Argument('element', value='a')])
+        with patch.object(Transform, 'execute', side_effect=lambda data_in, acc: data_in['a']) as mock_execute:
+            self.assertListEqual(cache.execute(transform1, data, {}), [1, 2, 3])
+            self.assertListEqual(cache.execute(transform2, data, {}), [1, 2, 3])
+        self.assertEqual(mock_execute.call_count, 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_transform_cache_pipeline(self):
+        cache = TransformCache()
+        data = 5.4
+        for _ in range(2):
+            result = data
+            for transform in (Transform('HelloWorld', 'mod1_filter2', arguments=[Argument('arg1', value='10.3')]),
+                              Transform('HelloWorld', 'Top Transform')):
+                result = cache.execute(transform, result, {})
+            self.assertAlmostEqual(result, 15.7)
+        self.assertEqual(len(cache), 2)
+
+    def test_transform_cache_different_inputs(self):
+        cache = TransformCache()
+        transform = Transform('HelloWorld', 'length')
+        self.assertEqual(cache.execute(transform, 'ab', {}), 2)
+        self.assertEqual(cache.execute(transform, 'abc', {}), 3)
+        self.assertEqual(len(cache), 2)
@@ -0,0 +1,64 @@
+import os
+import shutil
+import unittest
+
+from mock import patch
+
+from tests.util import initialize_test_config
+from walkoff.multiprocessedexecutor.worker import WorkerKeys
+from walkoff.multiprocessedexecutor.workerlauncher import WorkerLauncher
+
+output_directory = os.path.join('.', 'tests', 'tmp', 'launcher')
+
+
+class MockWorker(object):
+    def __init__(self, id_, config_path, keys=None):
+        path = os.path.join(output_directory, str(id_))
+        with open(path, 'a') as output:
+            output.write('{}\n'.format(keys.server_public))
+        with open(path) as output:
+            runs = len(output.readlines())
+        if id_ == 1 and runs < 3:
+            raise ValueError
+
+
+class TestWorkerLauncher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        initialize_test_config()
+
+    def setUp(self):
+        os.makedirs(output_directory)
+        self.keys = WorkerKeys('server_public', 'server_secret', 'client_public', 'client_secret')
+        self.launcher = WorkerLauncher(2, None, worker=MockWorker)
+        self.launcher.min_worker_lifetime = 0.01
+        self.launcher.poll_interval = 0.01
+
+    def tearDown(self):
+        shutil.rmtree(output_directory)
+
+    def read_output(self, id_):
+        with open(os.path.join(output_directory, str(id_))) as output:
+            return output.read().splitlines()
+
+    def test_warm_up(self):
+        with patch('walkoff.multiprocessedexecutor.workerlauncher.load_worker_keys', return_value=self.keys):
+            self.launcher.warm_up()
+        self.assertEqual(self.launcher.keys, self.keys)
+
+    def test_fork_worker(self):
+        self.launcher.keys = self.keys
+        pid = self.launcher.fork_worker(0)
+        self.assertEqual(self.launcher.workers[pid][0], 0)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(status, 0)
+        self.assertListEqual(self.read_output(0), ['server_public'])
+
+    def test_supervise_respawns_crashed_workers(self):
+        self.launcher.keys = self.keys
+        for id_ in range(2):
+            self.launcher.fork_worker(id_)
+        self.launcher.supervise()
+        self.assertListEqual(self.read_output(0), ['server_public'])
+        self.assertListEqual(self.read_output(1), ['server_public'] * 3)
+        self.assertDictEqual(self.launcher.workers, {})
@@ -2,6 +2,9 @@ import json
 from copy import deepcopy
 from uuid import uuid4
 
+from unittest import TestCase
+
+import gevent
 from flask import Response
 from mock import patch
 
@@ -10,6 +13,7 @@ from tests.util.servertestcase import ServerTestCase
 from walkoff.executiondb.workflowresults import ActionStatus
 from walkoff.server.blueprints.workflowresults import *
 from walkoff.server.returncodes import SUCCESS
+from walkoff.sse import SerializedJson, SnapshotSseStream
 
 
 class TestWorkflowResultsStream(ServerTestCase):
@@ -77,7 +81,7 @@ class TestWorkflowResultsStream(ServerTestCase):
         expected['action_id'] = expected.pop('id')
         expected['workflow_execution_id'] = workflow_id
         expected['status'] = status.name
-        expected['result'] = 'some result'
+        expected['result'] = SerializedJson('"some result"')
         self.assert_and_strip_timestamp(result)
         self.assertDictEqual(result, expected)
 
@@ -98,6 +102,14 @@ class TestWorkflowResultsStream(ServerTestCase):
         self.assert_and_strip_timestamp(result)
         self.assertDictEqual(result, expected)
 
+    def test_format_action_data_with_long_json_results(self):
+        size_limit = 1
+        self.app.config['MAX_STREAM_RESULTS_SIZE_KB'] = size_limit
+        kwargs = {'data': {'workflow': {'execution_id': str(uuid4())},
+                           'data': {'result': {'a': 'x'*1024}}}}
+        result = format_action_data_with_results(self.get_sample_action_sender(), kwargs, ActionStatusEnum.executing)
+        self.assertEqual(result['result'], {'truncated': json.dumps({'a': 'x'*1024})[:1024]})
+
     def check_action_callback(self, callback, status, event, mock_publish, mock_summary, with_result=False):
         sender = self.get_sample_action_sender()
         kwargs = self.get_action_kwargs(with_result=with_result)
@@ -167,6 +179,22 @@ class TestWorkflowResultsStream(ServerTestCase):
             mock_summary
         )
 
+    @patch.object(action_summary_stream, 'publish')
+    @patch.object(action_stream, 'publish')
+    def test_action_result_chunk_callback(self, mock_publish, mock_summary):
+        sender = self.get_sample_action_sender()
+        kwargs = self.get_action_kwargs(with_result=True)
+        kwargs['data']['index'] = 3
+        expected = format_action_data_with_results(deepcopy(sender), {'data': kwargs}, ActionStatusEnum.executing)
+        expected['index'] = 3
+        expected.pop('timestamp')
+        action_result_chunk_callback(sender, data=kwargs)
+        mock_publish.assert_called_once()
+        mock_publish.call_args[0][0].pop('timestamp')
+        mock_publish.assert_called_with(
+            expected, event='chunk', subchannels=(kwargs['workflow']['execution_id'], 'all'))
+        mock_summary.assert_not_called()
+
     @staticmethod
     def get_workflow_sender(execution_id=None):
         execution_id = execution_id or str(uuid4())
@@ -390,6 +418,26 @@ class TestWorkflowResultsStream(ServerTestCase):
     def test_workflow_stream_endpoint_with_invalid_execution_id(self, mock_stream):
         self.check_stream_endpoint('workflow_status', mock_stream, execution_id='invalid')
 
+    def get_snapshot_stream_response(self, mock_stream, query):
+        mock_stream.return_value = Response('something', status=SUCCESS)
+        post = self.test_client.post('/api/auth', content_type="application/json",
+                                     data=json.dumps(dict(username='admin', password='admin')), follow_redirects=True)
+        key = json.loads(post.get_data(as_text=True))['access_token']
+        return self.test_client.get('/api/streams/workflowqueue/actions?access_token={}&{}'.format(key, query))
+
+    @patch.object(action_snapshot_stream, 'stream')
+    def test_action_stream_endpoint_with_snapshot(self, mock_stream):
+        response = self.get_snapshot_stream_response(mock_stream, 'snapshot=true&interval=2.5')
+        mock_stream.assert_called_once_with(interval=2.5, workflow_execution_id='all')
+        self.assertEqual(response.status_code, SUCCESS)
+
+    @patch.object(action_snapshot_stream, 'stream')
+    def test_action_stream_endpoint_with_snapshot_invalid_interval(self, mock_stream):
+        for interval in ('abc', '0', '1000'):
+            response = self.get_snapshot_stream_response(mock_stream, 'snapshot=true&interval={}'.format(interval))
+            self.assertEqual(response.status_code, BAD_REQUEST)
+        mock_stream.assert_not_called()
+
     @patch.object(action_stream, 'stream')
     def test_action_stream_endpoint_invalid_key(self, mock_stream):
         self.check_stream_endpoint_no_key('actions', mock_stream)
@@ -399,3 +447,74 @@ class TestWorkflowResultsStream(ServerTestCase):
         self.check_stream_endpoint_no_key('workflow_status', mock_stream)
 
 
+class TestActionSnapshots(TestCase):
+    def setUp(self):
+        self.snapshots = ActionSnapshots(max_executions=2)
+
+    @staticmethod
+    def make_action_data(execution_id, name, status, result=None):
+        data = {'action_name': 'action', 'app_name': 'HelloWorld', 'action_id': name, 'name': name,
+                'timestamp': 'now', 'workflow_execution_id': execution_id, 'status': status.name}
+        if result is not None:
+            data['result'] = result
+        return data
+
+    def test_snapshot(self):
+        self.snapshots.update(self.make_action_data('a', 'action1', ActionStatusEnum.executing))
+        self.snapshots.update(self.make_action_data('a', 'action1', ActionStatusEnum.failure, SerializedJson('[1]')))
+        version, data = self.snapshots.snapshot(0)
+        self.assertEqual(version, 2)
+        execution, = data['executions']
+        self.assertEqual(execution['workflow_execution_id'], 'a')
+        self.assertEqual(execution['current_action']['status'], 'failure')
+        self.assertEqual(execution['counts']['executing'], 1)
+        self.assertEqual(execution['counts']['failure'], 1)
+        self.assertEqual(execution['last_error']['result'], [1])
+        self.assertFalse(execution['completed'])
+        self.assertEqual(self.snapshots.snapshot(version), (2, None))
+
+    def test_snapshot_only_changed(self):
+        self.snapshots.update(self.make_action_data('a', 'action1', ActionStatusEnum.executing))
+        self.snapshots.update(self.make_action_data('b', 'action1', ActionStatusEnum.executing))
+        version, _ = self.snapshots.snapshot(0)
+        self.snapshots.update(self.make_action_data('a', 'action2', ActionStatusEnum.success))
+        self.snapshots.complete('a')
+        version, data = self.snapshots.snapshot(version)
+        self.assertEqual(version, 4)
+        execution, = data['executions']
+        self.assertEqual(execution['current_action']['name'], 'action2')
+        self.assertTrue(execution['completed'])
+
+    def test_snapshot_one_execution(self):
+        self.snapshots.update(self.make_action_data('a', 'action1', ActionStatusEnum.executing))
+        self.snapshots.update(self.make_action_data('b', 'action1', ActionStatusEnum.executing))
+        _, data = self.snapshots.snapshot(0, workflow_execution_id='b')
+        self.assertListEqual([execution['workflow_execution_id'] for execution in data['executions']], ['b'])
+        self.assertEqual(self.snapshots.snapshot(0, workflow_execution_id='c'), (2, None))
+
+    def test_least_recently_updated_execution_dropped(self):
+        for execution_id in ('a', 'b', 'a', 'c'):
+            self.snapshots.update(self.make_action_data(execution_id, 'action1', ActionStatusEnum.executing))
+        _, data = self.snapshots.snapshot(0)
+        self.assertListEqual([execution['workflow_execution_id'] for execution in data['executions']], ['a', 'c'])
+
+    def test_snapshot_stream(self):
+        stream = SnapshotSseStream('snapshots', self.snapshots.snapshot)
+        self.snapshots.update(self.make_action_data('a', 'action1', ActionStatusEnum.executing))
+        result = []
+
+        def listen():
+            for event in stream.send(interval=0.01, workflow_execution_id='all'):
+                result.append(event)
+
+        thread = gevent.spawn(listen)
+        gevent.sleep(0.05)
+        self.snapshots.update(self.make_action_data('b', 'action1', ActionStatusEnum.executing))
+        gevent.sleep(0.05)
+        stream.unsubscribe()
+        thread.join(timeout=1)
+        self.assertEqual(len(result), 2)
+        self.assertTrue(result[0].startswith('id: 1\nevent: snapshot\n'))
+        self.assertIn('"workflow_execution_id": "b"', result[1])
+        self.assertNotIn('"workflow_execution_id": "a"', result[1])
+        self.assertEqual(stream.stats['subscribers'], 0)
@@ -1,14 +1,18 @@
 import json
+from datetime import datetime, timedelta
 from uuid import uuid4, UUID
 
 from flask import current_app
+from mock import patch
 
 import walkoff.case.database as case_database
 import walkoff.executiondb.schemas
+import walkoff.server.endpoints.workflowqueue
 from tests.util import execution_db_help
 from tests.util.case_db_help import setup_subscriptions_for_action
 from tests.util.servertestcase import ServerTestCase
 from walkoff.events import WalkoffEvent
+from walkoff.helpers import encode_cursor
 from walkoff.executiondb import WorkflowStatusEnum, ActionStatusEnum
 from walkoff.executiondb.executionelement import ExecutionElement
 from walkoff.executiondb.workflow import Workflow
@@ -363,3 +367,147 @@ class TestWorkflowStatus(ServerTestCase):
 
         response = self.get_with_status_check('/api/workflowqueue?page=3', headers=self.headers)
         self.assertEqual(len(response), 0)
+
+    def add_workflow_statuses(self, statuses, workflow_id=None, name='test', start=None):
+        start = start or datetime(2018, 5, 1)
+        workflow_statuses = []
+        for i, status in enumerate(statuses):
+            workflow_status = WorkflowStatus(uuid4(), workflow_id or uuid4(), name)
+            workflow_status.status = status
+            if status != WorkflowStatusEnum.pending:
+                workflow_status.started_at = start + timedelta(minutes=i)
+            if status in (WorkflowStatusEnum.completed, WorkflowStatusEnum.aborted):
+                workflow_status.completed_at = start + timedelta(minutes=i + 1)
+            workflow_statuses.append(workflow_status)
+        self.app.running_context.execution_db.session.add_all(workflow_statuses)
+        self.app.running_context.execution_db.session.commit()
+        return [str(workflow_status.execution_id) for workflow_status in workflow_statuses]
+
+    def read_all_pages(self, url, limit):
+        separator = '&' if '?' in url else '?'
+        execution_ids = []
+        cursor = ''
+        while True:
+            response = self.test_client.get('{0}{1}limit={2}&cursor={3}'.format(url, separator, limit, cursor),
+                                            headers=self.headers)
+            self.assertEqual(response.status_code, SUCCESS)
+            page = json.loads(response.get_data(as_text=True))
+            self.assertLessEqual(len(page), limit)
+            execution_ids.extend(workflow_status['execution_id'] for workflow_status in page)
+            cursor = response.headers.get('X-Next-Cursor')
+            if not cursor:
+                return execution_ids
+
+    def test_workflowqueue_cursor_pagination(self):
+        statuses = [WorkflowStatusEnum.running, WorkflowStatusEnum.completed, WorkflowStatusEnum.pending,
+                    WorkflowStatusEnum.aborted, WorkflowStatusEnum.awaiting_data] * 5
+        execution_ids = self.add_workflow_statuses(statuses)
+        expected = [execution_id for _, started_at, execution_id in
+                    sorted(zip(statuses, range(len(statuses)), execution_ids),
+                           key=lambda status: (status[0].name, -status[1]))]
+        pending = [execution_id for status, execution_id in zip(statuses, execution_ids)
+                   if status == WorkflowStatusEnum.pending]
+        for limit in (1, 3, 7, 25, 30):
+            response = self.read_all_pages('/api/workflowqueue', limit)
+            self.assertEqual(len(response), len(execution_ids))
+            self.assertListEqual([execution_id for execution_id in response if execution_id not in pending],
+                                 [execution_id for execution_id in expected if execution_id not in pending])
+            self.assertSetEqual(set(response), set(execution_ids))
+
+    def test_workflowqueue_limit_too_large(self):
+        response = self.test_client.get('/api/workflowqueue?limit=1001', headers=self.headers)
+        self.assertEqual(response.status_code, BAD_REQUEST)
+
+    def test_workflowqueue_limit_clamped(self):
+        self.add_workflow_statuses([WorkflowStatusEnum.running] * 5)
+        with patch.object(walkoff.server.endpoints.workflowqueue, 'max_workflow_status_limit', 2):
+            response = self.test_client.get('/api/workflowqueue?limit=5', headers=self.headers)
+        self.assertEqual(response.status_code, SUCCESS)
+        self.assertEqual(len(json.loads(response.get_data(as_text=True))), 2)
+        self.assertIn('X-Next-Cursor', response.headers)
+
+    def test_workflowqueue_cursor_pagination_same_start(self):
+        execution_ids = self.add_workflow_statuses([WorkflowStatusEnum.running] * 5)
+        workflow_statuses = self.app.running_context.execution_db.session.query(WorkflowStatus).all()
+        for workflow_status in workflow_statuses:
+            workflow_status.started_at = datetime(2018, 5, 1)
+        self.app.running_context.execution_db.session.commit()
+        self.assertSetEqual(set(self.read_all_pages('/api/workflowqueue', 2)), set(execution_ids))
+
+    def test_workflowqueue_cursor_last_page(self):
+        self.add_workflow_statuses([WorkflowStatusEnum.running] * 3)
+        response = self.test_client.get('/api/workflowqueue', headers=self.headers)
+        self.assertEqual(len(json.loads(response.get_data(as_text=True))), 3)
+        self.assertNotIn('X-Next-Cursor', response.headers)
+
+    def test_workflowqueue_invalid_cursor(self):
+        self.get_with_status_check('/api/workflowqueue?cursor=invalid', headers=self.headers, error=True,
+                                   status_code=BAD_REQUEST)
+
+    def test_workflowqueue_invalid_cursor_execution_id(self):
+        cursor = encode_cursor({'status': 'completed', 'started_at': None, 'execution_id': 1})
+        self.get_with_status_check('/api/workflowqueue?cursor={}'.format(cursor), headers=self.headers, error=True,
+                                   status_code=BAD_REQUEST)
+
+    def test_workflowqueue_filter_status(self):
+        running = self.add_workflow_statuses([WorkflowStatusEnum.running] * 3)
+        completed = self.add_workflow_statuses([WorkflowStatusEnum.completed] * 2)
+        self.add_workflow_statuses([WorkflowStatusEnum.paused] * 2)
+        response = self.read_all_pages('/api/workflowqueue?status=running,completed', 2)
+        self.assertListEqual(response, completed[::-1] + running[::-1])
+        response = self.get_with_status_check('/api/workflowqueue?page=1&status=completed', headers=self.headers)
+        self.assertSetEqual({workflow_status['execution_id'] for workflow_status in response}, set(completed))
+
+    def test_workflowqueue_filter_unknown_status(self):
+        self.get_with_status_check('/api/workflowqueue?status=done', headers=self.headers, error=True,
+                                   status_code=BAD_REQUEST)
+
+    def test_workflowqueue_filter_workflow_id(self):
+        workflow_id = uuid4()
+        expected = self.add_workflow_statuses([WorkflowStatusEnum.running] * 2, workflow_id=workflow_id)
+        self.add_workflow_statuses([WorkflowStatusEnum.running] * 2)
+        response = self.read_all_pages('/api/workflowqueue?workflow_id={}'.format(workflow_id), 5)
+        self.assertSetEqual(set(response), set(expected))
+
+    def test_workflowqueue_filter_playbook_id(self):
+        playbook = execution_db_help.standard_load()
+        workflow_id = playbook.workflows[0].id
+        expected = self.add_workflow_statuses([WorkflowStatusEnum.completed] * 2, workflow_id=workflow_id)
+        self.add_workflow_statuses([WorkflowStatusEnum.completed] * 2)
+        response = self.read_all_pages('/api/workflowqueue?playbook_id={}'.format(playbook.id), 5)
+        self.assertSetEqual(set(response), set(expected))
+        response = self.read_all_pages('/api/workflowqueue?playbook_id={}'.format(uuid4()), 5)
+        self.assertListEqual(response, [])
+
+    def test_workflowqueue_filter_name_prefix(self):
+        expected = self.add_workflow_statuses([WorkflowStatusEnum.running] * 2, name='100%_done')
+        self.add_workflow_statuses([WorkflowStatusEnum.running] * 2, name='100 done')
+        response = self.read_all_pages('/api/workflowqueue?name=100%25_', 5)
+        self.assertSetEqual(set(response), set(expected))
+
+    def test_workflowqueue_filter_time_range(self):
+        execution_ids = self.add_workflow_statuses([WorkflowStatusEnum.completed] * 10)
+        response = self.read_all_pages(
+            '/api/workflowqueue?started_after=2018-05-01T00:02:00Z&started_before=2018-05-01T00:05:00.000000Z', 5)
+        self.assertListEqual(response, execution_ids[2:5][::-1])
+        response = self.read_all_pages('/api/workflowqueue?completed_after=2018-05-01T00:08:00Z', 5)
+        self.assertListEqual(response, execution_ids[7:][::-1])
+        response = self.read_all_pages('/api/workflowqueue?started_after=2018-05-02', 5)
+        self.assertListEqual(response, [])
+
+    def test_workflowqueue_filter_invalid_time(self):
+        self.get_with_status_check('/api/workflowqueue?started_after=yesterday', headers=self.headers, error=True,
+                                   status_code=BAD_REQUEST)
+
+    def test_workflowqueue_count(self):
+        workflow_id = uuid4()
+        self.add_workflow_statuses([WorkflowStatusEnum.running] * 3, workflow_id=workflow_id)
+        self.add_workflow_statuses([WorkflowStatusEnum.completed] * 2, workflow_id=workflow_id)
+        self.add_workflow_statuses([WorkflowStatusEnum.completed] * 4)
+        response = self.get_with_status_check('/api/workflowqueue?count=true', headers=self.headers)
+        self.assertDictEqual(response, {'count': 9})
+        response = self.get_with_status_check('/api/workflowqueue?count=true&status=completed', headers=self.headers)
+        self.assertDictEqual(response, {'count': 6})
+        response = self.get_with_status_check(
+            '/api/workflowqueue?count=true&status=completed&workflow_id={}'.format(workflow_id), headers=self.headers)
+        self.assertDictEqual(response, {'count': 2})
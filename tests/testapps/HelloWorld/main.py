@@ -45,6 +45,17 @@ def json_sample(json_in):
             sum([x['b'] for x in json_in['d']]))
 
 
+@action
+def count_up(limit):
+    for number in range(limit):
+        yield number
+
+
+@action
+def sum_stream(numbers):
+    return sum(numbers)
+
+
 @action
 def dummy_action(status, other=False):
     if other:
@@ -20,7 +20,10 @@ from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
 
 
 def setup_dbs():
-    execution_db = ExecutionDatabase(walkoff.config.Config.EXECUTION_DB_TYPE, walkoff.config.Config.EXECUTION_DB_PATH)
+    execution_db = ExecutionDatabase(walkoff.config.Config.EXECUTION_DB_TYPE, walkoff.config.Config.EXECUTION_DB_PATH,
+                                     walkoff.config.Config.EXECUTION_DB_POOL,
+                                     walkoff.config.Config.EXECUTION_DB_SQLITE_PRAGMAS,
+                                     walkoff.config.Config.EXECUTION_DB_BINARY_UUIDS)
     case_db = CaseDatabase(walkoff.config.Config.CASE_DB_TYPE, walkoff.config.Config.CASE_DB_PATH)
 
     return execution_db, case_db
@@ -4,30 +4,43 @@ import os
 import sys
 import traceback
 
-from gevent import monkey
-from gevent import pywsgi
+from walkoff.startupprofiler import StartupProfiler
 
-import walkoff
-import walkoff.config
-from scripts.compose_api import compose_api
-from walkoff.multiprocessedexecutor.multiprocessedexecutor import spawn_worker_processes
-from walkoff.server.app import create_app
-from tests.util.jsonplaybookloader import JsonPlaybookLoader
-from walkoff.executiondb.playbook import Playbook
+# Started before the remaining imports so that they can be traced
+startup_profiler = StartupProfiler(enabled=any(arg.startswith('--profile-startup') for arg in sys.argv[1:]))
+
+with startup_profiler.phase('imports'):
+    from gevent import monkey
+    from gevent import pywsgi
+
+    import walkoff
+    import walkoff.config
+    from scripts.compose_api import compose_api
+    from walkoff.multiprocessedexecutor.multiprocessedexecutor import spawn_worker_processes
+    from walkoff.server.app import create_app
+    from tests.util.jsonplaybookloader import JsonPlaybookLoader
+    from walkoff.executiondb.importmanifest import PlaybookImportManifest
+    from walkoff.executiondb.playbook import Playbook
 
 logger = logging.getLogger('walkoff')
 
 
-def run(app, host, port):
+def run(app, host, port, profile_path=None):
     print_banner()
-    pids = spawn_worker_processes()
+    with startup_profiler.phase('spawn_worker_processes'):
+        pids = spawn_worker_processes()
     monkey.patch_all()
 
-    app.running_context.inject_app(app)
-    app.running_context.executor.initialize_threading(app, pids)
+    with startup_profiler.phase('initialize_threading'):
+        app.running_context.inject_app(app)
+        app.running_context.executor.initialize_threading(app, pids)
+        app.running_context.retention.start()
     # The order of these imports matter for initialization (should probably be fixed)
 
-    server = setup_server(app, host, port)
+    with startup_profiler.phase('setup_server'):
+        server = setup_server(app, host, port)
+    if profile_path is not None:
+        startup_profiler.write_report(profile_path)
     server.serve_forever()
 
 
@@ -61,6 +74,9 @@ def parse_args():
     parser.add_argument('-p', '--port', help='port to run the server on')
     parser.add_argument('-H', '--host', help='host address to run the server on')
     parser.add_argument('-c', '--config', help='configuration file to use')
+    parser.add_argument('--profile-startup', nargs='?', const='', metavar='PATH',
+                        help='record the time taken by each startup phase and import, and write a sorted report to '
+                             'PATH. Defaults to startup_profile.txt in the data directory')
     args = parser.parse_args()
     if args.version:
         print(walkoff.__version__)
@@ -80,28 +96,60 @@ def convert_host_port(args):
     return host, port
 
 
-def import_workflows(app):
-    playbook_name = [playbook.id for playbook in app.running_context.execution_db.session.query(Playbook).all()]
-    if os.path.exists(walkoff.config.Config.WORKFLOWS_PATH):
-        logger.info('Importing any workflows not currently in database')
-        for p in os.listdir(walkoff.config.Config.WORKFLOWS_PATH):
-            full_path = os.path.join(walkoff.config.Config.WORKFLOWS_PATH, p)
-            if os.path.isfile(full_path):
-                playbook = JsonPlaybookLoader.load_playbook(full_path)
-                if playbook.name not in playbook_name:
-                    app.running_context.execution_db.session.add(playbook)
-        app.running_context.execution_db.session.commit()
+def get_profile_path(args):
+    if args.profile_startup is None:
+        return None
+    return args.profile_startup or os.path.join(walkoff.config.Config.DATA_PATH, 'startup_profile.txt')
 
 
+def import_workflows(app):
+    workflows_path = walkoff.config.Config.WORKFLOWS_PATH
+    if not os.path.exists(workflows_path):
+        return
+    session = app.running_context.execution_db.session
+    playbook_names = {name for name, in session.query(Playbook.name)}
+    manifest = PlaybookImportManifest(walkoff.config.Config.WORKFLOW_IMPORT_MANIFEST_PATH)
+    logger.info('Importing any workflows not currently in database')
+    imported = []
+    for file_name in sorted(os.listdir(workflows_path)):
+        full_path = os.path.join(workflows_path, file_name)
+        if not os.path.isfile(full_path):
+            continue
+        with open(full_path, 'rb') as playbook_file:
+            contents = playbook_file.read()
+        if manifest.is_imported(file_name, contents, playbook_names):
+            continue
+        playbook = JsonPlaybookLoader.load_playbook(full_path)
+        if playbook is None:
+            continue
+        if playbook.name not in playbook_names:
+            session.add(playbook)
+            playbook_names.add(playbook.name)
+            imported.append(playbook.name)
+        manifest.record(file_name, contents, playbook.name)
+    try:
+        session.commit()
+    except Exception:
+        session.rollback()
+        logger.exception('Could not import workflows')
+        return
+    if imported:
+        logger.info('Imported playbooks {}'.format(', '.join(imported)))
+    manifest.save()
+
 if __name__ == "__main__":
     args = parse_args()
     exit_code = 0
-    compose_api()
-    walkoff.config.initialize(args.config)
-    app = create_app(walkoff.config.Config)
-    import_workflows(app)
+    with startup_profiler.phase('compose_api'):
+        compose_api()
+    with startup_profiler.phase('initialize_config'):
+        walkoff.config.initialize(args.config)
+    with startup_profiler.phase('create_app'):
+        app = create_app(walkoff.config.Config)
+    with startup_profiler.phase('import_workflows'):
+        import_workflows(app)
     try:
-        run(app, *convert_host_port(args))
+        run(app, *convert_host_port(args), profile_path=get_profile_path(args))
     except KeyboardInterrupt:
         logger.info('Caught KeyboardInterrupt! Please wait a few seconds for WALKOFF to shutdown.')
     except Exception as e:
@@ -110,5 +158,7 @@ if __name__ == "__main__":
         exit_code = 1
     finally:
         app.running_context.executor.shutdown_pool()
+        if app.running_context.case_event_writer:
+            app.running_context.case_event_writer.stop()
         logger.info('Shutting down server')
         os._exit(exit_code)
@@ -114,13 +114,15 @@ def get_all_transforms_for_app(app_name):
     return _cache.get_app_transform_names(app_name)
 
 
-def cache_apps(path):
+def cache_apps(path, lazy=False, warm_up=None):
     """Cache apps from a given path into the global cache
 
     Args:
         path (str): Path to apps module
+        lazy (bool, optional): Only index the apps, and import each app on first use. Defaults to False.
+        warm_up (list[str], optional): The names of apps to import immediately if lazy is True. Defaults to None.
     """
-    _cache.cache_apps(path)
+    _cache.cache_apps(path, lazy=lazy, warm_up=warm_up)
 
 
 def clear_cache():
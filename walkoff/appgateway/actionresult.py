@@ -50,3 +50,29 @@ class ActionResult(object):
 
     def __eq__(self, other):
         return self.__dict__ == other.__dict__
+
+
+class StreamingActionResult(ActionResult):
+    def __init__(self, chunks):
+        """StreamingActionResult object, which wraps the partial results yielded by a generator action. The chunks are
+            not buffered. Once the stream has been consumed, the result and status are those of the last chunk.
+
+        Args:
+            chunks (iterable): The partial results of the action. Each chunk is either a result or a tuple of the
+                result and its status
+        """
+        super(StreamingActionResult, self).__init__(None, None)
+        self._chunks = iter(chunks)
+        self.is_consumed = False
+
+    def __iter__(self):
+        """Iterates through the chunks of the stream
+
+        Yields:
+            (ActionResult): The next partial result of the action
+        """
+        for chunk in self._chunks:
+            chunk = ActionResult(*chunk) if isinstance(chunk, tuple) else ActionResult(chunk, None)
+            self.result, self.status = chunk.result, chunk.status
+            yield chunk
+        self.is_consumed = True
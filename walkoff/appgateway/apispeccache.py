@@ -0,0 +1,124 @@
+import hashlib
+import json
+import logging
+import os
+
+from walkoff.helpers import write_json_atomically
+
+logger = logging.getLogger(__name__)
+
+
+def hash_contents(contents):
+    """Hashes the contents of a file
+
+    Args:
+        contents (bytes): The contents of the file
+
+    Returns:
+        (str): The hex digest of the contents
+    """
+    return hashlib.sha256(contents).hexdigest()
+
+
+def fingerprint_app_sources(app_path):
+    """Fingerprints the Python sources of an app. App API validation checks that the functions named in the API exist,
+        so a cached API is only valid while the app's code is unchanged.
+
+    Args:
+        app_path (str): The path to the app's package
+
+    Returns:
+        (str): A hash of the path, modification time, and size of every Python file in the app
+    """
+    sources = []
+    for root, _, files in os.walk(app_path):
+        for file_name in files:
+            if file_name.endswith('.py'):
+                stat = os.stat(os.path.join(root, file_name))
+                sources.append((os.path.relpath(os.path.join(root, file_name), app_path), stat.st_mtime, stat.st_size))
+    return hash_contents(json.dumps(sorted(sources)).encode('utf-8'))
+
+
+class AppApiSpecCache(object):
+    def __init__(self, path, schema_path):
+        """A cache of parsed and validated app APIs, stored on disk as JSON. Entries are keyed by the path of the
+            api.yaml file and are only used if its modification time, content hash, and app sources are unchanged.
+            The whole cache is discarded if the Walkoff app schema changes.
+
+        Args:
+            path (str): The path to the cache file
+            schema_path (str): The path to the Walkoff app schema used to validate the APIs
+        """
+        self.path = path
+        self._schema_hash = self.__hash_file(schema_path)
+        self._entries = {}
+        self._is_dirty = False
+        self.__load()
+
+    @staticmethod
+    def __hash_file(path):
+        try:
+            with open(path, 'rb') as file_:
+                return hash_contents(file_.read())
+        except (IOError, OSError):
+            return None
+
+    def __load(self):
+        try:
+            with open(self.path) as cache_file:
+                cache = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return
+        if isinstance(cache, dict) and cache.get('schema') == self._schema_hash:
+            self._entries = cache.get('apps', {})
+        else:
+            logger.info('App API schema has changed. Discarding cached app APIs')
+
+    @staticmethod
+    def __get_key(spec_path, contents, app_path):
+        return {'mtime': os.path.getmtime(spec_path),
+                'hash': hash_contents(contents),
+                'sources': fingerprint_app_sources(app_path)}
+
+    def get(self, spec_path, contents, app_path):
+        """Gets a cached app API
+
+        Args:
+            spec_path (str): The path to the api.yaml file
+            contents (bytes): The contents of the api.yaml file
+            app_path (str): The path to the app's package
+
+        Returns:
+            (dict): The parsed API, or None if it is not cached or the cached entry is stale
+        """
+        entry = self._entries.get(spec_path)
+        if entry is not None and entry['key'] == self.__get_key(spec_path, contents, app_path):
+            return entry['api']
+        return None
+
+    def set(self, spec_path, contents, app_path, api):
+        """Caches a validated app API
+
+        Args:
+            spec_path (str): The path to the api.yaml file
+            contents (bytes): The contents of the api.yaml file
+            app_path (str): The path to the app's package
+            api (dict): The parsed API
+        """
+        try:
+            json.dumps(api)
+        except (TypeError, ValueError):
+            logger.warning('App API {} cannot be cached because it is not JSON-serializable'.format(spec_path))
+            return
+        self._entries[spec_path] = {'key': self.__get_key(spec_path, contents, app_path), 'api': api}
+        self._is_dirty = True
+
+    def save(self):
+        """Writes the cache to disk if it has changed"""
+        if not self._is_dirty:
+            return
+        try:
+            write_json_atomically(self.path, {'schema': self._schema_hash, 'apps': self._entries})
+            self._is_dirty = False
+        except (IOError, OSError):
+            logger.warning('Could not write app API cache to {}'.format(self.path), exc_info=True)
@@ -1,6 +1,125 @@
+from collections import namedtuple
+
 import walkoff.config
 
 
+class AppActionApi(namedtuple('AppActionApi', ['app', 'action', 'run', 'parameters', 'default_return', 'returns',
+                                               'failure_returns'])):
+    """The metadata of an app action needed to execute it, precomputed from the app's API"""
+    __slots__ = ()
+
+    def is_failure(self, status):
+        """Checks whether a status code is a failure code for this action
+
+        Args:
+            status (str): Name of the status
+
+        Returns:
+            (bool): True if status is a failure code, false otherwise
+
+        Raises:
+            UnknownAppAction: If the status is not a return code of the action
+        """
+        if status not in self.returns:
+            raise UnknownAppAction(self.app, self.action)
+        return status in self.failure_returns
+
+
+AppFunctionApi = namedtuple('AppFunctionApi', ['data_in', 'run', 'parameters'])
+
+
+class AppApiRegistry(object):
+    def __init__(self, app_apis):
+        """A flat lookup table of the metadata of every action, condition, and transform in a set of app APIs. The
+            registry is never modified after it is built.
+
+        Args:
+            app_apis (dict): The app APIs, keyed by app name
+        """
+        self.source = app_apis
+        self.apps = frozenset(app_apis)
+        self.actions = {}
+        self.conditions = {}
+        self.transforms = {}
+        for app, app_api in app_apis.items():
+            for action, action_api in self.__iter_functions(app_api, 'actions'):
+                returns = action_api.get('returns', {})
+                self.actions[(app, action)] = AppActionApi(
+                    app=app,
+                    action=action,
+                    run=action_api['run'],
+                    parameters=action_api.get('parameters', []),
+                    default_return=action_api.get('default_return', 'Success'),
+                    returns=frozenset(returns),
+                    failure_returns=frozenset(
+                        status for status, return_api in returns.items() if return_api.get('failure') is True))
+            for function_type, lookup in (('conditions', self.conditions), ('transforms', self.transforms)):
+                for name, function_api in self.__iter_functions(app_api, function_type):
+                    lookup[(app, name)] = AppFunctionApi(
+                        function_api['data_in'], function_api['run'], function_api.get('parameters', []))
+
+    @staticmethod
+    def __iter_functions(app_api, function_type):
+        try:
+            functions = app_api.get(function_type) or {}
+        except AttributeError:
+            return
+        for name, function_api in functions.items():
+            if isinstance(function_api, dict) and 'run' in function_api:
+                if function_type == 'actions' or 'data_in' in function_api:
+                    yield name, function_api
+
+    def get(self, function_type, app, name, unknown_function):
+        """Gets the metadata of a function
+
+        Args:
+            function_type (str): 'actions', 'conditions', or 'transforms'
+            app (str): Name of the app
+            name (str): Name of the function
+            unknown_function (cls): The exception to raise if the app is found but the function is not
+
+        Returns:
+            (AppActionApi|AppFunctionApi): The metadata of the function
+        """
+        try:
+            return getattr(self, function_type)[(app, name)]
+        except KeyError:
+            if app not in self.apps:
+                raise UnknownApp(app)
+            raise unknown_function(app, name)
+
+
+_registry = None
+
+
+def build_app_api_registry():
+    """Rebuilds the registry of app action, condition, and transform metadata from walkoff.config.app_apis. This is
+        called whenever the app APIs are loaded.
+    """
+    global _registry
+    _registry = AppApiRegistry(walkoff.config.app_apis)
+
+
+def _get_registry():
+    if _registry is None or _registry.source is not walkoff.config.app_apis:
+        build_app_api_registry()
+    return _registry
+
+
+def get_app_action_metadata(app, action):
+    """
+    Gets the precomputed metadata for a given app and action
+
+    Args:
+        app (str): Name of the app
+        action (str): Name of the action
+
+    Returns:
+        (AppActionApi): The metadata of the action
+    """
+    return _get_registry().get('actions', app, action, UnknownAppAction)
+
+
 def get_app_action_api(app, action):
     """
     Gets the api for a given app and action
@@ -12,17 +131,8 @@ def get_app_action_api(app, action):
     Returns:
         (tuple(str, dict)) The name of the function to execute and its parameters
     """
-    try:
-        app_api = walkoff.config.app_apis[app]
-    except KeyError:
-        raise UnknownApp(app)
-    else:
-        try:
-            action_api = app_api['actions'][action]
-            run = action_api['run']
-            return run, action_api.get('parameters', [])
-        except KeyError:
-            raise UnknownAppAction(app, action)
+    action_api = get_app_action_metadata(app, action)
+    return action_api.run, action_api.parameters
 
 
 def get_app_action_default_return(app, action):
@@ -36,19 +146,7 @@ def get_app_action_default_return(app, action):
     Returns:
         (str): The name of the default return code or Success if none defined
     """
-    try:
-        app_api = walkoff.config.app_apis[app]
-    except KeyError:
-        raise UnknownApp(app)
-    else:
-        try:
-            action_api = app_api['actions'][action]
-            if 'default_return' in action_api:
-                return action_api['default_return']
-            else:
-                return 'Success'
-        except KeyError:
-            raise UnknownAppAction(app, action)
+    return get_app_action_metadata(app, action).default_return
 
 
 def get_app_action_return_is_failure(app, action, status):
@@ -63,19 +161,7 @@ def get_app_action_return_is_failure(app, action, status):
     Returns:
         (boolean): True if status is a failure code, false otherwise
     """
-    try:
-        app_api = walkoff.config.app_apis[app]
-    except KeyError:
-        raise UnknownApp(app)
-    else:
-        try:
-            action_api = app_api['actions'][action]
-            if 'failure' in action_api['returns'][status]:
-                return True if action_api['returns'][status]['failure'] is True else False
-            else:
-                return False
-        except KeyError:
-            raise UnknownAppAction(app, action)
+    return get_app_action_metadata(app, action).is_failure(status)
 
 
 def get_app_device_api(app, device_type):
@@ -99,31 +185,11 @@ def split_api_params(api, data_param_name):
 
 
 def get_condition_api(app, condition):
-    try:
-        app_api = walkoff.config.app_apis[app]
-    except KeyError:
-        raise UnknownApp(app)
-    else:
-        try:
-            condition_api = app_api['conditions'][condition]
-            run = condition_api['run']
-            return condition_api['data_in'], run, condition_api.get('parameters', [])
-        except KeyError:
-            raise UnknownCondition(app, condition)
+    return _get_registry().get('conditions', app, condition, UnknownCondition)
 
 
 def get_transform_api(app, transform):
-    try:
-        app_api = walkoff.config.app_apis[app]
-    except KeyError:
-        raise UnknownApp(app)
-    else:
-        try:
-            transform_api = app_api['transforms'][transform]
-            run = transform_api['run']
-            return transform_api['data_in'], run, transform_api.get('parameters', [])
-        except KeyError:
-            raise UnknownTransform(app, transform)
+    return _get_registry().get('transforms', app, transform, UnknownTransform)
 
 
 class InvalidAppStructure(Exception):
@@ -2,10 +2,12 @@ import inspect
 import logging
 import pkgutil
 import sys
+import threading
 from collections import namedtuple
 from importlib import import_module
 
 import os.path
+import yaml
 from six import string_types
 
 from walkoff.appgateway.apiutil import UnknownApp, UnknownAppAction, UnknownCondition, UnknownTransform
@@ -135,6 +137,8 @@ class AppCache(object):
 
     Attributes:
         _cache (dict): The cache of the app and functions
+        _unloaded (dict): The lazily indexed apps which have not been imported yet
+        _lock (RLock): The lock held while a lazily indexed app is imported
     """
     # TODO: Use an enum for this? Something better than this anyways
     exception_lookup = {WalkoffTag.action: UnknownAppAction,
@@ -144,12 +148,17 @@ class AppCache(object):
     def __init__(self):
         """Initializes a new AppCache object"""
         self._cache = {}
+        self._unloaded = {}
+        self._lock = threading.RLock()
 
-    def cache_apps(self, path):
+    def cache_apps(self, path, lazy=False, warm_up=None):
         """Cache apps from a given path
 
         Args:
             path (str): Path to apps module
+            lazy (bool, optional): Only index the apps, and import an app the first time one of its functions or its
+                class is requested. Defaults to False.
+            warm_up (list[str], optional): The names of apps to import immediately if lazy is True. Defaults to None.
         """
         app_path = AppCache._path_to_module(path)
         try:
@@ -159,11 +168,19 @@ class AppCache(object):
         else:
             apps = [info[1] for info in pkgutil.walk_packages(module.__path__)]
             for app in apps:
-                self._import_and_cache_submodules('{0}.{1}'.format(app_path, app), app, app_path)
+                if lazy:
+                    self._unloaded[app] = (path, app_path)
+                else:
+                    self._import_and_cache_submodules('{0}.{1}'.format(app_path, app), app, app_path)
+            for app in (warm_up or []) if lazy else []:
+                with self._lock:
+                    self._load_app(app)
 
     def clear(self):
         """Clears the cache"""
-        self._cache = {}
+        with self._lock:
+            self._cache = {}
+            self._unloaded = {}
 
     def get_app_names(self):
         """Gets a list of all the app names
@@ -171,7 +188,56 @@ class AppCache(object):
         Returns:
             list[str]: A list of all the names of apps stored in the cache
         """
-        return list(self._cache.keys())
+        return list(self._cache.keys()) + [app for app in self._unloaded if app not in self._cache]
+
+    def _get_entry(self, app_name):
+        """Gets the cache entry for an app, importing the app if it has not been loaded yet
+
+        Args:
+            app_name (str): Name of the app
+
+        Returns:
+            (AppCacheEntry): The cache entry for the app
+
+        Raises:
+            KeyError: If the app is not found in the cache
+        """
+        if app_name in self._unloaded:
+            with self._lock:
+                if app_name in self._unloaded:
+                    self._load_app(app_name)
+        return self._cache[app_name]
+
+    def _load_app(self, app_name):
+        """Imports and caches a lazily indexed app. Only the modules which contain the functions named in the app's API
+            are imported. If the app has no API, every submodule of the app is imported. The app is only removed from
+            the unloaded apps once all of its modules are cached, so this must be called while holding the lock to
+            keep other threads from reading a partially cached app.
+
+        Args:
+            app_name (str): Name of the app
+        """
+        try:
+            path, app_path = self._unloaded[app_name]
+        except KeyError:
+            _logger.warning('App {} is not indexed. Cannot warm it up'.format(app_name))
+            return
+        try:
+            package = '{0}.{1}'.format(app_path, app_name)
+            modules = _get_api_modules(package, _read_app_api(app_name, path))
+            if not modules:
+                self._import_and_cache_submodules(package, app_name, app_path)
+                return
+            _logger.debug('Importing modules {0} for app {1}'.format(modules, app_name))
+            for module_name in modules:
+                try:
+                    module = import_module(module_name)
+                except ImportError:
+                    _logger.exception('Cannot import {}. Skipping.'.format(module_name))
+                else:
+                    self._cache_module(module, app_name, app_path)
+        finally:
+            self._unloaded.pop(app_name, None)
 
     def get_app(self, app_name):
         """Gets the app class for a given app.
@@ -186,7 +252,7 @@ class AppCache(object):
             UnknownApp: If the app is not found in the cache or the app has only global actions
         """
         try:
-            app_cache = self._cache[app_name]
+            app_cache = self._get_entry(app_name)
         except KeyError:
             _logger.error('Cannot locate app {} in cache!'.format(app_name))
             raise UnknownApp(app_name)
@@ -242,7 +308,7 @@ class AppCache(object):
             UnknownAppAction: If the app does not have the specified action
         """
         try:
-            app_cache = self._cache[app_name]
+            app_cache = self._get_entry(app_name)
             if not app_cache.functions:
                 _logger.warning('App {} has no actions'.format(app_name))
                 raise UnknownAppAction(app_name, action_name)
@@ -326,7 +392,7 @@ class AppCache(object):
             UnknownApp: If the app is not found in the cache
         """
         try:
-            return self._cache[app_name].get_tagged_functions(function_type)
+            return self._get_entry(app_name).get_tagged_functions(function_type)
         except KeyError:
             _logger.error('Cannot locate app {} in cache!'.format(app_name))
             raise UnknownApp(app_name)
@@ -349,7 +415,7 @@ class AppCache(object):
             UnknownTransform: if the function_type is 'transforms' and the given transform name isn't found
         """
         try:
-            app_cache = self._cache[app_name]
+            app_cache = self._get_entry(app_name)
             if not app_cache.functions:
                 _logger.warning('App {0} has no actions.'.format(app_name))
                 raise self.exception_lookup[function_type](app_name, function_name)
@@ -442,6 +508,57 @@ class AppCache(object):
         self._cache[app_name].cache_app_class(app_class, app_path)
 
 
+def _read_app_api(app_name, path):
+    """Gets the API of an app, reading it from the app's api.yaml if the app APIs have not been loaded yet
+
+    Args:
+        app_name (str): The name of the app
+        path (str): Path to the apps directory
+
+    Returns:
+        (dict): The API of the app, or None if it could not be read
+    """
+    import walkoff.config
+    if app_name in walkoff.config.app_apis:
+        return walkoff.config.app_apis[app_name]
+    try:
+        with open(os.path.join(path, app_name, 'api.yaml')) as api_file:
+            return yaml.safe_load(api_file.read())
+    except (IOError, OSError, yaml.YAMLError):
+        return None
+
+
+def _get_api_modules(package, api):
+    """Gets the modules which contain the functions named by the run paths in an app's API
+
+    Args:
+        package (str): The name of the app's package
+        api (dict): The API of the app
+
+    Returns:
+        (list[str]): The names of the modules
+    """
+    modules = []
+    if not isinstance(api, dict):
+        return modules
+    for function_type in ('actions', 'conditions', 'transforms'):
+        for function_api in (api.get(function_type) or {}).values():
+            run = function_api.get('run', '') if isinstance(function_api, dict) else ''
+            parts = run.split('.')
+            for i in range(len(parts) - 1, 0, -1):
+                module_name = '.'.join([package] + parts[:i])
+                if module_name in modules:
+                    break
+                try:
+                    is_module = module_name in sys.modules or pkgutil.find_loader(module_name) is not None
+                except ImportError:
+                    is_module = False
+                if is_module:
+                    modules.append(module_name)
+                    break
+    return modules
+
+
 def _get_qualified_class_name(obj):
     """Gets the qualified name of a class
 
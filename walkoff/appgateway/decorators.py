@@ -1,6 +1,7 @@
+import inspect
 from functools import wraps
 
-from walkoff.appgateway.actionresult import ActionResult
+from walkoff.appgateway.actionresult import ActionResult, StreamingActionResult
 from walkoff.helpers import get_function_arg_names
 from .walkofftag import WalkoffTag
 
@@ -9,12 +10,14 @@ def format_result(result):
     """Converts a result to an ActionResult object
 
     Args:
-        result (str|tuple): The result of the action
+        result (str|tuple|generator): The result of the action. Generators are wrapped in a StreamingActionResult
 
     Returns:
         (ActionResult): An ActionResult object with the result included in the object
     """
-    if not isinstance(result, tuple):
+    if inspect.isgenerator(result):
+        return StreamingActionResult(result)
+    elif not isinstance(result, tuple):
         return ActionResult(result, None)
     else:
         return ActionResult(*result)
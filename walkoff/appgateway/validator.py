@@ -1,3 +1,4 @@
+import inspect
 import json
 import logging
 import os
@@ -329,6 +330,9 @@ def validate_primitive_parameter(value, param, parameter_type, message_prefix, h
 
 
 def validate_parameter(value, param, message_prefix):
+    if param.get('x-stream') and inspect.isgenerator(value):
+        # Streamed results are validated by the consuming action as they are read
+        return value
     param = deepcopy(param)
     primitive_type = 'primitive' if 'type' in param else 'object'
     converted_value = None
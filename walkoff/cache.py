@@ -3,6 +3,8 @@ import os
 import pickle
 import sqlite3
 import threading
+import time
+from collections import OrderedDict, deque
 from copy import deepcopy
 from datetime import timedelta
 from functools import partial
@@ -13,6 +15,7 @@ from diskcache import FanoutCache, DEFAULT_SETTINGS, Cache
 from diskcache.core import DBNAME
 from gevent import sleep
 from gevent.event import AsyncResult, Event
+from gevent.queue import Queue
 from six import string_types, binary_type
 
 import walkoff.config
@@ -234,11 +237,18 @@ class DiskCacheAdapter(object):
         **settings: Other setting which will be passsed to the `cache` attribute on initialization
     """
 
+    poll_interval = 0.1
+    """(float): The number of seconds between the attempts of a blocking pop to pop a value. Each attempt queries the
+    SQLite database, so a shorter interval adds load on the database while the workers are idle."""
+
     def __init__(self, directory, shards=8, timeout=0.01, retry=True, **settings):
         self.directory = directory
         self.retry = retry
         self.cache = FanoutCache(directory, shards=shards, timeout=timeout, **settings)
-        self.pubsub_cache = DiskPubSubCache(directory=os.path.join(directory, 'channels'), timeout=timeout)
+        self.pubsub_cache = self._create_pubsub_cache(directory, timeout)
+
+    def _create_pubsub_cache(self, directory, timeout):
+        return DiskPubSubCache(directory=os.path.join(directory, 'channels'), timeout=timeout)
 
     def set(self, key, value, expire=None, **opts):
         """Set a value for a key in the cache
@@ -382,11 +392,63 @@ class DiskCacheAdapter(object):
         except IndexError:
             return None
 
-    def subscribe(self, channel):
+    def rpush_many(self, items):
+        """Pushes values to the right of several deques
+
+        Args:
+            items (iterable(tuple)): The key of the deque and the value to push to it for each value
+        """
+        for key, value in items:
+            self.rpush(key, value)
+
+    def lpush_many(self, items):
+        """Pushes values to the left of several deques
+
+        Args:
+            items (iterable(tuple)): The key of the deque and the value to push to it for each value
+        """
+        for key, value in items:
+            self.lpush(key, value)
+
+    def brpop(self, key, timeout=0):
+        """Pops a value from the right of a deque, waiting for one to be pushed if the deque is empty
+
+        Args:
+            key: The key of the deque to pop the value from
+            timeout (int, optional): The number of seconds to wait for a value. 0 waits forever. Defaults to 0.
+
+        Returns:
+            The rightmost value on the deque or None if no value was pushed before the timeout
+        """
+        return self._blocking_pop(self.rpop, key, timeout)
+
+    def blpop(self, key, timeout=0):
+        """Pops a value from the left of a deque, waiting for one to be pushed if the deque is empty
+
+        Args:
+            key: The key of the deque to pop the value from
+            timeout (int, optional): The number of seconds to wait for a value. 0 waits forever. Defaults to 0.
+
+        Returns:
+            The leftmost value on the deque or None if no value was pushed before the timeout
+        """
+        return self._blocking_pop(self.lpop, key, timeout)
+
+    def _blocking_pop(self, pop, key, timeout):
+        deadline = time.time() + timeout if timeout else None
+        while True:
+            value = pop(key)
+            if value is not None or (deadline is not None and time.time() >= deadline):
+                return value
+            time.sleep(self.poll_interval)
+
+    def subscribe(self, channel, last_event_id=None):
         """Subscribe to a channel
 
         Args:
             channel (str): The name of the channel to subscribe to
+            last_event_id (int, optional): Unused. Messages published to this cache are not buffered, so they cannot
+                be replayed.
 
         Returns:
             (DiskSubscription): The subscription for this channel
@@ -416,6 +478,17 @@ class DiskCacheAdapter(object):
         """
         return self.pubsub_cache.publish(channel, data)
 
+    def publish_many(self, messages):
+        """Publish data to several channels
+
+        Args:
+            messages (iterable(tuple)): The channel and the data to publish to it for each message
+
+        Returns:
+            (list[int]): The number of subscriptions which received each message
+        """
+        return [self.publish(channel, data) for channel, data in messages]
+
     def register_callbacks(self):
         """Registers callbacks for the PubSubs for the current thread.
 
@@ -469,6 +542,228 @@ class DiskCacheAdapter(object):
         return cls(directory, shards=shards, timeout=timeout, retry=retry, **settings)
 
 
+class MemorySubscription(object):
+    """A Subscription used by a PubSub channel kept in memory
+
+    Attributes:
+        channel (str): The channel name associated with this subscription
+        event_id (int): The ID of the last message yielded by this subscription. IDs increase by one with each message
+            published to the channel.
+        _queue (Queue): The messages which have been published to the channel but not yet yielded
+        _pubsub (MemoryPubSubCache): The cache which publishes to this subscription
+
+    Args:
+        channel (str): The channel name associated with this subscription
+        pubsub (MemoryPubSubCache): The cache which publishes to this subscription
+        replay (list[tuple(int, object)], optional): The buffered messages to yield before any new messages
+    """
+
+    def __init__(self, channel, pubsub, replay=()):
+        self.channel = channel
+        self.event_id = 0
+        self._pubsub = pubsub
+        self._queue = Queue()
+        for message in replay:
+            self._queue.put(message)
+
+    def listen(self):
+        """Listen for updates in this channel
+
+        Returns:
+            (generator): A generator which yields new values in the channel
+        """
+        return self._listen()
+
+    def _listen(self):
+        """Listen for updates in this channel and yield the results
+
+        Yields:
+            The new values in this channel
+        """
+        try:
+            while True:
+                event_id, value = self._queue.get()
+                if value == unsubscribe_message:
+                    break
+                self.event_id = event_id
+                yield value
+        finally:
+            self._pubsub.remove_subscription(self)
+
+    def push(self, event_id, value):
+        """Push a new value to the channel
+
+        Args:
+            event_id (int): The ID of the value in the channel
+            value: The value to push to the channel
+        """
+        self._queue.put((event_id, value))
+
+
+class MemoryPubSubCache(object):
+    """A cache used for PubSub channels which keeps the channels in memory. Messages are only delivered to subscribers
+        in the same process.
+
+    The most recent messages of each channel are kept in a bounded buffer so that a subscriber which reconnects can
+    receive the messages it missed. Only the buffers of the channels published to most recently are kept.
+
+    Attributes:
+        buffer_size (int): The number of messages kept for each channel
+        max_channels (int): The number of channels whose messages are kept
+        _channels (OrderedDict{str: dict}): The last message ID and the buffer of each channel, least recently published
+            first
+        _subscribers (dict{str: WeakSet(MemorySubscription)}): The subscriptions to each channel
+
+    Args:
+        buffer_size (int, optional): The number of messages kept for each channel. Defaults to 100.
+        max_channels (int, optional): The number of channels whose messages are kept. Defaults to 1000.
+    """
+
+    def __init__(self, buffer_size=100, max_channels=1000):
+        self.buffer_size = buffer_size
+        self.max_channels = max_channels
+        self._lock = threading.RLock()
+        self._channels = OrderedDict()
+        self._subscribers = {}
+
+    def publish(self, channel, data):
+        """Publish data to a channel
+
+        Args:
+            channel (str): Channel to publish the data to
+            data: The data to publish. The data will arrive in the same format as it was published.
+
+        Returns:
+            (int): The number of subscribers which received the published data
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+            if data == unsubscribe_message:
+                event_id = None
+            else:
+                channel_state = self._get_channel(channel)
+                channel_state['last_id'] += 1
+                event_id = channel_state['last_id']
+                channel_state['buffer'].append((event_id, data))
+            for subscriber in subscribers:
+                subscriber.push(event_id, data)
+        return len(subscribers)
+
+    def _get_channel(self, channel):
+        channel_state = self._channels.pop(channel, None)
+        if channel_state is None:
+            channel_state = {'last_id': 0, 'buffer': deque(maxlen=self.buffer_size)}
+            while len(self._channels) >= self.max_channels:
+                self._channels.popitem(last=False)
+        self._channels[channel] = channel_state
+        return channel_state
+
+    def subscribe(self, channel, last_event_id=None):
+        """Subscribe to a channel
+
+        Args:
+            channel (str): The name of the channel to subscribe to
+            last_event_id (int, optional): The ID of the last message the subscriber received. The buffered messages
+                after it are replayed. Defaults to None, meaning only new messages are received.
+
+        Returns:
+            (MemorySubscription): The subscription to this channel
+        """
+        with self._lock:
+            replay = ()
+            if last_event_id is not None and channel in self._channels:
+                replay = [message for message in self._channels[channel]['buffer'] if message[0] > last_event_id]
+            subscription = MemorySubscription(channel, self, replay)
+            self._subscribers.setdefault(channel, WeakSet()).add(subscription)
+        return subscription
+
+    def remove_subscription(self, subscription):
+        """Stops publishing to a subscription
+
+        Args:
+            subscription (MemorySubscription): The subscription
+        """
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    self._subscribers.pop(subscription.channel)
+
+    def register_callbacks(self):
+        """Registers callbacks for the current thread. For the MemoryPubSubCache, this is not necessary"""
+        pass
+
+    def shutdown(self):
+        """Closes every subscription and discards the buffered messages"""
+        with self._lock:
+            for channel in list(self._subscribers):
+                self.publish(channel, unsubscribe_message)
+            self._channels.clear()
+
+
+class MemoryCacheAdapter(DiskCacheAdapter):
+    """Adapter for a cache whose PubSub channels are kept in memory
+
+    The keys and deques are stored in a DiskCache as in the DiskCacheAdapter, so that they are shared with the worker
+    processes, but messages published to a channel are delivered directly to the subscribers in the same process
+    without being written to disk. This is meant for deployments with a single server process. The most recent
+    messages of each channel are buffered so that SSE clients which reconnect can resume from their Last-Event-ID.
+
+    Attributes:
+        buffer_size (int): The number of messages buffered for each channel
+        max_channels (int): The number of channels whose messages are buffered
+        pubsub_cache (MemoryPubSubCache): The cache which provides pubsub capabilities to this adapter
+
+    Args:
+        directory (str): The directory to the SQLite database backing the keys and deques of this cache
+        buffer_size (int, optional): The number of messages buffered for each channel. Defaults to 100.
+        max_channels (int, optional): The number of channels whose messages are buffered. Defaults to 1000.
+        **kwargs: The other options of the DiskCacheAdapter
+    """
+
+    def __init__(self, directory, buffer_size=100, max_channels=1000, **kwargs):
+        self.buffer_size = buffer_size
+        self.max_channels = max_channels
+        super(MemoryCacheAdapter, self).__init__(directory, **kwargs)
+
+    def _create_pubsub_cache(self, directory, timeout):
+        return MemoryPubSubCache(buffer_size=self.buffer_size, max_channels=self.max_channels)
+
+    def subscribe(self, channel, last_event_id=None):
+        """Subscribe to a channel
+
+        Args:
+            channel (str): The name of the channel to subscribe to
+            last_event_id (int, optional): The ID of the last message the subscriber received. The buffered messages
+                after it are replayed. Defaults to None, meaning only new messages are received.
+
+        Returns:
+            (MemorySubscription): The subscription for this channel
+        """
+        return self.pubsub_cache.subscribe(channel, last_event_id=last_event_id)
+
+    @classmethod
+    def from_json(cls, json_in):
+        """Constructs this cache from its JSON representation
+
+        Args:
+            json_in (dict): The JSON representation of this cache configuration
+
+        Returns:
+            (MemoryCacheAdapter): A MemoryCacheAdapter with a configuration reflecting the values in the JSON
+        """
+        directory = json_in.pop('directory', walkoff.config.Config.CACHE_PATH)
+        buffer_size = json_in.pop('buffer_size', 100)
+        max_channels = json_in.pop('max_channels', 1000)
+        shards = json_in.pop('shards', 8)
+        timeout = json_in.pop('timeout', 0.01)
+        retry = json_in.pop('retry', True)
+        settings = {key: value for key, value in json_in.items() if key in DEFAULT_SETTINGS}
+        return cls(directory, buffer_size=buffer_size, max_channels=max_channels, shards=shards, timeout=timeout,
+                   retry=retry, **settings)
+
+
 class RedisSubscription(object):
     def __init__(self, channel, pubsub):
         self.channel = channel
@@ -498,11 +793,34 @@ class RedisSubscription(object):
 
 
 class RedisCacheAdapter(object):
+    """Adapter for a Redis cache
+
+    The adapter shares a pool of connections between the threads which use it. Operations on several keys or channels
+    are sent in a single pipeline, so they take one round trip to Redis.
+
+    Attributes:
+        cache (StrictRedis): The Redis client wrapped by this adapter
+
+    Args:
+        max_connections (int, optional): The number of connections in the pool. Defaults to no limit.
+        pool_timeout (float, optional): If set, a thread which needs a connection when max_connections are in use
+            waits up to this number of seconds for one to be released instead of failing immediately. A blocking pool
+            needs a bound, so if max_connections is not set, `default_blocking_pool_size` connections are used.
+        **opts: The options of the connections, such as the host, port, db, and password
+    """
     _requires = ['redis']
 
-    def __init__(self, **opts):
-        from redis import StrictRedis
-        self.cache = StrictRedis(**opts)
+    default_blocking_pool_size = 50
+    """(int): The number of connections in the pool when pool_timeout is set without max_connections"""
+
+    def __init__(self, max_connections=None, pool_timeout=None, **opts):
+        from redis import BlockingConnectionPool, StrictRedis
+        self.cache = StrictRedis(max_connections=max_connections, **opts)
+        if pool_timeout is not None:
+            pool = self.cache.connection_pool
+            self.cache = StrictRedis(connection_pool=BlockingConnectionPool(
+                max_connections=max_connections or self.default_blocking_pool_size, timeout=pool_timeout,
+                connection_class=pool.connection_class, **pool.connection_kwargs))
 
     def set(self, key, value, expire=None, **opts):
         """Set a value for a key in the cache
@@ -630,6 +948,62 @@ class RedisCacheAdapter(object):
         """
         return self._decode_response(self.cache.lpop(key))
 
+    def rpush_many(self, items):
+        """Pushes values to the right of several deques in a single transaction
+
+        Args:
+            items (iterable(tuple)): The key of the deque and the value to push to it for each value
+
+        Returns:
+            (list[int]): The length of the deque after each push
+        """
+        return self._pipeline_many('rpush', items, transaction=True)
+
+    def lpush_many(self, items):
+        """Pushes values to the left of several deques in a single transaction
+
+        Args:
+            items (iterable(tuple)): The key of the deque and the value to push to it for each value
+
+        Returns:
+            (list[int]): The length of the deque after each push
+        """
+        return self._pipeline_many('lpush', items, transaction=True)
+
+    def brpop(self, key, timeout=0):
+        """Pops a value from the right of a deque, waiting for one to be pushed if the deque is empty
+
+        Args:
+            key: The key of the deque to pop the value from
+            timeout (int, optional): The number of seconds to wait for a value. 0 waits forever. Defaults to 0.
+
+        Returns:
+            The rightmost value on the deque or None if no value was pushed before the timeout
+        """
+        return self._decode_blocking_response(self.cache.brpop(key, timeout=timeout))
+
+    def blpop(self, key, timeout=0):
+        """Pops a value from the left of a deque, waiting for one to be pushed if the deque is empty
+
+        Args:
+            key: The key of the deque to pop the value from
+            timeout (int, optional): The number of seconds to wait for a value. 0 waits forever. Defaults to 0.
+
+        Returns:
+            The leftmost value on the deque or None if no value was pushed before the timeout
+        """
+        return self._decode_blocking_response(self.cache.blpop(key, timeout=timeout))
+
+    def _pipeline_many(self, command, items, transaction=False):
+        pipeline = self.cache.pipeline(transaction=transaction)
+        for key, value in items:
+            getattr(pipeline, command)(key, value)
+        return pipeline.execute()
+
+    @classmethod
+    def _decode_blocking_response(cls, response):
+        return None if response is None else cls._decode_response(response[1])
+
     @staticmethod
     def _decode_response(response):
         if response is None:
@@ -639,11 +1013,13 @@ class RedisCacheAdapter(object):
         except UnicodeDecodeError:
             return response
 
-    def subscribe(self, channel):
+    def subscribe(self, channel, last_event_id=None):
         """Subscribe to a channel
 
         Args:
             channel (str): The name of the channel to subscribe to
+            last_event_id (int, optional): Unused. Messages published to Redis channels are not buffered, so they
+                cannot be replayed.
 
         Returns:
             (RedisSubscription): The subscription for this channel
@@ -676,6 +1052,17 @@ class RedisCacheAdapter(object):
         """
         return self.cache.publish(channel, data)
 
+    def publish_many(self, messages):
+        """Publish data to several channels in a single round trip
+
+        Args:
+            messages (iterable(tuple)): The channel and the data to publish to it for each message
+
+        Returns:
+            (list[int]): The number of subscriptions which received each message
+        """
+        return self._pipeline_many('publish', messages)
+
     def shutdown(self):
         """Shuts down the connection to the cache
 
@@ -716,7 +1103,250 @@ class RedisCacheAdapter(object):
         return cls(**json_in)
 
 
-cache_translation = {'disk': DiskCacheAdapter, 'redis': RedisCacheAdapter}
+class NearCacheAdapter(object):
+    """Adapter which keeps the most recently read values of another cache adapter in memory
+
+    Values read with `get` are kept in a size-bounded LRU in the current process for up to their TTL, so repeated reads
+    of the same keys do not go to disk or over the network. Writing a key through this adapter evicts it from the LRU
+    and publishes its name on an invalidation channel of the wrapped cache, so the other near caches subscribed to the
+    channel evict it as well. Messages published to a DiskCacheAdapter are only delivered in the process which published
+    them, so near caches in front of a disk cache in other processes rely on the TTL instead, which must therefore be
+    finite. A value written through this adapter with an expiration is never kept in memory past it. All of the other
+    operations, such as the deques and PubSub channels, are passed through to the wrapped cache.
+
+    Values are copied when they are put in and read from memory, so a caller which modifies a value it got does not
+    change the value seen by the other readers.
+
+    Attributes:
+        cache (DiskCacheAdapter|MemoryCacheAdapter|RedisCacheAdapter): The cache wrapped by this adapter
+        max_size (int): The number of values kept in memory
+        ttl (float): The number of seconds a value is kept in memory. None keeps it until it is evicted.
+        invalidation_channel (str): The channel on which the keys written by any near cache are published
+
+    Args:
+        cache (DiskCacheAdapter|MemoryCacheAdapter|RedisCacheAdapter): The cache to wrap
+        max_size (int, optional): The number of values kept in memory. Defaults to 1000.
+        ttl (float, optional): The number of seconds a value is kept in memory. Defaults to `default_ttl`. None keeps
+            values until they are evicted or invalidated, which is only allowed in front of a RedisCacheAdapter because
+            the writes made by other processes to a disk cache are never invalidated.
+        invalidation_channel (str, optional): The channel on which written keys are published. If None, the keys are
+            not published and the near cache does not listen for keys written by other processes. Defaults to
+            '__near_cache_invalidations__'.
+    """
+    clear_message = '__CLEAR__'
+    """(str): The message published on the invalidation channel when the cache is cleared"""
+
+    default_ttl = 60
+    """(float): The number of seconds a value is kept in memory if no TTL is given"""
+
+    def __init__(self, cache, max_size=1000, ttl=default_ttl, invalidation_channel='__near_cache_invalidations__'):
+        if ttl is None and isinstance(cache, DiskCacheAdapter):
+            raise ValueError('A near cache in front of a {} needs a finite ttl'.format(type(cache).__name__))
+        self.cache = cache
+        self.max_size = max_size
+        self.ttl = ttl
+        self.invalidation_channel = invalidation_channel
+        self._entries = OrderedDict()
+        self._expirations = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._listener = None
+        if invalidation_channel is not None:
+            subscription = self.cache.subscribe(invalidation_channel)
+            self._listener = threading.Thread(target=self._listen, args=(subscription,), name='NearCacheListener')
+            self._listener.daemon = True
+            self._listener.start()
+
+    def __getattr__(self, item):
+        return getattr(self.cache, item)
+
+    @property
+    def stats(self):
+        """Gets the counters of the near cache
+
+        Returns:
+            (dict): The number of values in memory, reads served from memory and from the wrapped cache, values evicted
+                to make room for others, and values invalidated by writes
+        """
+        with self._lock:
+            return {'size': len(self._entries),
+                    'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'invalidations': self.invalidations}
+
+    def get(self, key, ttl=None, **opts):
+        """Gets the value stored in the key, reading it from the wrapped cache if it is not in memory
+
+        Args:
+            key (str): The key to get the value from
+            ttl (float, optional): The number of seconds to keep the value in memory if it is read from the wrapped
+                cache. Defaults to the `ttl` of this cache.
+            **opts: Additional options to pass to the wrapped cache
+
+        Returns:
+            The value stored in the key
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[1] is None or entry[1] > now):
+                self._entries[key] = self._entries.pop(key)
+                self.hits += 1
+                return deepcopy(entry[0])
+            self.misses += 1
+            generation = self._generation
+        value = self.cache.get(key, **opts)
+        ttl = self.ttl if ttl is None else ttl
+        if value is not None and self.max_size > 0:
+            expires = now + ttl if ttl is not None else None
+            with self._lock:
+                expiration = self._expirations.get(key)
+                if expiration is not None:
+                    expires = expiration if expires is None else min(expires, expiration)
+                if generation == self._generation and (expires is None or expires > now):
+                    self._entries.pop(key, None)
+                    self._entries[key] = (deepcopy(value), expires)
+                    while len(self._entries) > self.max_size:
+                        self._entries.popitem(last=False)
+                        self.evictions += 1
+        return value
+
+    def set(self, key, value, expire=None, **opts):
+        """Set a value for a key in the wrapped cache and invalidate it in every near cache
+
+        Args:
+            key (str): The key to use for this data
+            value: The value to set this key to
+            expire (int|datetime.timedelta, optional): The expiration for this value. If `int` is passed, it indicates
+                milliseconds
+            **opts: Additional options to pass to the wrapped cache
+
+        Returns:
+            (bool): Was this key set?
+        """
+        result = self.cache.set(key, value, expire=expire, **opts)
+        self._set_expiration(key, expire)
+        self.invalidate(key)
+        return result
+
+    def add(self, key, value, expire=None, **opts):
+        """Add a key and a value to the wrapped cache if the key is not already in the cache
+
+        Args:
+            key (str): The key to store the value to
+            value: The value to store in the key
+            expire (int|datetime.timedelta, optional): The expiration for this value. If `int` is passed, it indicates
+                milliseconds
+            **opts: Additional options to pass to the wrapped cache
+
+        Returns:
+            (bool): Was the key set?
+        """
+        result = self.cache.add(key, value, expire=expire, **opts)
+        if result:
+            self._set_expiration(key, expire)
+            self.invalidate(key)
+        return result
+
+    def incr(self, key, amount=1, **opts):
+        """Increments a key by an amount and invalidates it in every near cache
+
+        Args:
+            key (str): The key to increment
+            amount (int, optional): The amount to increment the key by. Defaults to 1
+            **opts: Additional options to pass to the wrapped cache
+
+        Returns:
+            (int): The incremented value
+        """
+        result = self.cache.incr(key, amount=amount, **opts)
+        self.invalidate(key)
+        return result
+
+    def decr(self, key, amount=1, **opts):
+        """Decrements a key by an amount and invalidates it in every near cache
+
+        Args:
+            key (str): The key to decrement
+            amount (int, optional): The amount to decrement the key by. Defaults to 1
+            **opts: Additional options to pass to the wrapped cache
+
+        Returns:
+            (int): The decremented value
+        """
+        result = self.cache.decr(key, amount=amount, **opts)
+        self.invalidate(key)
+        return result
+
+    def invalidate(self, key):
+        """Evicts a key from this near cache and publishes it so that the other near caches evict it too
+
+        Args:
+            key (str): The key to invalidate
+        """
+        self._evict(key)
+        self._publish_invalidation(key)
+
+    def clear(self):
+        """Clears all values in the wrapped cache and in every near cache
+        """
+        self.cache.clear()
+        with self._lock:
+            self._expirations.clear()
+        self._evict_all()
+        self._publish_invalidation(self.clear_message)
+
+    def shutdown(self):
+        """Stops listening for invalidations and shuts down the wrapped cache
+        """
+        self._closed = True
+        self._evict_all()
+        self.cache.shutdown()
+
+    def _publish_invalidation(self, key):
+        if self.invalidation_channel is not None:
+            self.cache.register_callbacks()
+            self.cache.publish(self.invalidation_channel, key)
+
+    def _set_expiration(self, key, expire):
+        with self._lock:
+            self._expirations.pop(key, None)
+            if expire is not None:
+                self._expirations[key] = time.time() + DiskCacheAdapter._convert_expire_to_seconds(expire)
+                while len(self._expirations) > self.max_size:
+                    self._expirations.popitem(last=False)
+
+    def _evict(self, key):
+        with self._lock:
+            self._generation += 1
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def _evict_all(self):
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def _listen(self, subscription):
+        for key in subscription.listen():
+            if self._closed:
+                break
+            if isinstance(key, binary_type):
+                key = key.decode('utf-8')
+            if key == self.clear_message:
+                self._evict_all()
+            else:
+                self._evict(key)
+
+
+cache_translation = {'disk': DiskCacheAdapter, 'memory': MemoryCacheAdapter, 'redis': RedisCacheAdapter}
 """(dict): A mapping between a string type and the corresponding cache adapter
 """
 
@@ -725,14 +1355,16 @@ def make_cache(config=None):
     """Factory method for constructing Cache Adapters from configuration JSON
 
     Args:
-        config (dict): The JSON configuration of the cache adapter
+        config (dict): The JSON configuration of the cache adapter. If it has a 'near_cache' configuration which is
+            enabled, the cache is wrapped in a NearCacheAdapter with the remaining near cache options.
 
     Returns:
-        (RedisCacheAdapter|DiskCacheAdapter): The constructed cache
+        (RedisCacheAdapter|DiskCacheAdapter|MemoryCacheAdapter|NearCacheAdapter): The constructed cache
     """
     if config is None:
         config = {}
     config = deepcopy(config)
+    near_cache = config.pop('near_cache', {})
     cache_type = config.pop('type', 'disk').lower()
     try:
         cache = cache_translation[cache_type].from_json(config)
@@ -747,4 +1379,6 @@ def make_cache(config=None):
         cache = DiskCacheAdapter.from_json(config)
 
     logger.info('Created {} cache connection'.format(cache_type))
+    if near_cache.pop('enabled', False):
+        cache = NearCacheAdapter(cache, **near_cache)
     return cache
@@ -2,9 +2,10 @@ import json
 import logging
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, create_engine
+from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, create_engine, or_, text, column
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker, scoped_session
+from sqlalchemy.orm import relationship, sessionmaker, scoped_session, Session
 from sqlalchemy_utils import database_exists, create_database
 
 from walkoff.helpers import format_db_path
@@ -49,9 +50,9 @@ class Event(Case_Base):
     """ORM for an Event in the events database"""
     __tablename__ = 'event'
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, default=datetime.utcnow)
-    type = Column(String)
-    originator = Column(String)
+    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    type = Column(String, index=True)
+    originator = Column(String, index=True)
     message = Column(String)
     note = Column(String)
     data = Column(String)
@@ -85,6 +86,57 @@ class Event(Case_Base):
         return output
 
 
+_event_search_statements = (
+    "CREATE VIRTUAL TABLE event_search USING fts5(message, note, data, content='event', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS event_search_insert AFTER INSERT ON event BEGIN "
+    "INSERT INTO event_search(rowid, message, note, data) VALUES (new.id, new.message, new.note, new.data); END",
+    "CREATE TRIGGER IF NOT EXISTS event_search_delete AFTER DELETE ON event BEGIN "
+    "INSERT INTO event_search(event_search, rowid, message, note, data) "
+    "VALUES ('delete', old.id, old.message, old.note, old.data); END",
+    "CREATE TRIGGER IF NOT EXISTS event_search_update AFTER UPDATE ON event BEGIN "
+    "INSERT INTO event_search(event_search, rowid, message, note, data) "
+    "VALUES ('delete', old.id, old.message, old.note, old.data); "
+    "INSERT INTO event_search(rowid, message, note, data) VALUES (new.id, new.message, new.note, new.data); END",
+    "INSERT INTO event_search(event_search) VALUES ('rebuild')")
+
+
+def _create_event_search_index(engine):
+    """Creates the SQLite FTS5 full-text index of the message, note, and data of the events if it does not exist. The
+        index is kept up to date by triggers on the event table, and is built from the existing events when it is
+        created.
+
+    Args:
+        engine (Engine): The engine of a SQLite case database
+
+    Returns:
+        (bool): Whether the full-text index is available
+    """
+    try:
+        with engine.begin() as connection:
+            if connection.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'event_search'") \
+                    .first() is None:
+                for statement in _event_search_statements:
+                    connection.execute(statement)
+        return True
+    except OperationalError:
+        logger.warning('SQLite FTS5 is not available. Case events will be searched without a full-text index.')
+        return False
+
+
+def _format_match_query(terms):
+    """Formats search terms as an FTS5 query matching all of the terms. Each term is quoted so that it is not read as
+        FTS5 syntax, and a trailing * is kept as a prefix match.
+
+    Args:
+        terms (list[str]): The search terms, none of which are empty
+
+    Returns:
+        (str): The FTS5 query
+    """
+    return ' AND '.join('"{}"{}'.format(term.rstrip('*').replace('"', '""'), '*' if term.endswith('*') else '')
+                        for term in terms)
+
+
 class CaseDatabase(object):
     """Wrapper for the SQLAlchemy Case database object"""
     instance = None
@@ -111,6 +163,8 @@ class CaseDatabase(object):
 
         Case_Base.metadata.bind = self.engine
         Case_Base.metadata.create_all(self.engine)
+        self.full_text_search = (self.engine.dialect.name == 'sqlite'
+                                 and _create_event_search_index(self.engine))
 
     def __new__(cls, *args, **kwargs):
         if cls.instance is None:
@@ -177,6 +231,130 @@ class CaseDatabase(object):
         """
         return self.session.query(Event).filter(Event.id == event_id).first().as_json()
 
+    def case_events_query(self, case_id, after_id=None, event_types=None, start_time=None, end_time=None,
+                          session=None):
+        """Gets a query of the events of a case, ordered by ID. The events are found through the primary key of the
+            links between cases and events, so a page of events after a given ID is a range scan however deep it is.
+
+        Args:
+            case_id (int): The ID of the case
+            after_id (int, optional): Only get the events with a greater ID. Defaults to None.
+            event_types (list[str], optional): Only get the events of these types. Defaults to None, meaning all types.
+            start_time (datetime, optional): Only get the events at or after this time. Defaults to None.
+            end_time (datetime, optional): Only get the events before this time. Defaults to None.
+            session (Session, optional): The session to query with. Defaults to the session of this database.
+
+        Returns:
+            (Query): The query of the events
+        """
+        session = session if session is not None else self.session
+        query = session.query(Event).join(_CaseEventLink, _CaseEventLink.event_id == Event.id).filter(
+            _CaseEventLink.case_id == case_id)
+        if after_id is not None:
+            query = query.filter(_CaseEventLink.event_id > after_id)
+        if event_types:
+            query = query.filter(Event.type.in_(event_types))
+        if start_time is not None:
+            query = query.filter(Event.timestamp >= start_time)
+        if end_time is not None:
+            query = query.filter(Event.timestamp < end_time)
+        return query.order_by(_CaseEventLink.event_id)
+
+    def read_case_events(self, case_id, limit, after_id=None, **filters):
+        """Reads a page of the events of a case
+
+        Args:
+            case_id (int): The ID of the case
+            limit (int): The maximum number of events to read
+            after_id (int, optional): Read the events after the event with this ID. Defaults to None, meaning the first
+                page is read.
+            **filters: The event_types, start_time, and end_time filters of case_events_query
+
+        Returns:
+            (tuple(list[Event], bool)): The events, and whether there are more events after them
+        """
+        events = self.case_events_query(case_id, after_id=after_id, **filters).limit(limit + 1).all()
+        return events[:limit], len(events) > limit
+
+    def iter_case_events(self, case_id, batch_size=1000, **filters):
+        """Iterates over the events of a case without loading them all into memory. The events are read from a
+            server-side cursor on a connection of their own, batch_size events at a time.
+
+        Args:
+            case_id (int): The ID of the case
+            batch_size (int, optional): The number of events to fetch at a time. Defaults to 1000.
+            **filters: The event_types, start_time, and end_time filters of case_events_query
+
+        Yields:
+            (Event): The events of the case, ordered by ID
+        """
+        connection = self.engine.connect().execution_options(stream_results=True)
+        session = Session(bind=connection)
+        try:
+            for event in self.case_events_query(case_id, session=session, **filters).yield_per(batch_size):
+                yield event
+        finally:
+            session.close()
+            connection.close()
+
+    def search_events(self, limit, before_id=None, search=None, originator=None, event_types=None, start_time=None,
+                      end_time=None, case_id=None):
+        """Searches the events, most recent first. On SQLite, the search terms are matched against the full-text index
+            of the message, note, and data of the events. On other databases, each term is matched as a substring.
+
+        Args:
+            limit (int): The maximum number of events to read
+            before_id (int, optional): Read the events before the event with this ID. Defaults to None, meaning the
+                most recent events are read.
+            search (str, optional): Whitespace-separated terms which must all appear in the message, note, or data of
+                the events. A term ending in * matches words starting with the term. Defaults to None.
+            originator (str, optional): Only read the events from this originator. Defaults to None.
+            event_types (list[str], optional): Only read the events of these types. Defaults to None, meaning all types.
+            start_time (datetime, optional): Only read the events at or after this time. Defaults to None.
+            end_time (datetime, optional): Only read the events before this time. Defaults to None.
+            case_id (int, optional): Only read the events of this case. Defaults to None.
+
+        Returns:
+            (tuple(list[Event], bool)): The events, and whether there are more events after them
+        """
+        query = self.session.query(Event)
+        if case_id is not None:
+            query = query.join(_CaseEventLink, _CaseEventLink.event_id == Event.id).filter(
+                _CaseEventLink.case_id == case_id)
+        if before_id is not None:
+            query = query.filter(Event.id < before_id)
+        if originator is not None:
+            query = query.filter(Event.originator == originator)
+        if event_types:
+            query = query.filter(Event.type.in_(event_types))
+        if start_time is not None:
+            query = query.filter(Event.timestamp >= start_time)
+        if end_time is not None:
+            query = query.filter(Event.timestamp < end_time)
+        terms = [term for term in search.split() if term.rstrip('*')] if search else []
+        if terms and self.full_text_search:
+            matching_ids = text('SELECT rowid FROM event_search WHERE event_search MATCH :match').bindparams(
+                match=_format_match_query(terms)).columns(column('rowid', Integer))
+            query = query.filter(Event.id.in_(matching_ids))
+        elif terms:
+            for term in terms:
+                pattern = '%{}%'.format(term.rstrip('*').replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_'))
+                query = query.filter(or_(*(field.ilike(pattern, escape='\\')
+                                           for field in (Event.message, Event.note, Event.data))))
+        events = query.order_by(Event.id.desc()).limit(limit + 1).all()
+        return events[:limit], len(events) > limit
+
+    def case_exists(self, case_id):
+        """Checks if a case exists
+
+        Args:
+            case_id (int): The ID of the case
+
+        Returns:
+            (bool): Whether the case exists
+        """
+        return self.session.query(Case.id).filter(Case.id == case_id).first() is not None
+
     def case_events_as_json(self, case_id):
         """Gets the JSON representation of all the events in the case database.
         
@@ -10,15 +10,20 @@ class CaseLogger(object):
     Attributes:
         subscriptions (SubscriptionCache): The subscriptions for all cases used by this logger
         _repository (CaseDatabase): The repository used to store cases and events
+        writer (CaseEventWriter): The writer used to store events in the background, or None if events are stored
+            as they are logged
 
     Args:
         repository (CaseDatabase): The repository used to store cases and events
         subscriptions (SubscriptionCache): The subscriptions for all cases used by this logger
+        writer (CaseEventWriter, optional): The writer used to store events in the background. Defaults to None,
+            meaning events are stored as they are logged.
     """
 
-    def __init__(self, repository, subscriptions):
+    def __init__(self, repository, subscriptions, writer=None):
         self.subscriptions = subscriptions
         self._repository = repository
+        self.writer = writer
 
     def log(self, event, sender_id, data=None):
         """Log an event to the database if any cases have subscribed to it
@@ -33,7 +38,10 @@ class CaseLogger(object):
             cases_to_add = self.subscriptions.get_cases_subscribed(originator, event.signal_name)
             if cases_to_add:
                 event = self._create_event_entry(event, originator, data)
-                self._repository.add_event(event, cases_to_add)
+                if self.writer is not None:
+                    self.writer.write(event, cases_to_add)
+                else:
+                    self._repository.add_event(event, cases_to_add)
 
     def add_subscriptions(self, case_id, subscriptions):
         """Adds subscriptions to a case
@@ -9,12 +9,17 @@ Subscription = namedtuple('Subscription', ['id', 'events'])
 
 
 class SubscriptionCache(object):
-    """Cache for case subscriptions. Structure is optimized for efficient lookup at the cost of efficient
-        modification"""
+    """Cache for case subscriptions. The subscriptions are looked up for every event, so they are stored in an
+        immutable structure which is replaced, rather than modified, when the subscriptions change. Lookups read the
+        current structure without taking a lock. Each change copies the top-level mapping of senders, so it takes time
+        linear in the number of subscribed senders, plus the event mappings of the senders the case subscribes to. A
+        reverse index of the senders and events each case subscribes to means that removing a case does not scan the
+        subscriptions of every other case."""
 
     def __init__(self):
         self._lock = RLock()
         self._subscriptions = {}
+        self._case_subscriptions = {}
 
     def get_cases_subscribed(self, sender_id, event):
         """Gets the cases which are subscribed a given sender and event
@@ -24,10 +29,9 @@ class SubscriptionCache(object):
             event (WalkoffEvent): The event of the sender
 
         Returns:
-            (list[Case]): The list of Cases which are subscribed to a given sender and event
+            (frozenset): The IDs of the cases which are subscribed to a given sender and event
         """
-        with self._lock:
-            return self._subscriptions.get(sender_id, {}).get(event, set())
+        return self._subscriptions.get(sender_id, {}).get(event, frozenset())
 
     def add_subscriptions(self, case_id, case_subscriptions):
         """Adds a case's subscriptions to the cache
@@ -37,7 +41,8 @@ class SubscriptionCache(object):
             case_subscriptions (list[Subscription]): The subscriptions for this case
         """
         with self._lock:
-            self._create_or_update_subscriptions(case_id, case_subscriptions)
+            subscribed = self._case_subscriptions.get(case_id, set())
+            self._replace_subscriptions(case_id, added=self._get_sender_events(case_subscriptions) - subscribed)
 
     def update_subscriptions(self, case_id, subscriptions):
         """Updates the subscription cache for a case
@@ -47,19 +52,9 @@ class SubscriptionCache(object):
             subscriptions (list[Subscription]): The new subscriptions for this case
         """
         with self._lock:
-            self.delete_case(case_id)
-            self._create_or_update_subscriptions(case_id, subscriptions)
-
-    def _create_or_update_subscriptions(self, case_id, subscriptions):
-        for case_subscription in subscriptions:
-            sender_id = case_subscription.id
-            if sender_id not in self._subscriptions:
-                self._subscriptions[sender_id] = {}
-            for event in case_subscription.events:
-                if event in self._subscriptions[sender_id]:
-                    self._subscriptions[sender_id][event].add(case_id)
-                else:
-                    self._subscriptions[sender_id][event] = {case_id}
+            subscribed = self._case_subscriptions.get(case_id, set())
+            sender_events = self._get_sender_events(subscriptions)
+            self._replace_subscriptions(case_id, added=sender_events - subscribed, removed=subscribed - sender_events)
 
     def delete_case(self, case_id):
         """Deletes all the subscriptions for a case
@@ -67,20 +62,50 @@ class SubscriptionCache(object):
         Args:
             case_id (int): The id of the case
         """
-
         with self._lock:
-            for sender_id, events in self._subscriptions.items():
-                for event, cases in events.items():
-                    if case_id in cases:
-                        cases.remove(case_id)
-            self._clear_empty_subscriptions()
+            self._replace_subscriptions(case_id, removed=self._case_subscriptions.get(case_id, set()))
 
-    def _clear_empty_subscriptions(self):
-        with self._lock:
-            self._subscriptions = {sender_id: {event: cases for event, cases in events.items() if cases}
-                                   for sender_id, events in self._subscriptions.items()}
+    @staticmethod
+    def _get_sender_events(subscriptions):
+        return {(subscription.id, event) for subscription in subscriptions for event in subscription.events}
+
+    def _replace_subscriptions(self, case_id, added=frozenset(), removed=frozenset()):
+        """Publishes a copy of the subscriptions with a case added to and removed from some senders' events. Only the
+            events of the affected senders are copied, but the top-level mapping of senders is always copied. Must be
+            called with the lock held.
+
+        Args:
+            case_id (int): The id of the case
+            added (set[tuple]): The (sender ID, event) pairs to subscribe the case to
+            removed (set[tuple]): The (sender ID, event) pairs to unsubscribe the case from
+        """
+        if not added and not removed:
+            return
+        subscriptions = dict(self._subscriptions)
+        for sender_id in {sender_id for sender_id, _ in added} | {sender_id for sender_id, _ in removed}:
+            subscriptions[sender_id] = dict(subscriptions.get(sender_id, {}))
+        for sender_id, event in added:
+            events = subscriptions[sender_id]
+            events[event] = events.get(event, frozenset()) | {case_id}
+        for sender_id, event in removed:
+            events = subscriptions[sender_id]
+            cases = events.get(event, frozenset()) - {case_id}
+            if cases:
+                events[event] = cases
+            else:
+                events.pop(event, None)
+                if not events:
+                    del subscriptions[sender_id]
+
+        case_subscriptions = (self._case_subscriptions.get(case_id, set()) | added) - removed
+        if case_subscriptions:
+            self._case_subscriptions[case_id] = case_subscriptions
+        else:
+            self._case_subscriptions.pop(case_id, None)
+        self._subscriptions = subscriptions
 
     def clear(self):
         """Clears all the subscriptions for all cases"""
         with self._lock:
             self._subscriptions = {}
+            self._case_subscriptions = {}
@@ -0,0 +1,185 @@
+import logging
+import threading
+from datetime import datetime
+
+from six.moves.queue import Queue, Empty, Full
+from sqlalchemy import select
+
+from walkoff.case.database import Case, Event, _CaseEventLink
+
+logger = logging.getLogger(__name__)
+
+_event_columns = ('timestamp', 'type', 'originator', 'message', 'note', 'data')
+
+
+class CaseEventWriter(object):
+    def __init__(self, repository, max_queue_size=10000, batch_size=500, flush_interval=0.5, block_on_overflow=False,
+                 overflow_timeout=1):
+        """A writer which stores case events in the background. Events are buffered in a bounded queue, and a
+            background thread writes each batch of buffered events and their case links in a single transaction.
+
+        Args:
+            repository (CaseDatabase): The repository used to store cases and events
+            max_queue_size (int, optional): The number of events which may wait to be written. Defaults to 10000.
+            batch_size (int, optional): The maximum number of events written in one transaction. Defaults to 500.
+            flush_interval (float, optional): The number of seconds to wait for more events before writing a batch
+                smaller than batch_size. Defaults to 0.5.
+            block_on_overflow (bool, optional): Wait up to overflow_timeout seconds for room in a full queue instead of
+                dropping the event immediately. Defaults to False.
+            overflow_timeout (float, optional): The number of seconds to wait for room in a full queue when
+                block_on_overflow is set. Defaults to 1.
+        """
+        self._repository = repository
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block_on_overflow = block_on_overflow
+        self.overflow_timeout = overflow_timeout
+        self._queue = Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stopped = False
+        self.written = 0
+        self.overflows = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def stats(self):
+        """Gets the counters of the writer
+
+        Returns:
+            (dict): The number of events waiting to be written, written, dropped because the queue was full, and lost
+                because their batch failed to be written, and the number of times the queue was full
+        """
+        return {'queued': self._queue.qsize(),
+                'written': self.written,
+                'overflows': self.overflows,
+                'dropped': self.dropped,
+                'failed': self.failed}
+
+    def write(self, event, case_ids):
+        """Queues an event to be added to some cases. The writer is started on the first call.
+
+        Args:
+            event (Event): The event to add to the cases
+            case_ids (set[int]): The IDs of the cases to add the event to
+
+        Returns:
+            (bool): Whether the event was queued
+        """
+        if self._thread is None:
+            self.start()
+        entry = {column: getattr(event, column) for column in _event_columns}
+        entry['originator'] = str(entry['originator'])
+        if entry['timestamp'] is None:
+            entry['timestamp'] = datetime.utcnow()
+        item = (entry, list(case_ids))
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except Full:
+            with self._lock:
+                self.overflows += 1
+        if self.block_on_overflow:
+            try:
+                self._queue.put(item, timeout=self.overflow_timeout)
+                return True
+            except Full:
+                pass
+        with self._lock:
+            self.dropped += 1
+        logger.warning('Case event queue is full. Dropped event {} from {}'.format(entry['type'], entry['originator']))
+        return False
+
+    def start(self):
+        """Starts the background thread which writes the events"""
+        with self._lock:
+            if self._thread is None:
+                self._stopped = False
+                self._thread = threading.Thread(target=self._run, name='CaseEventWriter')
+                self._thread.daemon = True
+                self._thread.start()
+
+    def flush(self):
+        """Blocks until every queued event has been written"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def stop(self, timeout=5):
+        """Writes the queued events and stops the background thread
+
+        Args:
+            timeout (float, optional): The number of seconds to wait for the queued events to be written. Defaults to 5.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stopped = True
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._write_batch(batch)
+                for _ in batch:
+                    self._queue.task_done()
+            elif self._stopped:
+                return
+
+    def _next_batch(self):
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch):
+        """Inserts a batch of events and their case links in one transaction. Links to cases which no longer exist are
+            skipped. The event rows are inserted one at a time to get their generated IDs, and the links are inserted
+            with a single executemany.
+
+        Args:
+            batch (list[tuple(dict, list[int])]): The columns of each event and the IDs of its cases
+        """
+        case_ids = {case_id for _, event_case_ids in batch for case_id in event_case_ids}
+        try:
+            with self._repository.engine.begin() as connection:
+                existing_cases = {case_id for case_id, in connection.execute(
+                    select([Case.id]).where(Case.id.in_(case_ids)))}
+                links = []
+                for entry, event_case_ids in batch:
+                    event_id = connection.execute(Event.__table__.insert(), entry).inserted_primary_key[0]
+                    links.extend({'case_id': case_id, 'event_id': event_id}
+                                 for case_id in event_case_ids if case_id in existing_cases)
+                if links:
+                    connection.execute(_CaseEventLink.__table__.insert(), links)
+        except Exception:
+            logger.exception('Could not write {} case events'.format(len(batch)))
+            with self._lock:
+                self.failed += len(batch)
+        else:
+            with self._lock:
+                self.written += len(batch)
+
+
+def make_case_event_writer(repository, config):
+    """Makes the writer which stores case events in the background
+
+    Args:
+        repository (CaseDatabase): The repository used to store cases and events
+        config (dict): The configuration of the writer. If 'enabled' is false, events are stored as they are logged.
+            The remaining options are passed to the CaseEventWriter.
+
+    Returns:
+        (CaseEventWriter): The writer, or None if it is disabled
+    """
+    config = dict(config)
+    if not config.pop('enabled', True):
+        return None
+    return CaseEventWriter(repository, **config)
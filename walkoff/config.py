@@ -32,17 +32,26 @@ def load_app_apis(apps_path=None):
         logger.fatal('Could not load JSON schema for apps. Shutting down...: ' + str(e))
         sys.exit(1)
     else:
+        from walkoff.appgateway.apispeccache import AppApiSpecCache
+        spec_cache = AppApiSpecCache(Config.APP_API_CACHE_PATH, Config.WALKOFF_SCHEMA_PATH)
         for app in list_apps(apps_path):
             try:
                 url = join(apps_path, app, 'api.yaml')
-                with open(url) as function_file:
-                    api = yaml.load(function_file.read())
+                with open(url, 'rb') as function_file:
+                    contents = function_file.read()
+                api = spec_cache.get(url, contents, join(apps_path, app))
+                if api is None:
+                    api = yaml.load(contents)
                     from walkoff.appgateway.validator import validate_app_spec
                     validate_app_spec(api, app, Config.WALKOFF_SCHEMA_PATH)
-                    app_apis[app] = api
+                    spec_cache.set(url, contents, join(apps_path, app), api)
+                app_apis[app] = api
             except Exception as e:
                 logger.error(
                     'Cannot load apps api for app {0}: Error {1}'.format(app, str(format_exception_message(e))))
+        spec_cache.save()
+        from walkoff.appgateway.apiutil import build_app_api_registry
+        build_app_api_registry()
 
 
 def setup_logger():
@@ -92,16 +101,57 @@ class Config(object):
     NUMBER_PROCESSES = 4
     NUMBER_THREADS_PER_PROCESS = 3
 
+    # Import apps only when one of their actions, conditions, or transforms is first used. Apps listed in APP_WARM_UP
+    # are still imported on startup.
+    LAZY_APP_IMPORT = False
+    APP_WARM_UP = []
+
     # Database types
     WALKOFF_DB_TYPE = 'sqlite'
     CASE_DB_TYPE = 'sqlite'
     EXECUTION_DB_TYPE = 'sqlite'
 
+    # Connection pool for the execution database. pool_class is one of 'queue', 'singleton', 'static', or 'null'.
+    # In-memory SQLite databases use a 'singleton' pool in place of a 'queue' pool. Up to pool_size idle connections
+    # are kept open, and a max_overflow of -1 lets sessions open more connections instead of waiting for one.
+    EXECUTION_DB_POOL = {'pool_class': 'queue', 'pool_size': 5, 'max_overflow': -1, 'pool_timeout': 30,
+                         'pool_recycle': 3600}
+    # Pragmas applied to every connection to a SQLite execution database. WAL journaling lets readers proceed while a
+    # worker writes, and the busy timeout (in milliseconds) makes writers wait for the lock instead of failing.
+    EXECUTION_DB_SQLITE_PRAGMAS = {'journal_mode': 'WAL', 'busy_timeout': 5000, 'synchronous': 'NORMAL',
+                                   'cache_size': -16000}
+    # Store the UUIDs in the workflow and action status tables as 16 bytes instead of 32 character strings on databases
+    # without a native UUID type. This only applies to new databases; existing databases keep their format.
+    EXECUTION_DB_BINARY_UUIDS = False
+
+    # Case events are buffered in a queue of up to max_queue_size events and written by a background thread in batches
+    # of up to batch_size events, waiting up to flush_interval seconds for a batch to fill. When the queue is full,
+    # events are dropped, or if block_on_overflow is set, the logger waits up to overflow_timeout seconds for room.
+    # Set enabled to false to write each event as it is logged.
+    CASE_EVENT_WRITER = {'enabled': True, 'max_queue_size': 10000, 'batch_size': 500, 'flush_interval': 0.5,
+                         'block_on_overflow': False, 'overflow_timeout': 1}
+
+    # Limits on the clients of SSE streams. Each client has a queue of at most max_queue_size events waiting to be sent.
+    # When the queue is full, overflow_policy decides what happens to a new event: 'drop_oldest' drops the oldest queued
+    # event, 'coalesce' replaces the queued event of the same type (or drops the oldest one if there is none), and
+    # 'disconnect' closes the stream so that the client reconnects. Each user can have at most max_streams_per_user
+    # streams open (0 for no limit).
+    SSE_STREAMS = {'max_queue_size': 1000, 'overflow_policy': 'drop_oldest', 'max_streams_per_user': 20}
+
+    # Retention policies for the execution history, keyed by table ('workflow_status', 'action_status', or 'event').
+    # Each policy may set max_age_days, max_count, and the names of the statuses which expire. Every RETENTION_INTERVAL
+    # seconds, expired rows are moved to gzipped, date-partitioned files in ARCHIVE_PATH, RETENTION_BATCH_SIZE rows at a
+    # time. For example, {"workflow_status": {"max_age_days": 30}, "event": {"max_count": 100000}}
+    RETENTION_POLICIES = {}
+    RETENTION_INTERVAL = 3600
+    RETENTION_BATCH_SIZE = 1000
+
     # PATHS
 
     DATA_PATH = join('.', 'data')
 
     API_PATH = join('.', 'walkoff', 'api')
+    ARCHIVE_PATH = join(DATA_PATH, 'archive')
     APPS_PATH = join('.', 'apps')
     CACHE_PATH = join('.', 'data', 'cache')
     CACHE = {"type": "disk", "directory": CACHE_PATH, "shards": 8, "timeout": 0.01, "retry": True}
@@ -117,6 +167,8 @@ class Config(object):
     LOGGING_CONFIG_PATH = join(DATA_PATH, 'log', 'logging.json')
 
     WALKOFF_SCHEMA_PATH = join(DATA_PATH, 'walkoff_schema.json')
+    APP_API_CACHE_PATH = join(DATA_PATH, 'app_api_cache.json')
+    WORKFLOW_IMPORT_MANIFEST_PATH = join(DATA_PATH, 'workflow_import_manifest.json')
     WORKFLOWS_PATH = join('.', 'data', 'workflows')
 
     KEYS_PATH = join('.', '.certificates')
@@ -185,5 +237,5 @@ def initialize(config_path=None):
     Config.load_config(config_path)
     setup_logger()
     from walkoff.appgateway import cache_apps
-    cache_apps(Config.APPS_PATH)
+    cache_apps(Config.APPS_PATH, lazy=Config.LAZY_APP_IMPORT, warm_up=Config.APP_WARM_UP)
     load_app_apis()
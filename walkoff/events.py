@@ -210,6 +210,7 @@ class WalkoffEvent(Enum):
     ActionExecutionSuccess = ActionSignal('Action Execution Success', 'Action executed successfully')
     ActionExecutionError = ActionSignal('Action Execution Error', 'Action executed with error')
     ActionStarted = ActionSignal('Action Started', 'Action execution started')
+    ActionResultChunk = ActionSignal('Action Result Chunk', 'Action produced a partial result')
     ActionArgumentsInvalid = ActionSignal('Arguments Invalid', 'Arguments invalid')
     TriggerActionAwaitingData = ActionSignal('Trigger Action Awaiting Data', 'Trigger action awaiting data')
     TriggerActionTaken = ActionSignal('Trigger Action Taken', 'Trigger action taken')
@@ -281,6 +282,7 @@ class WalkoffEvent(Enum):
                          WalkoffEvent.ActionExecutionError,
                          WalkoffEvent.ActionArgumentsInvalid,
                          WalkoffEvent.ActionExecutionSuccess,
+                         WalkoffEvent.ActionResultChunk,
                          WalkoffEvent.SendMessage))
 
     def send(self, sender, **kwargs):
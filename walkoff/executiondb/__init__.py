@@ -1,20 +1,153 @@
 import enum
-from sqlalchemy import create_engine
+import logging
+import os
+import re
+
+from sqlalchemy import create_engine, event, exc, inspect
+from sqlalchemy.types import String
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, QueuePool, SingletonThreadPool, StaticPool
 from sqlalchemy_utils import database_exists, create_database
 
 from walkoff.helpers import format_db_path
 
+logger = logging.getLogger(__name__)
+
 Execution_Base = declarative_base()
 
+pool_classes = {'null': NullPool, 'queue': QueuePool, 'singleton': SingletonThreadPool, 'static': StaticPool}
+
+_pragma_pattern = re.compile(r'^-?\w+$')
+
+
+def _is_sqlite_memory(db_type, path):
+    return 'sqlite' in db_type and (not path or path == ':memory:')
+
+
+def get_pool_args(db_type, path, pool_options=None):
+    """Gets the arguments to create_engine which configure the connection pool
+
+    Args:
+        db_type (str): The type of the database
+        path (str): The path to the database
+        pool_options (dict, optional): The pool configuration. 'pool_class' is one of 'queue', 'singleton', 'static',
+            or 'null', and 'pool_size', 'max_overflow', 'pool_timeout', and 'pool_recycle' are passed to the pool if
+            it supports them. Defaults to None, in which case connections are not pooled.
+
+    Returns:
+        (dict): The keyword arguments to pass to create_engine
+    """
+    if not pool_options:
+        return {'poolclass': NullPool}
+    pool_class_name = pool_options.get('pool_class', 'queue')
+    if pool_class_name not in pool_classes:
+        logger.warning('Unknown execution database pool class {}. Connections will not be pooled'.format(
+            pool_class_name))
+        return {'poolclass': NullPool}
+    if pool_class_name == 'queue' and _is_sqlite_memory(db_type, path):
+        pool_class_name = 'singleton'
+
+    args = {'poolclass': pool_classes[pool_class_name]}
+    if pool_class_name == 'queue':
+        keys = ('pool_size', 'max_overflow', 'pool_timeout', 'pool_recycle')
+    elif pool_class_name == 'singleton':
+        keys = ('pool_size', 'pool_recycle')
+    elif pool_class_name == 'static':
+        keys = ('pool_recycle',)
+    else:
+        keys = ()
+    args.update({key: pool_options[key] for key in keys if key in pool_options})
+    return args
+
+
+def set_sqlite_pragmas(engine, pragmas):
+    """Registers an engine event which applies SQLite pragmas to every new connection
+
+    Args:
+        engine (Engine): The engine
+        pragmas (dict): The pragmas to apply, such as {'journal_mode': 'WAL', 'busy_timeout': 5000}
+    """
+    statements = []
+    for pragma, value in pragmas.items():
+        if _pragma_pattern.match(str(pragma)) and _pragma_pattern.match(str(value)):
+            statements.append('PRAGMA {0}={1}'.format(pragma, value))
+        else:
+            logger.warning('Ignoring invalid SQLite pragma {0}={1}'.format(pragma, value))
+
+    @event.listens_for(engine, 'connect')
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def protect_pool_across_fork(engine):
+    """Registers engine events which discard pooled connections inherited from a parent process, so that a forked
+        process never shares a connection with its parent
+
+    Args:
+        engine (Engine): The engine
+    """
+
+    @event.listens_for(engine, 'connect')
+    def record_pid(dbapi_connection, connection_record):
+        connection_record.info['pid'] = os.getpid()
+
+    @event.listens_for(engine, 'checkout')
+    def check_pid(dbapi_connection, connection_record, connection_proxy):
+        if connection_record.info['pid'] != os.getpid():
+            connection_record.connection = connection_proxy.connection = None
+            raise exc.DisconnectionError('Connection belongs to pid {0}, attempting to check out in pid {1}'.format(
+                connection_record.info['pid'], os.getpid()))
+
+
+def uses_binary_uuids(engine, binary_uuids=False):
+    """Determines how the UUIDs in the status tables are stored. The format of an existing database is always kept,
+        so the configured format only applies to new databases.
+
+    Args:
+        engine (Engine): The engine
+        binary_uuids (bool, optional): Whether to store UUIDs as 16 bytes rather than 32 character strings in a new
+            database. Defaults to False.
+
+    Returns:
+        (bool): Whether the UUIDs in the status tables are stored as bytes
+    """
+    inspector = inspect(engine)
+    if 'workflow_status' not in inspector.get_table_names():
+        return binary_uuids
+    column_type = next(column['type'] for column in inspector.get_columns('workflow_status')
+                       if column['name'] == 'execution_id')
+    # SQLite reflects BINARY columns as NUMERIC, so anything other than a string is treated as binary
+    is_binary = not isinstance(column_type, String)
+    if is_binary != binary_uuids and engine.dialect.name not in ('postgresql', 'mssql'):
+        logger.warning('Execution database stores status UUIDs as {}. The configured format only applies to new '
+                       'databases'.format('bytes' if is_binary else 'strings'))
+    return is_binary
+
 
 class ExecutionDatabase(object):
     """Wrapper for the SQLAlchemy database connection object"""
     instance = None
 
-    def __init__(self, execution_db_type, execution_db_path):
+    def __init__(self, execution_db_type, execution_db_path, pool_options=None, sqlite_pragmas=None,
+                 binary_uuids=False):
+        """Initializes the execution database
+
+        Args:
+            execution_db_type (str): The type of the database
+            execution_db_path (str): The path to the database
+            pool_options (dict, optional): The connection pool configuration. See get_pool_args. Defaults to None, in
+                which case connections are not pooled.
+            sqlite_pragmas (dict, optional): Pragmas applied to every connection if the database is SQLite. Defaults
+                to None.
+            binary_uuids (bool, optional): Whether to store the UUIDs in the status tables of a new database as 16
+                bytes rather than 32 character strings. Defaults to False.
+        """
         # All of these imports are necessary
         from walkoff.executiondb.device import App, Device, DeviceField, EncryptedDeviceField
         from walkoff.executiondb.argument import Argument
@@ -28,18 +161,24 @@ class ExecutionDatabase(object):
         from walkoff.executiondb.environment_variable import EnvironmentVariable
         from walkoff.executiondb.workflow import Workflow
         from walkoff.executiondb.saved_workflow import SavedWorkflow
-        from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
+        from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus, StatusUUIDType
         from walkoff.executiondb.metrics import AppMetric, WorkflowMetric, ActionMetric, ActionStatusMetric
 
+        pool_args = get_pool_args(execution_db_type, execution_db_path, pool_options)
         if 'sqlite' in execution_db_type:
             self.engine = create_engine(format_db_path(execution_db_type, execution_db_path),
-                                        connect_args={'check_same_thread': False}, poolclass=NullPool)
+                                        connect_args={'check_same_thread': False}, **pool_args)
+            if sqlite_pragmas:
+                set_sqlite_pragmas(self.engine, sqlite_pragmas)
         else:
             self.engine = create_engine(
                 format_db_path(execution_db_type, execution_db_path, 'WALKOFF_DB_USERNAME', 'WALKOFF_DB_PASSWORD'),
-                poolclass=NullPool)
+                **pool_args)
             if not database_exists(self.engine.url):
                 create_database(self.engine.url)
+        if pool_args['poolclass'] is not NullPool:
+            protect_pool_across_fork(self.engine)
+        StatusUUIDType.binary_storage = uses_binary_uuids(self.engine, binary_uuids)
 
         self.connection = self.engine.connect()
         self.transaction = self.connection.begin()
@@ -6,14 +6,14 @@ from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
 
 from walkoff.appgateway import get_app_action, is_app_action_bound
-from walkoff.appgateway.actionresult import ActionResult
+from walkoff.appgateway.actionresult import ActionResult, StreamingActionResult
 from walkoff.appgateway.validator import validate_app_action_parameters
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import Execution_Base
 from walkoff.executiondb.argument import Argument
 from walkoff.executiondb.executionelement import ExecutionElement
 from walkoff.helpers import format_exception_message
-from walkoff.appgateway.apiutil import get_app_action_api, UnknownApp, UnknownAppAction, InvalidArgument
+from walkoff.appgateway.apiutil import get_app_action_metadata, UnknownApp, UnknownAppAction, InvalidArgument
 
 logger = logging.getLogger(__name__)
 
@@ -65,8 +65,10 @@ class Action(ExecutionElement, Execution_Base):
 
         self.position = position
 
+        self._api = None
         self._run = None
         self._arguments_api = None
+        self._is_bound = False
         self._output = None
         self._execution_id = 'default'
         self._action_executable = None
@@ -79,8 +81,7 @@ class Action(ExecutionElement, Execution_Base):
         if not self.errors:
             errors = []
             try:
-                self._run, self._arguments_api = get_app_action_api(self.app_name, self.action_name)
-                self._action_executable = get_app_action(self.app_name, self._run)
+                self.__bind_api()
             except UnknownApp:
                 errors.append('Unknown app {}'.format(self.app_name))
             except UnknownAppAction:
@@ -94,9 +95,8 @@ class Action(ExecutionElement, Execution_Base):
         """Validates the object"""
         errors = []
         try:
-            self._run, self._arguments_api = get_app_action_api(self.app_name, self.action_name)
-            self._action_executable = get_app_action(self.app_name, self._run)
-            if is_app_action_bound(self.app_name, self._run) and not self.device_id:
+            self.__bind_api()
+            if self._is_bound and not self.device_id:
                 message = 'App action is bound but no device ID was provided.'.format(self.name)
                 errors.append(message)
             validate_app_action_parameters(self._arguments_api, self.arguments, self.app_name, self.action_name)
@@ -108,6 +108,12 @@ class Action(ExecutionElement, Execution_Base):
             errors.extend(e.errors)
         self.errors = errors
 
+    def __bind_api(self):
+        self._api = get_app_action_metadata(self.app_name, self.action_name)
+        self._run, self._arguments_api = self._api.run, self._api.parameters
+        self._action_executable = get_app_action(self.app_name, self._run)
+        self._is_bound = is_app_action_bound(self.app_name, self._run)
+
     def get_output(self):
         """Gets the output of an Action (the result)
 
@@ -162,17 +168,15 @@ class Action(ExecutionElement, Execution_Base):
         try:
             args = validate_app_action_parameters(self._arguments_api, arguments, self.app_name, self.action_name,
                                                   accumulator=accumulator)
-            if is_app_action_bound(self.app_name, self._run):
+            if self._is_bound:
                 result = self._action_executable(instance, **args)
             else:
                 result = self._action_executable(**args)
-            result.set_default_status(self.app_name, self.action_name)
-            if result.is_failure(self.app_name, self.action_name):
-                WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ActionExecutionError,
-                                                       data=result.as_json())
+            if isinstance(result, StreamingActionResult):
+                result = StreamingActionResult(self.__forward_stream(result))
             else:
-                WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ActionExecutionSuccess,
-                                                       data=result.as_json())
+                self.__send_result_event(result)
+            self.__set_default_status(result)
         except Exception as e:
             logger.exception('Error executing action {} (id={})'.format(self.name, str(self.id)))
             self.__handle_execution_error(e)
@@ -182,6 +186,59 @@ class Action(ExecutionElement, Execution_Base):
                 'Action {0}-{1} (id {2}) executed successfully'.format(self.app_name, self.action_name, self.id))
             return result
 
+    def __set_default_status(self, result):
+        if result.status is None:
+            result.status = self._api.default_return
+
+    def __send_result_event(self, result):
+        self.__set_default_status(result)
+        if self._api.is_failure(result.status):
+            WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ActionExecutionError,
+                                                   data=result.as_json())
+        else:
+            WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ActionExecutionSuccess,
+                                                   data=result.as_json())
+
+    def __forward_stream(self, stream):
+        """Forwards the chunks of a streaming result, sending an ActionResultChunk event for each one. The execution
+            success or error event is sent once the stream is exhausted, using the last chunk as the final result. If
+            the app action raises an exception midway, the error event is sent and the exception is raised to the
+            reader of the stream, so an action consuming it fails instead of succeeding on partial results.
+
+        Args:
+            stream (StreamingActionResult): The stream returned by the app action
+
+        Yields:
+            (tuple(obj, str)): The result and status of each chunk
+        """
+        try:
+            for index, chunk in enumerate(stream):
+                self.__set_default_status(chunk)
+                data = chunk.as_json()
+                data['index'] = index
+                WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ActionResultChunk, data=data)
+                yield chunk.result, chunk.status
+            self.__send_result_event(stream)
+        except Exception as e:
+            logger.exception('Error streaming results of action {} (id={})'.format(self.name, str(self.id)))
+            self.__handle_execution_error(e)
+            raise
+
+    def accepts_stream_from(self, action_id):
+        """Determines if this Action consumes the output of another Action as a stream. This is the case if the output
+            is passed in whole to a parameter marked with "x-stream: true" in the app's API
+
+        Args:
+            action_id (UUID): The ID of the Action producing the output
+
+        Returns:
+            (bool): True if the output is consumed as a stream, False otherwise
+        """
+        stream_parameters = {parameter['name'] for parameter in (self._arguments_api or [])
+                             if parameter.get('x-stream')}
+        return any(argument.name in stream_parameters and argument.reference == action_id and not argument.selection
+                   for argument in self.arguments)
+
     def __handle_execution_error(self, e):
         formatted_error = format_exception_message(e)
         if isinstance(e, InvalidArgument):
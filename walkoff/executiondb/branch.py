@@ -56,12 +56,14 @@ class Branch(ExecutionElement, Execution_Base):
     def validate(self):
         pass
 
-    def execute(self, data_in, accumulator):
+    def execute(self, data_in, accumulator, transform_cache=None):
         """Executes the Branch object, determining if this Branch should be taken.
 
         Args:
             data_in (dict): The input to the Condition objects associated with this Branch.
             accumulator (dict): The accumulated data from previous Actions.
+            transform_cache (TransformCache, optional): A cache of Transform results shared between the Branches
+                evaluated for the same Action. Defaults to None.
 
         Returns:
             (UUID): Destination UID for the next Action that should be taken, None if the data_in was not valid
@@ -72,7 +74,8 @@ class Branch(ExecutionElement, Execution_Base):
         accumulator[self.id] = self._counter
 
         if data_in is not None and data_in.status == self.status:
-            if self.condition is None or self.condition.execute(data_in=data_in.result, accumulator=accumulator):
+            if self.condition is None or self.condition.execute(data_in=data_in.result, accumulator=accumulator,
+                                                                 transform_cache=transform_cache):
                 WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.BranchTaken)
                 logger.debug('Branch is valid for input {0}'.format(data_in))
                 return self.destination_id
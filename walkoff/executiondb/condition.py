@@ -91,12 +91,14 @@ class Condition(ExecutionElement, executiondb.Execution_Base):
             errors.extend(e.errors)
         self.errors = errors
 
-    def execute(self, data_in, accumulator):
+    def execute(self, data_in, accumulator, transform_cache=None):
         """Executes the Condition object, determining if the Condition evaluates to True or False.
 
         Args:
             data_in (dict): The input to the Transform objects associated with this Condition.
             accumulator (dict): The accumulated data from previous Actions.
+            transform_cache (TransformCache, optional): A cache of Transform results to share with other Conditions
+                evaluated on the same input. Defaults to None.
 
         Returns:
             (bool): True if the Condition evaluated to True, False otherwise
@@ -104,7 +106,10 @@ class Condition(ExecutionElement, executiondb.Execution_Base):
         data = data_in
 
         for transform in self.transforms:
-            data = transform.execute(data, accumulator)
+            if transform_cache is not None:
+                data = transform_cache.execute(transform, data, accumulator)
+            else:
+                data = transform.execute(data, accumulator)
         try:
             arguments = self.__update_arguments_with_data(data)
             args = validate_condition_parameters(self._api, arguments, self.action_name, accumulator=accumulator)
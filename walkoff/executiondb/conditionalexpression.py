@@ -68,18 +68,20 @@ class ConditionalExpression(ExecutionElement, Execution_Base):
         for child in child_expressions:
             child.parent = self
 
-    def execute(self, data_in, accumulator):
+    def execute(self, data_in, accumulator, transform_cache=None):
         """Executes the ConditionalExpression object, determining if the statement evaluates to True or False.
 
         Args:
             data_in (dict): The input to the Transform objects associated with this ConditionalExpression.
             accumulator (dict): The accumulated data from previous Actions.
+            transform_cache (TransformCache, optional): A cache of Transform results to share with other Conditions
+                evaluated on the same input. Defaults to None.
 
         Returns:
             (bool): True if the Condition evaluated to True, False otherwise
         """
         try:
-            result = self.__operator_lookup[self.operator](data_in, accumulator)
+            result = self.__operator_lookup[self.operator](data_in, accumulator, transform_cache)
             if self.is_negated:
                 result = not result
             if result:
@@ -91,27 +93,29 @@ class ConditionalExpression(ExecutionElement, Execution_Base):
             WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionalExpressionError)
             return False
 
-    def _and(self, data_in, accumulator):
-        return (all(condition.execute(data_in, accumulator) for condition in self.conditions)
-                and all(expression.execute(data_in, accumulator) for expression in self.child_expressions))
+    def _and(self, data_in, accumulator, transform_cache):
+        return (all(condition.execute(data_in, accumulator, transform_cache) for condition in self.conditions)
+                and all(expression.execute(data_in, accumulator, transform_cache)
+                        for expression in self.child_expressions))
 
-    def _or(self, data_in, accumulator):
+    def _or(self, data_in, accumulator, transform_cache):
         if not self.conditions and not self.child_expressions:
             return True
-        return (any(condition.execute(data_in, accumulator) for condition in self.conditions)
-                or any(expression.execute(data_in, accumulator) for expression in self.child_expressions))
+        return (any(condition.execute(data_in, accumulator, transform_cache) for condition in self.conditions)
+                or any(expression.execute(data_in, accumulator, transform_cache)
+                       for expression in self.child_expressions))
 
-    def _xor(self, data_in, accumulator):
+    def _xor(self, data_in, accumulator, transform_cache):
         if not self.conditions and not self.child_expressions:
             return True
         is_one_found = False
         for condition in self.conditions:
-            if condition.execute(data_in, accumulator):
+            if condition.execute(data_in, accumulator, transform_cache):
                 if is_one_found:
                     return False
                 is_one_found = True
         for expression in self.child_expressions:
-            if expression.execute(data_in, accumulator):
+            if expression.execute(data_in, accumulator, transform_cache):
                 if is_one_found:
                     return False
                 is_one_found = True
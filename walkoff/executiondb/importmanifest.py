@@ -0,0 +1,68 @@
+import json
+import logging
+
+from walkoff.appgateway.apispeccache import hash_contents
+from walkoff.helpers import write_json_atomically
+
+logger = logging.getLogger(__name__)
+
+
+class PlaybookImportManifest(object):
+    def __init__(self, path):
+        """A record of the playbook files which have been imported into the execution database, stored on disk as
+            JSON. Each entry is keyed by the name of the file and holds the hash of its contents and the name of the
+            playbook it contained, so that unchanged files can be skipped without being parsed.
+
+        Args:
+            path (str): The path to the manifest file
+        """
+        self.path = path
+        self._entries = {}
+        self._is_dirty = False
+        self.__load()
+
+    def __load(self):
+        try:
+            with open(self.path) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (IOError, OSError, ValueError):
+            return
+        if isinstance(manifest, dict):
+            self._entries = manifest
+
+    def is_imported(self, file_name, contents, playbook_names):
+        """Determines if a playbook file has already been imported and is unchanged
+
+        Args:
+            file_name (str): The name of the playbook file
+            contents (bytes): The contents of the playbook file
+            playbook_names (set[str]): The names of the playbooks currently in the database
+
+        Returns:
+            (bool): True if the file is unchanged since it was imported and its playbook is still in the database
+        """
+        entry = self._entries.get(file_name)
+        return (entry is not None
+                and entry['hash'] == hash_contents(contents)
+                and entry['playbook'] in playbook_names)
+
+    def record(self, file_name, contents, playbook_name):
+        """Records that a playbook file has been imported
+
+        Args:
+            file_name (str): The name of the playbook file
+            contents (bytes): The contents of the playbook file
+            playbook_name (str): The name of the playbook in the file
+        """
+        self._entries[file_name] = {'hash': hash_contents(contents), 'playbook': playbook_name}
+        self._is_dirty = True
+
+    def save(self):
+        """Writes the manifest to disk if it has changed"""
+        if not self._is_dirty:
+            return
+        try:
+            write_json_atomically(self.path, self._entries)
+            self._is_dirty = False
+        except (IOError, OSError):
+            logger.warning('Could not write playbook import manifest to {}'.format(self.path), exc_info=True)
@@ -0,0 +1,58 @@
+from sqlalchemy.orm import Load
+
+from walkoff.executiondb.action import Action
+from walkoff.executiondb.branch import Branch
+from walkoff.executiondb.condition import Condition
+from walkoff.executiondb.conditionalexpression import ConditionalExpression
+from walkoff.executiondb.playbook import Playbook
+from walkoff.executiondb.transform import Transform
+from walkoff.executiondb.workflow import Workflow
+
+# Conditional expressions nested deeper than this below an Action or Branch are loaded lazily
+max_eager_expression_depth = 4
+
+
+def _conditional_expression_options(loader, depth):
+    conditions = loader.selectinload(ConditionalExpression.conditions)
+    options = [conditions.selectinload(Condition.arguments),
+               conditions.selectinload(Condition.transforms).selectinload(Transform.arguments)]
+    if depth > 1:
+        options.extend(_conditional_expression_options(
+            loader.selectinload(ConditionalExpression.child_expressions), depth - 1))
+    return options
+
+
+def _workflow_options(loader):
+    actions = loader.selectinload(Workflow.actions)
+    options = [actions.selectinload(Action.arguments),
+               actions.selectinload(Action.device_id),
+               actions.selectinload(Action.position),
+               loader.selectinload(Workflow.environment_variables)]
+    options.extend(_conditional_expression_options(actions.selectinload(Action.trigger), max_eager_expression_depth))
+    options.extend(_conditional_expression_options(
+        loader.selectinload(Workflow.branches).selectinload(Branch.condition), max_eager_expression_depth))
+    return options
+
+
+def workflow_load_options():
+    """Gets the loader options which load the entire tree of execution elements of the Workflows in a query. Each
+        relationship in the tree is loaded for all the Workflows at once with a SELECT ... IN query, so the number of
+        queries does not depend on the number of Workflows, Actions, Branches, or Conditions.
+
+    Returns:
+        (list): The loader options to pass to Query.options()
+    """
+    return _workflow_options(Load(Workflow))
+
+
+def playbook_load_options(full=True):
+    """Gets the loader options which load the Workflows of the Playbooks in a query
+
+    Args:
+        full (bool, optional): Also load the entire tree of execution elements of each Workflow. Defaults to True.
+
+    Returns:
+        (list): The loader options to pass to Query.options()
+    """
+    workflows = Load(Playbook).selectinload(Playbook.workflows)
+    return [workflows] + _workflow_options(workflows) if full else [workflows]
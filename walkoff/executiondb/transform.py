@@ -1,3 +1,4 @@
+import json
 import logging
 from copy import deepcopy
 
@@ -108,6 +109,19 @@ class Transform(ExecutionElement, Execution_Base):
                     self.action_name, str(self.id)))
         return original_data_in
 
+    def get_cache_key(self):
+        """Gets a key which identifies this Transform's computation independently of its database ID. Two Transforms
+            with the same app, action, and arguments will have the same key.
+
+        Returns:
+            (tuple): The key for this Transform
+        """
+        arguments = tuple(sorted(
+            (argument.name, json.dumps(argument.value, sort_keys=True, default=str), str(argument.reference),
+             tuple(argument.selection) if argument.selection else ())
+            for argument in self.arguments if argument.name != self._data_param_name))
+        return self.app_name, self.action_name, arguments
+
     def __update_arguments_with_data(self, data):
         arguments = []
         for argument in self.arguments:
@@ -117,6 +131,42 @@ class Transform(ExecutionElement, Execution_Base):
         return arguments
 
 
+class TransformCache(object):
+    """Memoizes the results of Transforms for the duration of a single branch-selection pass so that sibling
+        Branches which run identical Transform pipelines over the same input only execute them once.
+
+    Inputs are keyed by identity rather than by value. The first Transform of every pipeline receives the same
+    action result object, and the output of a cached Transform is handed to the next Transform in the pipeline, so
+    identical pipelines will hit the cache at every step without hashing or copying potentially large inputs.
+    """
+
+    def __init__(self):
+        self._results = {}
+
+    def execute(self, transform, data_in, accumulator):
+        """Executes a Transform, or returns the result of an identical Transform already executed on the same input
+
+        Args:
+            transform (Transform): The Transform to execute
+            data_in: The input to the Transform
+            accumulator (dict): A record of executed actions and their results
+
+        Returns:
+            (obj): The transformed data
+        """
+        key = (transform.get_cache_key(), id(data_in))
+        try:
+            return self._results[key][1]
+        except KeyError:
+            result = transform.execute(data_in, accumulator)
+            # data_in is kept alive alongside the result so that its id cannot be reused during this pass
+            self._results[key] = (data_in, result)
+            return result
+
+    def __len__(self):
+        return len(self._results)
+
+
 @event.listens_for(Transform, 'before_update')
 def validate_before_update(mapper, connection, target):
     target.validate()
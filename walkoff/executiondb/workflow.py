@@ -5,11 +5,13 @@ from sqlalchemy import Column, String, ForeignKey, orm, UniqueConstraint, Boolea
 from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
 
+from walkoff.appgateway.actionresult import StreamingActionResult
 from walkoff.appgateway.appinstancerepo import AppInstanceRepo
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import Execution_Base
 from walkoff.executiondb.action import Action
 from walkoff.executiondb.executionelement import ExecutionElement
+from walkoff.executiondb.transform import TransformCache
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +55,7 @@ class Workflow(ExecutionElement, Execution_Base):
         self._accumulator = {branch.id: 0 for branch in self.branches}
         self._execution_id = 'default'
         self._instance_repo = None
+        self._pending_stream = None
 
         self.validate()
 
@@ -61,11 +64,24 @@ class Workflow(ExecutionElement, Execution_Base):
         """Loads all necessary fields upon Workflow being loaded from database"""
         self._is_paused = False
         self._abort = False
-        self._accumulator = {branch.id: 0 for branch in self.branches}
-        if self.environment_variables:
-            self._accumulator.update({env_var.id: env_var.value for env_var in self.environment_variables})
+        # Built on first use, so that loading a Workflow does not lazily load its branches and environment variables
+        # before they can be eagerly loaded
+        self._accumulator = None
         self._instance_repo = AppInstanceRepo()
         self._execution_id = 'default'
+        self._pending_stream = None
+
+    @property
+    def _accumulator(self):
+        if self.__accumulator is None:
+            self.__accumulator = {branch.id: 0 for branch in self.branches}
+            if self.environment_variables:
+                self.__accumulator.update({env_var.id: env_var.value for env_var in self.environment_variables})
+        return self.__accumulator
+
+    @_accumulator.setter
+    def _accumulator(self, accumulator):
+        self.__accumulator = accumulator
 
     def validate(self):
         """Validates the object"""
@@ -152,6 +168,10 @@ class Workflow(ExecutionElement, Execution_Base):
             self._executing_action = action
             logger.debug('Executing action {0} of workflow {1}'.format(action, self.name))
 
+            if self._pending_stream is not None and (
+                    self._is_paused or self._abort or self._pending_stream[2] != action.id):
+                self.__drain_pending_stream()
+
             if self._is_paused:
                 self._is_paused = False
                 WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.WorkflowPaused)
@@ -173,9 +193,21 @@ class Workflow(ExecutionElement, Execution_Base):
             if start_arguments:
                 start_arguments = None
 
+            if self._pending_stream is not None:
+                self.__drain_pending_stream()
+
             if result and result.status == "trigger":
                 yield
+            if isinstance(result, StreamingActionResult):
+                consumer_id = self.__get_stream_consumer_id(action)
+                if consumer_id is not None:
+                    self._pending_stream = (action, result, consumer_id)
+                    self._accumulator[action.id] = (chunk.result for chunk in result)
+                    continue
+                self.__exhaust_stream(result)
             self._accumulator[action.id] = action.get_output().result
+        if self._pending_stream is not None:
+            self.__drain_pending_stream()
         self.__shutdown()
         yield
 
@@ -192,7 +224,7 @@ class Workflow(ExecutionElement, Execution_Base):
 
     def get_branch(self, current_action, accumulator):
         """Executes the Branch objects associated with this Workflow to determine which Action should be
-            executed next.
+            executed next. The results of Transforms are shared between the Branches evaluated in this call.
 
         Args:
             current_action(Action): The current action that has just finished executing.
@@ -204,10 +236,12 @@ class Workflow(ExecutionElement, Execution_Base):
         if self.branches:
             branches = sorted(
                 self.__get_branches_by_action_id(current_action.id), key=lambda branch_: branch_.priority)
+            transform_cache = TransformCache()
             for branch in branches:
                 # TODO: This here is the only hold up from getting rid of action._output.
                 # Keep whole result in accumulator
-                destination_id = branch.execute(current_action.get_output(), accumulator)
+                destination_id = branch.execute(current_action.get_output(), accumulator,
+                                                transform_cache=transform_cache)
                 if destination_id is not None:
                     logger.debug('Branch {} with destination {} chosen by workflow {} (id={})'.format(
                         str(branch.id), str(destination_id), self.name, str(self.id)))
@@ -216,6 +250,40 @@ class Workflow(ExecutionElement, Execution_Base):
         else:
             return None
 
+    def __get_stream_consumer_id(self, action):
+        """Gets the ID of the Action which will consume the streamed output of an Action incrementally. This is the
+            destination of the highest-priority Branch from the Action if that Branch has no condition and the
+            destination takes the output as a stream parameter.
+
+        Args:
+            action (Action): The Action which produced a stream
+
+        Returns:
+            (UUID): The ID of the consuming Action, or None if the stream should be consumed immediately
+        """
+        branches = sorted(self.__get_branches_by_action_id(action.id), key=lambda branch_: branch_.priority)
+        if not branches or branches[0].condition is not None:
+            return None
+        destination = self.get_action_by_id(branches[0].destination_id)
+        if destination is not None and destination.accepts_stream_from(action.id):
+            return destination.id
+        return None
+
+    def __drain_pending_stream(self):
+        action, stream, _ = self._pending_stream
+        self._pending_stream = None
+        self.__exhaust_stream(stream)
+        self._accumulator[action.id] = action.get_output().result
+
+    @staticmethod
+    def __exhaust_stream(stream):
+        try:
+            for _ in stream:
+                pass
+        except Exception:
+            # The action which produced the stream has already sent its error event and set its output
+            pass
+
     def __get_branches_by_action_id(self, id_):
         branches = []
         if self.branches:
@@ -1,7 +1,7 @@
 import json
 from datetime import datetime
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship, backref
 from sqlalchemy_utils import UUIDType
 
@@ -9,6 +9,22 @@ from walkoff.executiondb import Execution_Base, WorkflowStatusEnum, ActionStatus
 from walkoff.helpers import utc_as_rfc_datetime
 
 
+class StatusUUIDType(UUIDType):
+    """A UUIDType for the status tables whose storage format on databases without a native UUID type is chosen when
+        the execution database is created, rather than when the model is defined. UUIDs are stored as 16 bytes if
+        binary_storage is True, and as 32 character strings otherwise.
+    """
+    binary_storage = False
+
+    @property
+    def binary(self):
+        return StatusUUIDType.binary_storage
+
+    @binary.setter
+    def binary(self, value):
+        pass
+
+
 class WorkflowStatus(Execution_Base):
     """Case ORM for a Workflow event in the database
 
@@ -22,13 +38,16 @@ class WorkflowStatus(Execution_Base):
         _action_statuses (list[ActionStatus]): A list of ActionStatus objects for this WorkflowStatus
     """
     __tablename__ = 'workflow_status'
-    execution_id = Column(UUIDType(binary=False), primary_key=True)
-    workflow_id = Column(UUIDType(binary=False), nullable=False)
+    execution_id = Column(StatusUUIDType(), primary_key=True)
+    workflow_id = Column(StatusUUIDType(), nullable=False)
     name = Column(String, nullable=False)
     status = Column(Enum(WorkflowStatusEnum, name='WorkflowStatusEnum'), nullable=False)
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
     _action_statuses = relationship('ActionStatus', backref=backref('_workflow_status'), cascade='all, delete-orphan')
+    __table_args__ = (Index('ix_workflow_status_status_started_at', 'status', started_at.desc()),
+                      Index('ix_workflow_status_status_completed_at', 'status', completed_at.desc()),
+                      Index('ix_workflow_status_workflow_id_started_at', 'workflow_id', started_at.desc()))
 
     def __init__(self, execution_id, workflow_id, name):
         self.execution_id = execution_id
@@ -114,8 +133,8 @@ class ActionStatus(Execution_Base):
         _workflow_status_id (UUID): The FK ID of the WorkflowStatus
     """
     __tablename__ = 'action_status'
-    execution_id = Column(UUIDType(binary=False), primary_key=True)
-    action_id = Column(UUIDType(binary=False), nullable=False)
+    execution_id = Column(StatusUUIDType(), primary_key=True)
+    action_id = Column(StatusUUIDType(), nullable=False)
     name = Column(String, nullable=False)
     app_name = Column(String, nullable=False)
     action_name = Column(String, nullable=False)
@@ -124,7 +143,8 @@ class ActionStatus(Execution_Base):
     status = Column(Enum(ActionStatusEnum, name='ActionStatusEnum'), nullable=False)
     started_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime)
-    _workflow_status_id = Column(UUIDType(binary=False), ForeignKey('workflow_status.execution_id'))
+    _workflow_status_id = Column(StatusUUIDType(), ForeignKey('workflow_status.execution_id'))
+    __table_args__ = (Index('ix_action_status_workflow_status_id_started_at', '_workflow_status_id', 'started_at'),)
 
     def __init__(self, execution_id, action_id, name, app_name, action_name, arguments=None):
         self.execution_id = execution_id
@@ -1,3 +1,4 @@
+import base64
 import importlib
 import json
 import logging
@@ -5,7 +6,9 @@ import os
 import pkgutil
 import sys
 import warnings
+from contextlib import contextmanager
 from datetime import datetime
+from timeit import default_timer
 from uuid import uuid4
 
 try:
@@ -23,6 +26,11 @@ else:
 
 logger = logging.getLogger(__name__)
 
+_replace = getattr(os, 'replace', os.rename)
+
+query_timestamp_formats = ('%Y-%m-%dT%H:%M:%S.%fZ', '%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%d')
+"""(tuple(str)): The formats accepted for timestamps in query parameters, most precise first"""
+
 
 def __list_valid_directories(path):
     try:
@@ -257,8 +265,113 @@ def timestamp_to_datetime(time):
     return datetime.strptime(time, '%Y-%m-%dT%H:%M:%S.%fZ')
 
 
+def parse_query_timestamp(value, name):
+    """Parses a timestamp given in a query parameter
+
+    Args:
+        value (str): The timestamp, formatted as YYYY-MM-DDTHH:MM:SS.ffffffZ, YYYY-MM-DDTHH:MM:SSZ, or YYYY-MM-DD
+        name (str): The name of the query parameter, used in the error message
+
+    Returns:
+        (datetime): The timestamp
+
+    Raises:
+        ValueError: If the timestamp is not in one of the accepted formats
+    """
+    for timestamp_format in query_timestamp_formats:
+        try:
+            return datetime.strptime(value, timestamp_format)
+        except ValueError:
+            pass
+    raise ValueError('{} must be a timestamp formatted as YYYY-MM-DDTHH:MM:SS.ffffffZ or a date'.format(name))
+
+
+def encode_cursor(position):
+    """Encodes the position of an element in a list read a page at a time as an opaque cursor
+
+    Args:
+        position (dict): The JSON-serializable position of the element
+
+    Returns:
+        (str): The cursor
+    """
+    return base64.urlsafe_b64encode(json.dumps(position).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """Decodes a cursor created by encode_cursor
+
+    Args:
+        cursor (str): The cursor
+
+    Returns:
+        (dict): The position of the element, or None if there is no cursor
+
+    Raises:
+        ValueError: If the cursor is not a valid cursor
+    """
+    if not cursor:
+        return None
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(position, dict):
+        raise ValueError('Invalid cursor')
+    return position
+
+
 def json_dumps_or_string(val):
     try:
         return json.dumps(val)
     except (ValueError, TypeError):
         return str(val)
+
+
+def write_json_atomically(path, value):
+    """Writes a value to a JSON file by writing it to a temporary file and renaming it over the file, so that readers
+        never see a partially written file
+
+    Args:
+        path (str): The path of the file
+        value: The JSON-serializable value to write
+
+    Raises:
+        IOError, OSError: If the file could not be written
+    """
+    temp_path = '{0}.{1}'.format(path, os.getpid())
+    with open(temp_path, 'w') as json_file:
+        json.dump(value, json_file)
+    _replace(temp_path, path)
+
+
+class PhaseTimer(object):
+    def __init__(self):
+        """Records the wall time taken by each phase of a process, such as startup"""
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name):
+        """Times the enclosed block as a phase
+
+        Args:
+            name (str): The name of the phase
+        """
+        start = default_timer()
+        try:
+            yield
+        finally:
+            self.phases.append((name, default_timer() - start))
+
+    @property
+    def total(self):
+        """The total time of all the phases, in seconds"""
+        return sum(duration for _, duration in self.phases)
+
+    def format(self):
+        """Formats the phases as a single line for logging
+
+        Returns:
+            (str): The time of each phase, in the order they were run
+        """
+        return ', '.join('{0}: {1:.3f}s'.format(name, duration) for name, duration in self.phases)
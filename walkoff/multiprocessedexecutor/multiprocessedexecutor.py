@@ -13,19 +13,32 @@ import walkoff.config
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import ExecutionDatabase
 from walkoff.executiondb import WorkflowStatusEnum
+from walkoff.executiondb.loadoptions import workflow_load_options
 from walkoff.executiondb.saved_workflow import SavedWorkflow
 from walkoff.executiondb.workflow import Workflow
 from walkoff.executiondb.workflowresults import WorkflowStatus
 from walkoff.multiprocessedexecutor.threadauthenticator import ThreadAuthenticator
 from walkoff.multiprocessedexecutor.worker import Worker
+from walkoff.multiprocessedexecutor.workerlauncher import run_worker_launcher
 from walkoff.multiprocessedexecutor.workflowexecutioncontroller import WorkflowExecutionController, Receiver
 
 logger = logging.getLogger(__name__)
 
 
 def spawn_worker_processes():
-    """Initialize the multiprocessing pool, allowing for parallel execution of workflows.
+    """Initialize the multiprocessing pool, allowing for parallel execution of workflows. Where fork is available, the
+        workers are forked from a single warmed-up launcher process which also replaces any workers that crash.
+
+    Returns:
+        (list[Process]): The spawned processes
     """
+    if hasattr(os, 'fork'):
+        launcher = multiprocessing.Process(
+            target=run_worker_launcher,
+            args=(walkoff.config.Config.NUMBER_PROCESSES, walkoff.config.Config.CONFIG_PATH))
+        launcher.daemon = True
+        launcher.start()
+        return [launcher]
     pids = []
     for i in range(walkoff.config.Config.NUMBER_PROCESSES):
         pid = multiprocessing.Process(target=Worker, args=(i, walkoff.config.Config.CONFIG_PATH))
@@ -264,7 +277,7 @@ class MultiprocessedExecutor(object):
         logger.info('Resuming workflow {} from trigger'.format(execution_id))
         saved_state = self.execution_db.session.query(SavedWorkflow).filter_by(
             workflow_execution_id=execution_id).first()
-        workflow = self.execution_db.session.query(Workflow).filter_by(
+        workflow = self.execution_db.session.query(Workflow).options(*workflow_load_options()).filter_by(
             id=saved_state.workflow_id).first()
         workflow._execution_id = execution_id
 
@@ -302,9 +315,9 @@ class MultiprocessedExecutor(object):
             (list[UUID]): A list of execution IDs of workflows currently awaiting data to be sent to a trigger.
         """
         self.execution_db.session.expire_all()
-        wf_statuses = self.execution_db.session.query(WorkflowStatus).filter_by(
+        execution_ids = self.execution_db.session.query(WorkflowStatus.execution_id).filter_by(
             status=WorkflowStatusEnum.awaiting_data).all()
-        return [str(wf_status.execution_id) for wf_status in wf_statuses]
+        return [str(execution_id) for execution_id, in execution_ids]
 
     def get_workflow_status(self, execution_id):
         """Gets the current status of a workflow by its execution ID
@@ -24,16 +24,19 @@ from walkoff.appgateway.appinstancerepo import AppInstanceRepo
 from walkoff.case.database import CaseDatabase
 from walkoff.case.logger import CaseLogger
 from walkoff.case.subscription import Subscription, SubscriptionCache
+from walkoff.case.writer import make_case_event_writer
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import ExecutionDatabase
 from walkoff.executiondb.argument import Argument
 from walkoff.executiondb.environment_variable import EnvironmentVariable
+from walkoff.executiondb.loadoptions import workflow_load_options
 from walkoff.executiondb.saved_workflow import SavedWorkflow
 from walkoff.executiondb.workflow import Workflow
 from walkoff.multiprocessedexecutor.proto_helpers import convert_to_protobuf
 from walkoff.proto.build.data_pb2 import CommunicationPacket, ExecuteWorkflowMessage, CaseControl, \
     WorkflowControl
 from walkoff.executiondb.workflowresults import WorkflowStatus, WorkflowStatusEnum
+from walkoff.helpers import PhaseTimer
 
 logger = logging.getLogger(__name__)
 
@@ -209,6 +212,9 @@ class WorkflowCommunicationReceiver(object):
 
 
 class WorkflowReceiver(object):
+    request_timeout = 1
+    """(int): The number of seconds to wait for a workflow request before yielding None"""
+
     def __init__(self, key, server_key, cache_config):
         """Initializes a WorkflowReceiver object, which receives workflow execution requests and ships them off to a
             worker to execute
@@ -235,7 +241,7 @@ class WorkflowReceiver(object):
         logger.info('Starting workflow receiver')
         box = Box(self.key, self.server_key)
         while not self.exit:
-            received_message = self.cache.rpop("request_queue")
+            received_message = self.cache.brpop("request_queue", timeout=self.request_timeout)
             if received_message is not None:
                 try:
                     decrypted_msg = box.decrypt(received_message)
@@ -269,28 +275,52 @@ class WorkflowReceiver(object):
         raise StopIteration
 
 
+WorkerKeys = namedtuple('WorkerKeys', ['server_public', 'server_secret', 'client_public', 'client_secret'])
+
+
+def load_worker_keys():
+    """Loads the ZMQ certificates used by the workers
+
+    Returns:
+        (WorkerKeys): The public and secret keys of the server and the client
+    """
+    server_secret_file = os.path.join(walkoff.config.Config.ZMQ_PRIVATE_KEYS_PATH, "server.key_secret")
+    server_public, server_secret = auth.load_certificate(server_secret_file)
+    client_secret_file = os.path.join(walkoff.config.Config.ZMQ_PRIVATE_KEYS_PATH, "client.key_secret")
+    client_public, client_secret = auth.load_certificate(client_secret_file)
+    return WorkerKeys(server_public, server_secret, client_public, client_secret)
+
+
 class Worker(object):
-    def __init__(self, id_, config_path):
+    def __init__(self, id_, config_path, keys=None):
         """Initialize a Workfer object, which will be managing the execution of Workflows
 
         Args:
             id_ (str): The ID of the worker
             config_path (str): The path to the configuration file to be loaded
+            keys (WorkerKeys, optional): The ZMQ certificates, if they have already been loaded by the parent process.
+                Defaults to None, in which case they are loaded from disk.
         """
         logger.info('Spawning worker {}'.format(id_))
+        timer = PhaseTimer()
         self.id_ = id_
         self._lock = Lock()
         signal.signal(signal.SIGINT, self.exit_handler)
         signal.signal(signal.SIGABRT, self.exit_handler)
 
-        if os.name == 'nt':
-            walkoff.config.initialize(config_path=config_path)
-        else:
-            walkoff.config.Config.load_config(config_path)
+        with timer.phase('config'):
+            if os.name == 'nt':
+                walkoff.config.initialize(config_path=config_path)
+            else:
+                walkoff.config.Config.load_config(config_path)
 
-        self.execution_db = ExecutionDatabase(walkoff.config.Config.EXECUTION_DB_TYPE,
-                                              walkoff.config.Config.EXECUTION_DB_PATH)
-        self.case_db = CaseDatabase(walkoff.config.Config.CASE_DB_TYPE, walkoff.config.Config.CASE_DB_PATH)
+        with timer.phase('databases'):
+            self.execution_db = ExecutionDatabase(walkoff.config.Config.EXECUTION_DB_TYPE,
+                                                  walkoff.config.Config.EXECUTION_DB_PATH,
+                                                  walkoff.config.Config.EXECUTION_DB_POOL,
+                                                  walkoff.config.Config.EXECUTION_DB_SQLITE_PRAGMAS,
+                                                  walkoff.config.Config.EXECUTION_DB_BINARY_UUIDS)
+            self.case_db = CaseDatabase(walkoff.config.Config.CASE_DB_TYPE, walkoff.config.Config.CASE_DB_PATH)
 
         @WalkoffEvent.CommonWorkflowSignal.connect
         def handle_data_sent(sender, **kwargs):
@@ -300,40 +330,43 @@ class Worker(object):
 
         self.thread_exit = False
 
-        server_secret_file = os.path.join(walkoff.config.Config.ZMQ_PRIVATE_KEYS_PATH, "server.key_secret")
-        server_public, server_secret = auth.load_certificate(server_secret_file)
-        client_secret_file = os.path.join(walkoff.config.Config.ZMQ_PRIVATE_KEYS_PATH, "client.key_secret")
-        client_public, client_secret = auth.load_certificate(client_secret_file)
+        with timer.phase('keys'):
+            if keys is None:
+                keys = load_worker_keys()
+            server_public, server_secret, client_public, client_secret = keys
 
-        socket_id = u"Worker-{}".format(id_).encode("ascii")
+            socket_id = u"Worker-{}".format(id_).encode("ascii")
 
-        key = PrivateKey(client_secret[:nacl.bindings.crypto_box_SECRETKEYBYTES])
-        server_key = PrivateKey(server_secret[:nacl.bindings.crypto_box_SECRETKEYBYTES]).public_key
+            key = PrivateKey(client_secret[:nacl.bindings.crypto_box_SECRETKEYBYTES])
+            server_key = PrivateKey(server_secret[:nacl.bindings.crypto_box_SECRETKEYBYTES]).public_key
 
-        self.cache = walkoff.cache.make_cache(walkoff.config.Config.CACHE)
+        with timer.phase('cache'):
+            self.cache = walkoff.cache.make_cache(walkoff.config.Config.CACHE)
 
         self.capacity = walkoff.config.Config.NUMBER_THREADS_PER_PROCESS
         self.subscription_cache = SubscriptionCache()
 
-        case_logger = CaseLogger(self.case_db, self.subscription_cache)
+        self.case_event_writer = make_case_event_writer(self.case_db, walkoff.config.Config.CASE_EVENT_WRITER)
+        case_logger = CaseLogger(self.case_db, self.subscription_cache, self.case_event_writer)
 
-        self.workflow_receiver = WorkflowReceiver(key, server_key, walkoff.config.Config.CACHE)
+        with timer.phase('sockets'):
+            self.workflow_receiver = WorkflowReceiver(key, server_key, walkoff.config.Config.CACHE)
 
-        self.workflow_results_sender = WorkflowResultsHandler(
-            socket_id,
-            client_secret,
-            client_public,
-            server_public,
-            walkoff.config.Config.ZMQ_RESULTS_ADDRESS,
-            self.execution_db,
-            case_logger)
+            self.workflow_results_sender = WorkflowResultsHandler(
+                socket_id,
+                client_secret,
+                client_public,
+                server_public,
+                walkoff.config.Config.ZMQ_RESULTS_ADDRESS,
+                self.execution_db,
+                case_logger)
 
-        self.workflow_communication_receiver = WorkflowCommunicationReceiver(
-            socket_id,
-            client_secret,
-            client_public,
-            server_public,
-            walkoff.config.Config.ZMQ_COMMUNICATION_ADDRESS)
+            self.workflow_communication_receiver = WorkflowCommunicationReceiver(
+                socket_id,
+                client_secret,
+                client_public,
+                server_public,
+                walkoff.config.Config.ZMQ_COMMUNICATION_ADDRESS)
 
         self.comm_thread = threading.Thread(target=self.receive_communications)
 
@@ -342,6 +375,7 @@ class Worker(object):
         self.workflows = {}
         self.threadpool = ThreadPoolExecutor(max_workers=self.capacity)
 
+        logger.info('Worker {0} started in {1:.3f}s ({2})'.format(id_, timer.total, timer.format()))
         self.receive_workflows()
 
     def exit_handler(self, signum, frame):
@@ -354,6 +388,8 @@ class Worker(object):
         self.workflow_communication_receiver.shutdown()
         if self.comm_thread:
             self.comm_thread.join(timeout=2)
+        if self.case_event_writer:
+            self.case_event_writer.stop()
         self.workflow_results_sender.shutdown()
         os._exit(0)
 
@@ -365,7 +401,8 @@ class Worker(object):
                 workflow_data = next(workflow_generator)
                 if workflow_data is not None:
                     self.threadpool.submit(self.execute_workflow_worker, *workflow_data)
-            time.sleep(0.1)
+            else:
+                time.sleep(0.1)
 
     @property
     def __is_pool_at_capacity(self):
@@ -392,7 +429,8 @@ class Worker(object):
         if workflow_status.status == WorkflowStatusEnum.aborted:
             return
 
-        workflow = self.execution_db.session.query(Workflow).filter_by(id=workflow_id).first()
+        workflow = self.execution_db.session.query(Workflow).options(*workflow_load_options()).filter_by(
+            id=workflow_id).first()
         workflow._execution_id = workflow_execution_id
         if resume:
             saved_state = self.execution_db.session.query(SavedWorkflow).filter_by(
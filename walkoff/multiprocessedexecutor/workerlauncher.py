@@ -0,0 +1,149 @@
+import logging
+import os
+import signal
+import time
+
+import walkoff.config
+from walkoff.helpers import PhaseTimer
+from walkoff.multiprocessedexecutor.worker import Worker, load_worker_keys
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerLauncher(object):
+    # Workers which exit sooner than this after being forked are respawned after a delay of the same length
+    min_worker_lifetime = 1.
+    # Workers which have not exited this long after being signaled to shut down are killed. This must be shorter than
+    # the time the executor waits for the launcher to exit before killing it.
+    shutdown_timeout = 2.
+    # How often the launcher checks if a Worker or the launcher's parent process has exited
+    poll_interval = 0.5
+
+    def __init__(self, number_processes, config_path, worker=Worker):
+        """A fork-server style launcher for Workers. It is run in its own process, where it loads the configuration,
+            apps, app APIs, and ZMQ certificates once, and then forks each Worker from this warmed template. Workers
+            which crash are replaced by forking the template again.
+
+        Args:
+            number_processes (int): The number of Workers to run
+            config_path (str): The path to the configuration file
+            worker (cls, optional): The Worker class to run in each forked process. Defaults to Worker.
+        """
+        self.number_processes = number_processes
+        self.config_path = config_path
+        self.worker = worker
+        self.keys = None
+        self.workers = {}
+        self._is_exiting = False
+        self._parent_pid = os.getppid()
+
+    def run(self):
+        """Warms up the template, forks the Workers, and respawns them if they exit until the launcher is signaled to
+            exit
+        """
+        signal.signal(signal.SIGINT, self.exit_handler)
+        signal.signal(signal.SIGABRT, self.exit_handler)
+        signal.signal(signal.SIGTERM, self.exit_handler)
+        self.warm_up()
+        for id_ in range(self.number_processes):
+            self.fork_worker(id_)
+        self.supervise()
+
+    def warm_up(self):
+        """Loads everything a Worker needs which can be shared between the forked processes"""
+        timer = PhaseTimer()
+        with timer.phase('config'):
+            walkoff.config.Config.load_config(self.config_path)
+        with timer.phase('apps'):
+            if not walkoff.config.app_apis:
+                walkoff.config.initialize(self.config_path)
+        with timer.phase('keys'):
+            self.keys = load_worker_keys()
+        logger.info('Worker template warmed up in {0:.3f}s ({1})'.format(timer.total, timer.format()))
+
+    def fork_worker(self, id_):
+        """Forks a Worker from the template
+
+        Args:
+            id_ (int): The ID of the Worker
+
+        Returns:
+            (int): The PID of the Worker
+        """
+        pid = os.fork()
+        if pid == 0:
+            for signal_number in (signal.SIGINT, signal.SIGABRT, signal.SIGTERM):
+                signal.signal(signal_number, signal.SIG_DFL)
+            try:
+                self.worker(id_, self.config_path, keys=self.keys)
+            except Exception:
+                logger.exception('Worker {} exited with an error'.format(id_))
+                os._exit(1)
+            os._exit(0)
+        self.workers[pid] = (id_, time.time())
+        logger.info('Forked worker {0} (pid={1})'.format(id_, pid))
+        return pid
+
+    def supervise(self):
+        """Waits for Workers to exit and replaces those which did not exit cleanly. Returns once every Worker has
+            exited cleanly. If the process which started the launcher exits, the Workers are shut down.
+        """
+        while self.workers and not self._is_exiting:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except OSError:
+                return
+            if pid == 0:
+                if os.getppid() != self._parent_pid:
+                    logger.error('Worker launcher parent process exited. Shutting down workers')
+                    self.exit_handler(signal.SIGTERM, None)
+                time.sleep(self.poll_interval)
+                continue
+            if pid not in self.workers or self._is_exiting:
+                continue
+            id_, started = self.workers.pop(pid)
+            if status == 0:
+                logger.info('Worker {0} (pid={1}) exited'.format(id_, pid))
+                continue
+            lifetime = time.time() - started
+            logger.error('Worker {0} (pid={1}) exited with status {2} after {3:.1f}s. Respawning'.format(
+                id_, pid, status, lifetime))
+            if lifetime < self.min_worker_lifetime:
+                time.sleep(self.min_worker_lifetime)
+            self.fork_worker(id_)
+
+    def exit_handler(self, signum, frame):
+        """Shuts down all the Workers upon receiving a SIGINT, SIGABRT, or SIGTERM"""
+        logger.info('Worker launcher received exit signal {}'.format(signum))
+        self._is_exiting = True
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGABRT)
+            except OSError:
+                pass
+        deadline = time.time() + self.shutdown_timeout
+        while self.workers and time.time() < deadline:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except OSError:
+                break
+            if pid:
+                self.workers.pop(pid, None)
+            else:
+                time.sleep(0.05)
+        for pid in self.workers:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+        os._exit(0)
+
+
+def run_worker_launcher(number_processes, config_path):
+    """Runs a WorkerLauncher. This is the target of the launcher's process.
+
+    Args:
+        number_processes (int): The number of Workers to run
+        config_path (str): The path to the configuration file
+    """
+    WorkerLauncher(number_processes, config_path).run()
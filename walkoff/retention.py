@@ -0,0 +1,406 @@
+import gzip
+import json
+import logging
+import os
+import re
+from datetime import datetime, timedelta
+from itertools import islice
+
+import gevent
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, subqueryload
+
+from walkoff.case.database import Event, _CaseEventLink
+from walkoff.executiondb import ActionStatusEnum, WorkflowStatusEnum
+from walkoff.executiondb.workflowresults import ActionStatus, WorkflowStatus
+
+logger = logging.getLogger(__name__)
+
+partition_date_format = '%Y-%m-%d'
+_partition_file_regex = re.compile(r'^(\d{4}-\d{2}-\d{2})\.ndjson\.gz$')
+
+
+class InvalidRetentionPolicy(Exception):
+    pass
+
+
+class RetentionPolicy(object):
+    def __init__(self, max_age_days=None, max_count=None, statuses=None):
+        """A policy describing which rows of a table have expired. A row expires once it is older than max_age_days or
+            once there are more than max_count newer rows. Only rows in one of the given statuses ever expire.
+
+        Args:
+            max_age_days (int|float, optional): The number of days after which a row expires. Defaults to None, meaning
+                rows do not expire because of their age.
+            max_count (int, optional): The number of rows to keep. Defaults to None, meaning rows do not expire because
+                of the number of rows.
+            statuses (list[str], optional): The names of the statuses of the rows which may expire. Defaults to the
+                finished statuses of the table.
+        """
+        if max_age_days is not None and max_age_days < 0:
+            raise InvalidRetentionPolicy('max_age_days must not be negative')
+        if max_count is not None and max_count < 0:
+            raise InvalidRetentionPolicy('max_count must not be negative')
+        self.max_age_days = max_age_days
+        self.max_count = max_count
+        self.statuses = statuses
+
+    @classmethod
+    def from_json(cls, json_in):
+        """Constructs a RetentionPolicy from its JSON representation in the configuration
+
+        Args:
+            json_in (dict): The JSON representation of the policy
+
+        Returns:
+            (RetentionPolicy): The policy
+        """
+        try:
+            return cls(**json_in)
+        except TypeError:
+            raise InvalidRetentionPolicy('Unknown retention policy options in {}'.format(json_in))
+
+    @property
+    def is_enabled(self):
+        return self.max_age_days is not None or self.max_count is not None
+
+
+class Archive(object):
+    def __init__(self, path):
+        """A directory of archived rows. The rows of each table are stored as gzipped newline-delimited JSON, in one
+            file per day, named <path>/<table>/<YYYY-MM-DD>.ndjson.gz. Each write appends a new gzip member to the
+            file, so existing data is never rewritten.
+
+        Args:
+            path (str): The path to the archive directory
+        """
+        self.path = path
+
+    def _partition_path(self, table, date):
+        return os.path.join(self.path, table, '{}.ndjson.gz'.format(date.strftime(partition_date_format)))
+
+    def write(self, table, records):
+        """Appends records to the archive
+
+        Args:
+            table (str): The name of the table the records are from
+            records (list[tuple(datetime, dict)]): The date used to partition each record and its JSON representation
+        """
+        partitions = {}
+        for timestamp, record in records:
+            partitions.setdefault(timestamp.date(), []).append(record)
+        table_path = os.path.join(self.path, table)
+        if not os.path.isdir(table_path):
+            os.makedirs(table_path)
+        for date, partition_records in partitions.items():
+            lines = ''.join(json.dumps(record, sort_keys=True) + '\n' for record in partition_records)
+            with gzip.open(self._partition_path(table, date), 'ab') as archive_file:
+                archive_file.write(lines.encode('utf-8'))
+
+    def list_partitions(self, table=None):
+        """Lists the files in the archive
+
+        Args:
+            table (str, optional): Only list the files of this table. Defaults to None, meaning every table is listed.
+
+        Returns:
+            (list[dict]): The table, date, and size in bytes of each file, ordered by table and date
+        """
+        if not os.path.isdir(self.path):
+            return []
+        tables = [table] if table is not None else sorted(os.listdir(self.path))
+        partitions = []
+        for table_name in tables:
+            table_path = os.path.join(self.path, table_name)
+            if not os.path.isdir(table_path):
+                continue
+            for file_name in sorted(os.listdir(table_path)):
+                match = _partition_file_regex.match(file_name)
+                if match:
+                    partitions.append({'table': table_name,
+                                       'date': match.group(1),
+                                       'size': os.path.getsize(os.path.join(table_path, file_name))})
+        return partitions
+
+    def read(self, table, start_date=None, end_date=None):
+        """Reads the records of a table in a range of dates
+
+        Args:
+            table (str): The name of the table
+            start_date (date, optional): The first date to read, inclusive. Defaults to the first date in the archive.
+            end_date (date, optional): The last date to read, inclusive. Defaults to the last date in the archive.
+
+        Yields:
+            (dict): The records, ordered by date and then by the order in which they were archived
+        """
+        for partition in self.list_partitions(table):
+            date = datetime.strptime(partition['date'], partition_date_format).date()
+            if (start_date is not None and date < start_date) or (end_date is not None and date > end_date):
+                continue
+            with gzip.open(self._partition_path(table, date), 'rb') as archive_file:
+                try:
+                    for line in archive_file:
+                        yield json.loads(line.decode('utf-8'))
+                except EOFError:
+                    # The last member is still being written
+                    pass
+
+    def query(self, table, start_date=None, end_date=None, offset=0, limit=None):
+        """Gets a page of the records of a table in a range of dates
+
+        Args:
+            table (str): The name of the table
+            start_date (date, optional): The first date to read, inclusive. Defaults to None.
+            end_date (date, optional): The last date to read, inclusive. Defaults to None.
+            offset (int, optional): The number of records to skip. Defaults to 0.
+            limit (int, optional): The maximum number of records to return. Defaults to None, meaning all of them.
+
+        Returns:
+            (list[dict]): The records
+        """
+        stop = offset + limit if limit is not None else None
+        return list(islice(self.read(table, start_date, end_date), offset, stop))
+
+
+class ArchivedTable(object):
+    name = None
+    model = None
+    # The names of the columns holding the primary key, the time used to determine the age of a row and the date of its
+    # archive file, the order in which rows are archived and counted, and the status of a row
+    id_key = None
+    age_key = None
+    order_key = None
+    status_key = None
+    status_enum = None
+    default_statuses = ()
+
+    def __init__(self, database):
+        """A table whose expired rows are moved to the archive
+
+        Args:
+            database (ExecutionDatabase|CaseDatabase): The database containing the table
+        """
+        self.database = database
+
+    def column(self, key):
+        return getattr(self.model, key)
+
+    def get_statuses(self, policy):
+        if self.status_key is None:
+            return None
+        names = policy.statuses if policy.statuses is not None else self.default_statuses
+        try:
+            return [self.status_enum[name] for name in names]
+        except KeyError as e:
+            raise InvalidRetentionPolicy('Unknown {0} status {1}'.format(self.name, e))
+
+    def expired_filters(self, session, policy, now):
+        """Gets the filters which select the expired rows of the table
+
+        Args:
+            session (Session): The session to use
+            policy (RetentionPolicy): The policy of the table
+            now (datetime): The current time
+
+        Returns:
+            (list): The filters, or None if no rows have expired
+        """
+        age_column = self.column(self.age_key)
+        order_column = self.column(self.order_key)
+        filters = [age_column.isnot(None)]
+        statuses = self.get_statuses(policy)
+        if statuses is not None:
+            filters.append(self.column(self.status_key).in_(statuses))
+
+        age_cutoff = count_cutoff = None
+        if policy.max_age_days is not None:
+            age_cutoff = now - timedelta(days=policy.max_age_days)
+        if policy.max_count is not None:
+            count_cutoff = session.query(order_column).filter(*filters).order_by(order_column.desc()). \
+                offset(policy.max_count).limit(1).scalar()
+
+        if age_cutoff is not None and count_cutoff is not None:
+            if self.age_key == self.order_key:
+                filters.append(age_column <= max(age_cutoff, count_cutoff))
+            else:
+                filters.append(or_(age_column <= age_cutoff, order_column <= count_cutoff))
+        elif age_cutoff is not None:
+            filters.append(age_column <= age_cutoff)
+        elif count_cutoff is not None:
+            filters.append(order_column <= count_cutoff)
+        else:
+            return None
+        return filters
+
+    def query_batch(self, session, filters, batch_size):
+        return session.query(self.model).filter(*filters).order_by(self.column(self.order_key)).limit(batch_size)
+
+    def as_record(self, row):
+        return row.as_json()
+
+    def delete(self, session, ids):
+        session.query(self.model).filter(self.column(self.id_key).in_(ids)).delete(synchronize_session=False)
+
+
+class WorkflowStatusTable(ArchivedTable):
+    """Workflow statuses are archived along with all of their action statuses"""
+    name = 'workflow_status'
+    model = WorkflowStatus
+    id_key = 'execution_id'
+    age_key = order_key = 'completed_at'
+    status_key = 'status'
+    status_enum = WorkflowStatusEnum
+    default_statuses = ('completed', 'aborted')
+
+    def query_batch(self, session, filters, batch_size):
+        return super(WorkflowStatusTable, self).query_batch(session, filters, batch_size). \
+            options(subqueryload(WorkflowStatus._action_statuses))
+
+    def as_record(self, row):
+        return row.as_json(full_actions=True)
+
+    def delete(self, session, ids):
+        session.query(ActionStatus).filter(ActionStatus._workflow_status_id.in_(ids)). \
+            delete(synchronize_session=False)
+        super(WorkflowStatusTable, self).delete(session, ids)
+
+
+class ActionStatusTable(ArchivedTable):
+    """Archiving action statuses compacts the workflow statuses which are kept by dropping the results and arguments of
+        their older actions
+    """
+    name = 'action_status'
+    model = ActionStatus
+    id_key = 'execution_id'
+    age_key = order_key = 'completed_at'
+    status_key = 'status'
+    status_enum = ActionStatusEnum
+    default_statuses = ('success', 'failure')
+
+    def as_record(self, row):
+        record = row.as_json()
+        record['workflow_execution_id'] = str(row._workflow_status_id)
+        return record
+
+
+class EventTable(ArchivedTable):
+    """Case events are archived along with their cases"""
+    name = 'event'
+    model = Event
+    id_key = order_key = 'id'
+    age_key = 'timestamp'
+
+    def as_record(self, row):
+        return row.as_json(with_cases=True)
+
+    def delete(self, session, ids):
+        session.query(_CaseEventLink).filter(_CaseEventLink.event_id.in_(ids)).delete(synchronize_session=False)
+        super(EventTable, self).delete(session, ids)
+
+
+class RetentionManager(object):
+    def __init__(self, execution_db, case_db, archive, policies=None, batch_size=1000, interval=3600):
+        """Enforces the retention policies of the workflow status, action status, and case event tables by moving their
+            expired rows to the archive. Rows are archived in batches, each of which is written to the archive and then
+            deleted in its own short transaction, so the tables are never locked for long. A batch which is archived
+            but fails to be deleted is archived again on the next pass.
+
+        Args:
+            execution_db (ExecutionDatabase): The execution database
+            case_db (CaseDatabase): The case database
+            archive (Archive): The archive to move expired rows to
+            policies (dict, optional): The JSON representation of the RetentionPolicy of each table, keyed by the name
+                of the table. Defaults to None, meaning nothing is archived.
+            batch_size (int, optional): The maximum number of rows to archive in one transaction. Defaults to 1000.
+            interval (int|float, optional): The number of seconds between passes of the background job. Defaults to
+                3600.
+        """
+        self.archive = archive
+        self.batch_size = batch_size
+        self.interval = interval
+        self.tables = [WorkflowStatusTable(execution_db), ActionStatusTable(execution_db), EventTable(case_db)]
+        self.policies = {}
+        for table_name, policy in (policies or {}).items():
+            if table_name not in self.table_names:
+                raise InvalidRetentionPolicy('Unknown retention table {}'.format(table_name))
+            self.policies[table_name] = RetentionPolicy.from_json(policy)
+        self._greenlet = None
+
+    @property
+    def table_names(self):
+        return [table.name for table in self.tables]
+
+    @property
+    def is_enabled(self):
+        return any(policy.is_enabled for policy in self.policies.values())
+
+    def enforce(self, now=None):
+        """Archives the expired rows of every table which has a policy
+
+        Args:
+            now (datetime, optional): The current time. Defaults to the current UTC time.
+
+        Returns:
+            (dict): The number of rows archived from each table
+        """
+        now = now or datetime.utcnow()
+        archived = {}
+        for table in self.tables:
+            policy = self.policies.get(table.name)
+            if policy is not None and policy.is_enabled:
+                archived[table.name] = self.enforce_table(table, policy, now)
+        return archived
+
+    def enforce_table(self, table, policy, now):
+        """Archives the expired rows of a table
+
+        Args:
+            table (ArchivedTable): The table
+            policy (RetentionPolicy): The policy of the table
+            now (datetime): The current time
+
+        Returns:
+            (int): The number of rows archived
+        """
+        session = Session(bind=table.database.engine)
+        archived = 0
+        try:
+            filters = table.expired_filters(session, policy, now)
+            session.commit()
+            while filters is not None:
+                rows = table.query_batch(session, filters, self.batch_size).all()
+                if not rows:
+                    break
+                self.archive.write(table.name, [(getattr(row, table.age_key), table.as_record(row)) for row in rows])
+                table.delete(session, [getattr(row, table.id_key) for row in rows])
+                session.commit()
+                session.expunge_all()
+                archived += len(rows)
+                gevent.sleep(0)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        if archived:
+            logger.info('Archived {0} rows from {1}'.format(archived, table.name))
+        return archived
+
+    def start(self):
+        """Starts the background job which enforces the retention policies every interval"""
+        if self.is_enabled and self._greenlet is None:
+            self._greenlet = gevent.spawn(self._run)
+
+    def stop(self):
+        """Stops the background job"""
+        if self._greenlet is not None:
+            self._greenlet.kill()
+            self._greenlet = None
+
+    def _run(self):
+        while True:
+            try:
+                self.enforce()
+            except Exception:
+                logger.exception('Could not enforce retention policies')
+            gevent.sleep(self.interval)
@@ -9,7 +9,8 @@ from walkoff.sse import FilteredSseStream, StreamableBlueprint
 from walkoff.server.problem import Problem
 from walkoff.server.returncodes import BAD_REQUEST
 
-console_stream = FilteredSseStream('console_results')
+# Every log line is distinct, so none of them are coalesced and a full queue drops the oldest ones instead
+console_stream = FilteredSseStream('console_results', coalesce_key=lambda serialized: None)
 console_page = StreamableBlueprint('console_page', __name__, streams=(console_stream,))
 
 
@@ -5,9 +5,9 @@ from flask_jwt_extended import get_jwt_identity
 
 from walkoff.messaging import MessageActionEvent
 from walkoff.security import jwt_required_in_query
-from walkoff.sse import FilteredSseStream, StreamableBlueprint
+from walkoff.sse import FilteredSseStream, StreamableBlueprint, get_event_and_fields
 
-sse_stream = FilteredSseStream('notifications')
+sse_stream = FilteredSseStream('notifications', coalesce_key=get_event_and_fields('id', 'username'))
 
 notifications_page = StreamableBlueprint('notifications_page', __name__, streams=[sse_stream])
 
@@ -1,30 +1,128 @@
+import json
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from enum import Enum, unique
 from uuid import UUID
 
 from flask import current_app, request
+from six import string_types
 
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import ActionStatusEnum, WorkflowStatusEnum
 from walkoff.executiondb.workflowresults import WorkflowStatus
 from walkoff.helpers import convert_action_argument, utc_as_rfc_datetime
 from walkoff.security import jwt_required_in_query
-from walkoff.sse import FilteredSseStream, StreamableBlueprint
+from walkoff.sse import FilteredSseStream, SerializedJson, SnapshotSseStream, StreamableBlueprint, get_event_and_fields
 from walkoff.server.problem import Problem
 from walkoff.server.returncodes import BAD_REQUEST
 
-workflow_stream = FilteredSseStream('workflow_results')
-action_stream = FilteredSseStream('action_results')
-action_summary_stream = FilteredSseStream('action_results_summary')
+action_summary_keys = ('action_name', 'app_name', 'action_id', 'name', 'timestamp', 'workflow_execution_id')
+
+# The bounds of the number of seconds between the snapshots of the action stream
+min_snapshot_interval = 0.1
+max_snapshot_interval = 60
+
+
+class ActionSnapshots(object):
+    """A summary of the actions of each workflow execution, kept for the snapshot mode of the action stream
+
+    The summary of an execution holds its current action, the number of actions which have reached each status, and its
+    last failed action. Each change increments the version of the summaries, so a snapshot can contain only the
+    executions which changed since the last one.
+
+    Attributes:
+        max_executions (int): The number of executions kept. The executions updated least recently are dropped first.
+        version (int): The version of the summaries
+
+    Args:
+        max_executions (int, optional): The number of executions kept. Defaults to 10000.
+    """
+
+    def __init__(self, max_executions=10000):
+        self.max_executions = max_executions
+        self.version = 0
+        self._executions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _update_execution(self, execution_id):
+        self.version += 1
+        _, entry = self._executions.pop(execution_id, (None, None))
+        if entry is None:
+            entry = {'workflow_execution_id': execution_id,
+                     'current_action': None,
+                     'counts': {status.name: 0 for status in ActionStatusEnum},
+                     'last_error': None,
+                     'completed': False}
+            while len(self._executions) >= self.max_executions:
+                self._executions.popitem(last=False)
+        self._executions[execution_id] = (self.version, entry)
+        return entry
+
+    def update(self, data):
+        """Updates the summary of an execution with an action event
+
+        Args:
+            data (dict): The action data sent to the action stream
+        """
+        action = {key: data[key] for key in action_summary_keys if key != 'workflow_execution_id'}
+        action['status'] = data['status']
+        with self._lock:
+            entry = self._update_execution(data['workflow_execution_id'])
+            entry['current_action'] = action
+            entry['counts'][data['status']] += 1
+            if data['status'] == ActionStatusEnum.failure.name:
+                result = data.get('result')
+                if isinstance(result, SerializedJson):
+                    result = json.loads(result.json)
+                entry['last_error'] = dict(action, result=result)
+
+    def complete(self, execution_id):
+        """Marks an execution as completed
+
+        Args:
+            execution_id (str): The execution ID of the workflow
+        """
+        with self._lock:
+            self._update_execution(str(execution_id))['completed'] = True
+
+    def snapshot(self, since, workflow_execution_id='all'):
+        """Gets the summaries of the executions which changed since a version
+
+        Args:
+            since (int): The version of the last snapshot
+            workflow_execution_id (str, optional): The execution to get, or 'all' for every execution. Defaults to
+                'all'.
+
+        Returns:
+            (tuple(int, dict)): The current version, and the changed summaries, or None if nothing changed
+        """
+        with self._lock:
+            if since >= self.version:
+                return self.version, None
+            executions = []
+            for version, entry in reversed(self._executions.values()):
+                if version <= since:
+                    break
+                if workflow_execution_id in ('all', entry['workflow_execution_id']):
+                    executions.append(dict(entry, counts=dict(entry['counts'])))
+            return self.version, {'executions': executions[::-1]} if executions else None
+
+
+action_snapshots = ActionSnapshots()
+
+workflow_stream = FilteredSseStream('workflow_results', coalesce_key=get_event_and_fields('execution_id'))
+action_stream = FilteredSseStream('action_results', coalesce_key=get_event_and_fields('execution_id'))
+action_summary_stream = FilteredSseStream(
+    'action_results_summary', coalesce_key=get_event_and_fields('workflow_execution_id', 'action_id'))
+action_snapshot_stream = SnapshotSseStream('action_results_snapshot', action_snapshots.snapshot)
 
 workflowresults_page = StreamableBlueprint(
     'workflowresults_page',
     __name__,
-    streams=(workflow_stream, action_stream, action_summary_stream)
+    streams=(workflow_stream, action_stream, action_summary_stream, action_snapshot_stream)
 )
 
-action_summary_keys = ('action_name', 'app_name', 'action_id', 'name', 'timestamp', 'workflow_execution_id')
-
 
 @unique
 class ActionStreamEvent(Enum):
@@ -32,6 +130,7 @@ class ActionStreamEvent(Enum):
     success = 2
     failure = 3
     awaiting_data = 4
+    chunk = 5
 
 
 def format_action_data(sender, kwargs, status):
@@ -52,11 +151,12 @@ def format_action_data_with_results(sender, kwargs, status):
     action_result = kwargs['data']['data']['result']
     with current_app.app_context():
         max_len = current_app.config['MAX_STREAM_RESULTS_SIZE_KB'] * 1024
-    result_str = str(action_result)
-    if len(result_str) > max_len:
-        result['result'] = {'truncated': result_str[:max_len]}
+    serialized_result = SerializedJson.dumps(action_result)
+    if len(serialized_result) > max_len:
+        truncated = action_result if isinstance(action_result, string_types) else serialized_result.json
+        result['result'] = {'truncated': truncated[:max_len]}
     else:
-        result['result'] = action_result
+        result['result'] = serialized_result
     return result
 
 
@@ -80,6 +180,7 @@ def action_started_callback(sender, **kwargs):
     data = format_action_data(sender, kwargs, ActionStatusEnum.executing)
     push_to_action_stream(data, ActionStreamEvent.started.name)
     push_to_action_summary_stream(data, ActionStreamEvent.started.name)
+    action_snapshots.update(data)
 
 
 @WalkoffEvent.ActionExecutionSuccess.connect
@@ -87,6 +188,14 @@ def action_ended_callback(sender, **kwargs):
     data = format_action_data_with_results(sender, kwargs, ActionStatusEnum.success)
     push_to_action_stream(data, ActionStreamEvent.success.name)
     push_to_action_summary_stream(data, ActionStreamEvent.success.name)
+    action_snapshots.update(data)
+
+
+@WalkoffEvent.ActionResultChunk.connect
+def action_result_chunk_callback(sender, **kwargs):
+    data = format_action_data_with_results(sender, kwargs, ActionStatusEnum.executing)
+    data['index'] = kwargs['data']['data']['index']
+    push_to_action_stream(data, ActionStreamEvent.chunk.name)
 
 
 @WalkoffEvent.ActionExecutionError.connect
@@ -95,6 +204,7 @@ def action_error_callback(sender, **kwargs):
     data = format_action_data_with_results(sender, kwargs, ActionStatusEnum.failure)
     push_to_action_stream(data, ActionStreamEvent.failure.name)
     push_to_action_summary_stream(data, ActionStreamEvent.failure.name)
+    action_snapshots.update(data)
 
 
 @WalkoffEvent.TriggerActionAwaitingData.connect
@@ -102,6 +212,7 @@ def trigger_awaiting_data_action_callback(sender, **kwargs):
     data = format_action_data(sender, kwargs, ActionStatusEnum.awaiting_data)
     push_to_action_stream(data, ActionStreamEvent.awaiting_data.name)
     push_to_action_summary_stream(data, ActionStreamEvent.awaiting_data.name)
+    action_snapshots.update(data)
 
 
 @unique
@@ -203,6 +314,12 @@ def workflow_shutdown_callback(sender, **kwargs):
     return format_workflow_return(data)
 
 
+@WalkoffEvent.WorkflowAborted.connect
+@WalkoffEvent.WorkflowShutdown.connect
+def workflow_ended_snapshot_callback(sender, **kwargs):
+    action_snapshots.complete(sender['execution_id'])
+
+
 @workflowresults_page.route('/actions', methods=['GET'])
 @jwt_required_in_query('access_token')
 def stream_workflow_action_events():
@@ -215,6 +332,18 @@ def stream_workflow_action_events():
                 BAD_REQUEST,
                 'Could not connect to action results stream',
                 'workflow_execution_id must be a valid UUID')
+    if request.args.get('snapshot'):
+        try:
+            interval = float(request.args.get('interval', 1))
+        except ValueError:
+            interval = None
+        if interval is None or not min_snapshot_interval <= interval <= max_snapshot_interval:
+            return Problem(
+                BAD_REQUEST,
+                'Could not connect to action results stream',
+                'interval must be a number of seconds between {} and {}'.format(
+                    min_snapshot_interval, max_snapshot_interval))
+        return action_snapshot_stream.stream(interval=interval, workflow_execution_id=workflow_execution_id)
     if request.args.get('summary'):
         return action_summary_stream.stream(subchannel=workflow_execution_id)
     else:
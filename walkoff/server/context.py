@@ -5,6 +5,8 @@ import walkoff.multiprocessedexecutor.multiprocessedexecutor as executor
 import walkoff.scheduler
 from walkoff.case.logger import CaseLogger
 from walkoff.case.subscription import SubscriptionCache
+from walkoff.case.writer import make_case_event_writer
+from walkoff.retention import Archive, RetentionManager
 
 
 class Context(object):
@@ -16,14 +18,21 @@ class Context(object):
         Args:
             config (Config): A config object
         """
-        self.execution_db = walkoff.executiondb.ExecutionDatabase(config.EXECUTION_DB_TYPE, config.EXECUTION_DB_PATH)
+        self.execution_db = walkoff.executiondb.ExecutionDatabase(config.EXECUTION_DB_TYPE, config.EXECUTION_DB_PATH,
+                                                                  config.EXECUTION_DB_POOL,
+                                                                  config.EXECUTION_DB_SQLITE_PRAGMAS,
+                                                                  config.EXECUTION_DB_BINARY_UUIDS)
         self.case_db = walkoff.case.database.CaseDatabase(config.CASE_DB_TYPE, config.CASE_DB_PATH)
 
         self.subscription_cache = SubscriptionCache()
-        self.case_logger = CaseLogger(self.case_db, self.subscription_cache)
+        self.case_event_writer = make_case_event_writer(self.case_db, config.CASE_EVENT_WRITER)
+        self.case_logger = CaseLogger(self.case_db, self.subscription_cache, self.case_event_writer)
         self.cache = walkoff.cache.make_cache(config.CACHE)
         self.executor = executor.MultiprocessedExecutor(self.cache, self.case_logger)
         self.scheduler = walkoff.scheduler.Scheduler(self.case_logger)
+        self.archive = Archive(config.ARCHIVE_PATH)
+        self.retention = RetentionManager(self.execution_db, self.case_db, self.archive, config.RETENTION_POLICIES,
+                                          batch_size=config.RETENTION_BATCH_SIZE, interval=config.RETENTION_INTERVAL)
 
     def inject_app(self, app):
         self.scheduler.app = app
\ No newline at end of file
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from flask import request, current_app
+from flask_jwt_extended import jwt_required
+
+from walkoff.retention import partition_date_format
+from walkoff.security import permissions_accepted_for_resources, ResourcePermissions
+from walkoff.server.problem import Problem
+from walkoff.server.returncodes import *
+
+archived_table_resources = {'workflow_status': 'playbooks', 'action_status': 'playbooks', 'event': 'cases'}
+
+
+def read_archive_partitions():
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('playbooks', ['read']),
+                                        ResourcePermissions('cases', ['read']))
+    def __func():
+        table = request.args.get('table')
+        return current_app.running_context.archive.list_partitions(table), SUCCESS
+
+    return __func()
+
+
+def read_archived_records(table):
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions(archived_table_resources[table], ['read']))
+    def __func():
+        try:
+            start_date = _parse_date(request.args.get('start_date'))
+            end_date = _parse_date(request.args.get('end_date'))
+        except ValueError:
+            return Problem(BAD_REQUEST, 'Could not read archive.', 'Dates must be formatted as YYYY-MM-DD')
+        page = request.args.get('page', 1, type=int)
+        items_per_page = current_app.config['ITEMS_PER_PAGE']
+        return current_app.running_context.archive.query(table, start_date, end_date,
+                                                         offset=(page - 1) * items_per_page,
+                                                         limit=items_per_page), SUCCESS
+
+    return __func()
+
+
+def _parse_date(date):
+    return datetime.strptime(date, partition_date_format).date() if date else None
@@ -1,10 +1,12 @@
 import json
 
-from flask import request, current_app, send_file
+from flask import request, current_app, Response, stream_with_context
 from flask_jwt_extended import jwt_required
+from werkzeug.datastructures import Headers
 
 import walkoff.case.database as case_database
 from walkoff.case.subscription import Subscription
+from walkoff.helpers import decode_cursor, encode_cursor, parse_query_timestamp
 from walkoff.security import permissions_accepted_for_resources, ResourcePermissions
 from walkoff.server.decorators import with_resource_factory
 from walkoff.server.problem import Problem
@@ -12,11 +14,6 @@ from walkoff.server.returncodes import *
 from walkoff.serverdb import db
 from walkoff.serverdb.casesubscription import CaseSubscription
 
-try:
-    from StringIO import StringIO
-except ImportError:
-    from io import StringIO
-
 
 def case_getter(case_id):
     return current_app.running_context.case_db.session.query(case_database.Case) \
@@ -95,10 +92,9 @@ def read_case(case_id, mode=None):
     @with_case('read', case_id)
     def __func(case_obj):
         if mode == "export":
-            f = StringIO()
-            f.write(json.dumps(case_obj.as_json(), sort_keys=True, indent=4, separators=(',', ': ')))
-            f.seek(0)
-            return send_file(f, attachment_filename=case_obj.name + '.json', as_attachment=True), SUCCESS
+            case_db = current_app.running_context.case_db
+            return Response(stream_with_context(export_case(case_db, case_obj)), status=SUCCESS,
+                            mimetype='application/json', headers=attachment_headers(case_obj.name + '.json'))
         else:
             return case_obj.as_json(), SUCCESS
 
@@ -180,16 +176,122 @@ def read_all_events(case_id):
     @jwt_required
     @permissions_accepted_for_resources(ResourcePermissions('cases', ['read']))
     def __func():
+        case_db = current_app.running_context.case_db
+        if not case_db.case_exists(case_id):
+            return case_does_not_exist_problem(case_id)
         try:
-            page = request.args.get('page', 1, type=int)
-            result = current_app.running_context.case_db.case_events_as_json(case_id)
-        except Exception:
-            current_app.logger.error('Cannot get events for case {0}. Case does not exist.'.format(case_id))
-            return Problem(
-                OBJECT_DNE_ERROR,
-                'Could not read events for case.',
-                'Case {} does not exist.'.format(case_id))
+            filters = get_case_event_filters(request.args)
+            after_id = decode_case_event_cursor(request.args.get('cursor'))
+        except ValueError as e:
+            return Problem(BAD_REQUEST, 'Could not read events for case.', str(e))
 
-        return result, SUCCESS
+        if after_id is None and 'limit' not in request.args:
+            return [event.as_json() for event in case_db.case_events_query(case_id, **filters)], SUCCESS
+
+        limit = request.args.get('limit', current_app.config['ITEMS_PER_PAGE'], type=int)
+        events, has_more = case_db.read_case_events(case_id, limit, after_id=after_id, **filters)
+        headers = {'X-Next-Cursor': encode_case_event_cursor(events[-1])} if has_more else {}
+        return [event.as_json() for event in events], SUCCESS, headers
 
     return __func()
+
+
+def export_events(case_id):
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('cases', ['read']))
+    def __func():
+        case_db = current_app.running_context.case_db
+        if not case_db.case_exists(case_id):
+            return case_does_not_exist_problem(case_id)
+        try:
+            filters = get_case_event_filters(request.args)
+        except ValueError as e:
+            return Problem(BAD_REQUEST, 'Could not export events for case.', str(e))
+
+        def generate():
+            for event in case_db.iter_case_events(case_id, **filters):
+                yield json.dumps(event.as_json(), sort_keys=True) + '\n'
+
+        return Response(stream_with_context(generate()), status=SUCCESS, mimetype='application/x-ndjson',
+                        headers=attachment_headers('case-{}-events.ndjson'.format(case_id)))
+
+    return __func()
+
+
+def case_does_not_exist_problem(case_id):
+    current_app.logger.error('Cannot get events for case {0}. Case does not exist.'.format(case_id))
+    return Problem(
+        OBJECT_DNE_ERROR,
+        'Could not read events for case.',
+        'Case {} does not exist.'.format(case_id))
+
+
+def export_case(case_db, case):
+    """Generates the JSON representation of a case and its events, reading the events a batch at a time
+
+    Args:
+        case_db (CaseDatabase): The case database
+        case (Case): The case to export
+
+    Yields:
+        (str): The next part of the JSON document
+    """
+    yield '{{"id": {}, "name": {}, "events": ['.format(json.dumps(case.id), json.dumps(case.name))
+    separator = '\n'
+    for event in case_db.iter_case_events(case.id):
+        yield separator + json.dumps(event.as_json(), sort_keys=True)
+        separator = ',\n'
+    yield '\n]}\n'
+
+
+def attachment_headers(filename):
+    headers = Headers()
+    headers.add('Content-Disposition', 'attachment', filename=filename)
+    return headers
+
+
+def get_case_event_filters(args):
+    """Gets the filters on the events of a case from the query parameters
+
+    Args:
+        args (MultiDict): The query parameters
+
+    Returns:
+        (dict): The event_types, start_time, and end_time keyword arguments of CaseDatabase.case_events_query
+    """
+    filters = {}
+    if args.get('type'):
+        filters['event_types'] = [event_type.strip() for event_type in args['type'].split(',') if event_type.strip()]
+    for arg, key in (('start_time', 'start_time'), ('end_time', 'end_time')):
+        if args.get(arg):
+            filters[key] = parse_query_timestamp(args[arg], arg)
+    return filters
+
+
+def encode_case_event_cursor(event):
+    """Encodes the position of an event in the list of events of a case
+
+    Args:
+        event (Event): The event
+
+    Returns:
+        (str): The opaque cursor
+    """
+    return encode_cursor({'id': event.id})
+
+
+def decode_case_event_cursor(cursor):
+    """Decodes a cursor created by encode_case_event_cursor
+
+    Args:
+        cursor (str): The cursor
+
+    Returns:
+        (int): The ID of the event, or None if there is no cursor
+    """
+    position = decode_cursor(cursor)
+    if position is None:
+        return None
+    if not isinstance(position.get('id'), int):
+        raise ValueError('Invalid cursor')
+    return position['id']
@@ -4,6 +4,9 @@ from flask_jwt_extended import jwt_required
 import walkoff.case.database as case_database
 from walkoff.security import permissions_accepted_for_resources, ResourcePermissions
 from walkoff.server.decorators import validate_resource_exists_factory
+from walkoff.server.endpoints.cases import get_case_event_filters, encode_case_event_cursor, \
+    decode_case_event_cursor
+from walkoff.server.problem import Problem
 from walkoff.server.returncodes import *
 
 validate_event_exists = validate_resource_exists_factory(
@@ -34,3 +37,26 @@ def read_event(event_id):
         return current_app.running_context.case_db.event_as_json(event_id), SUCCESS
 
     return __func()
+
+
+def search_events():
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('cases', ['read']))
+    def __func():
+        try:
+            filters = get_case_event_filters(request.args)
+            before_id = decode_case_event_cursor(request.args.get('cursor'))
+        except ValueError as e:
+            return Problem(BAD_REQUEST, 'Could not search events.', str(e))
+        limit = request.args.get('limit', current_app.config['ITEMS_PER_PAGE'], type=int)
+        events, has_more = current_app.running_context.case_db.search_events(
+            limit,
+            before_id=before_id,
+            search=request.args.get('q'),
+            originator=request.args.get('originator'),
+            case_id=request.args.get('case_id', type=int),
+            **filters)
+        headers = {'X-Next-Cursor': encode_case_event_cursor(events[-1])} if has_more else {}
+        return [event.as_json() for event in events], SUCCESS, headers
+
+    return __func()
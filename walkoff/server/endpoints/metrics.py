@@ -4,6 +4,7 @@ from flask_jwt_extended import jwt_required
 from walkoff.executiondb.metrics import AppMetric, WorkflowMetric
 from walkoff.security import permissions_accepted_for_resources, ResourcePermissions
 from walkoff.server.returncodes import *
+from walkoff.sse import get_stream_stats
 
 
 def read_app_metrics():
@@ -24,6 +25,15 @@ def read_workflow_metrics():
     return __func()
 
 
+def read_stream_metrics():
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('metrics', ['read']))
+    def __func():
+        return {'streams': get_stream_stats()}, SUCCESS
+
+    return __func()
+
+
 def _convert_action_time_averages():
     app_metrics = current_app.running_context.execution_db.session.query(AppMetric).all()
     return {"apps": [app_metric.as_json() for app_metric in app_metrics]}
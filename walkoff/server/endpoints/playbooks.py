@@ -6,6 +6,7 @@ from flask_jwt_extended import jwt_required
 from sqlalchemy import exists, and_
 from sqlalchemy.exc import IntegrityError, StatementError
 
+from walkoff.executiondb.loadoptions import playbook_load_options, workflow_load_options
 from walkoff.executiondb.playbook import Playbook
 from walkoff.executiondb.workflow import Workflow
 from walkoff.helpers import regenerate_workflow_ids
@@ -32,12 +33,14 @@ def does_workflow_exist(playbook_id, workflow_id):
 
 
 def playbook_getter(playbook_id):
-    playbook = current_app.running_context.execution_db.session.query(Playbook).filter_by(id=playbook_id).first()
+    playbook = current_app.running_context.execution_db.session.query(Playbook).options(
+        *playbook_load_options()).filter_by(id=playbook_id).first()
     return playbook
 
 
 def workflow_getter(workflow_id):
-    return current_app.running_context.execution_db.session.query(Workflow).filter_by(id=workflow_id).first()
+    return current_app.running_context.execution_db.session.query(Workflow).options(
+        *workflow_load_options()).filter_by(id=workflow_id).first()
 
 
 with_playbook = with_resource_factory('playbook', playbook_getter, validator=is_valid_uid)
@@ -74,7 +77,8 @@ def get_playbooks(full=None):
     @permissions_accepted_for_resources(ResourcePermissions('playbooks', ['read']))
     def __func():
         full_rep = bool(full)
-        playbooks = current_app.running_context.execution_db.session.query(Playbook).all()
+        playbooks = current_app.running_context.execution_db.session.query(Playbook).options(
+            *playbook_load_options(full=full_rep)).all()
 
         if full_rep:
             ret_playbooks = [playbook_schema.dump(playbook).data for playbook in playbooks]
@@ -233,7 +237,8 @@ def get_workflows(playbook=None):
     @permissions_accepted_for_resources(ResourcePermissions('playbooks', ['read']))
     def __get():
         return [workflow_schema.dump(workflow).data for workflow in
-                current_app.running_context.execution_db.session.query(Workflow).all()], SUCCESS
+                current_app.running_context.execution_db.session.query(Workflow).options(
+                    *workflow_load_options()).all()], SUCCESS
 
     if playbook:
         return get_workflows_for_playbook(playbook)
@@ -1,12 +1,16 @@
 from collections import OrderedDict
+from datetime import datetime
+from uuid import UUID
 
 from flask import request, current_app
 from flask_jwt_extended import jwt_required
-from sqlalchemy import exists
+from six import string_types
+from sqlalchemy import exists, or_, and_, false, func
 
 from walkoff.executiondb.argument import Argument
 from walkoff.executiondb.workflow import Workflow
 from walkoff.executiondb.workflowresults import WorkflowStatus, WorkflowStatusEnum
+from walkoff.helpers import decode_cursor, encode_cursor, parse_query_timestamp
 from walkoff.security import permissions_accepted_for_resources, ResourcePermissions
 from walkoff.server.decorators import with_resource_factory, validate_resource_exists_factory, is_valid_uid
 from walkoff.server.problem import Problem
@@ -47,21 +51,195 @@ executing_statuses = (WorkflowStatusEnum.running, WorkflowStatusEnum.awaiting_da
 completed_statuses = (WorkflowStatusEnum.aborted, WorkflowStatusEnum.completed)
 
 
+# The order of the statuses when listing workflow statuses a page at a time
+workflow_status_list_order = sorted(status.name for status in WorkflowStatusEnum)
+
+# The largest number of workflow statuses which can be read in one page with a cursor
+max_workflow_status_limit = 1000
+
+cursor_timestamp_format = '%Y-%m-%dT%H:%M:%S.%fZ'
+
+
 def get_all_workflow_status():
     @jwt_required
     @permissions_accepted_for_resources(ResourcePermissions('playbooks', ['read']))
     def __func():
-        page = request.args.get('page', 1, type=int)
+        session = current_app.running_context.execution_db.session
+        try:
+            statuses = get_status_filter(request.args)
+            filters = get_workflow_status_filters(session, request.args)
+            cursor = decode_workflow_status_cursor(request.args.get('cursor'))
+        except ValueError as e:
+            return Problem(BAD_REQUEST, 'Could not read workflow statuses.', str(e))
+
+        if statuses:
+            status_filters = filters + [WorkflowStatus.status.in_([WorkflowStatusEnum[status] for status in statuses])]
+        else:
+            status_filters = filters
+
+        if request.args.get('count', 'false').lower() == 'true':
+            count = session.query(func.count(WorkflowStatus.execution_id)).filter(*status_filters).scalar()
+            return {'count': count}, SUCCESS
+
+        if 'page' in request.args:
+            page = request.args.get('page', 1, type=int)
+            ret = session.query(WorkflowStatus).filter(*status_filters). \
+                order_by(WorkflowStatus.status, WorkflowStatus.started_at.desc()). \
+                limit(current_app.config['ITEMS_PER_PAGE']). \
+                offset((page - 1) * current_app.config['ITEMS_PER_PAGE'])
+            return [workflow_status.as_json() for workflow_status in ret], SUCCESS
+
+        limit = min(request.args.get('limit', current_app.config['ITEMS_PER_PAGE'], type=int),
+                    max_workflow_status_limit)
+        workflow_statuses, next_cursor = read_workflow_status_page(session, filters, limit, statuses, cursor)
+        headers = {'X-Next-Cursor': next_cursor} if next_cursor else {}
+        return [workflow_status.as_json() for workflow_status in workflow_statuses], SUCCESS, headers
 
-        ret = current_app.running_context.execution_db.session.query(WorkflowStatus). \
-            order_by(WorkflowStatus.status, WorkflowStatus.started_at.desc()). \
-            limit(current_app.config['ITEMS_PER_PAGE']).\
-            offset((page-1) * current_app.config['ITEMS_PER_PAGE'])
+    return __func()
 
-        ret = [workflow_status.as_json() for workflow_status in ret]
-        return ret, SUCCESS
 
-    return __func()
+def get_status_filter(args):
+    """Gets the names of the statuses to list from the comma-separated status query parameter
+
+    Args:
+        args (MultiDict): The query parameters
+
+    Returns:
+        (list[str]): The names of the statuses, or None if the statuses are not filtered
+    """
+    if not args.get('status'):
+        return None
+    statuses = [status.strip() for status in args['status'].split(',') if status.strip()]
+    for status in statuses:
+        if status not in WorkflowStatusEnum.__members__:
+            raise ValueError('Unknown workflow status {}'.format(status))
+    return statuses
+
+
+def get_workflow_status_filters(session, args):
+    """Gets the filters on the workflow statuses to list from the query parameters, other than the status filter
+
+    Args:
+        session (Session): The execution database session
+        args (MultiDict): The query parameters
+
+    Returns:
+        (list): The filters
+    """
+    filters = []
+    if args.get('workflow_id'):
+        filters.append(WorkflowStatus.workflow_id == _parse_uuid(args['workflow_id'], 'workflow_id'))
+    if args.get('playbook_id'):
+        playbook_id = _parse_uuid(args['playbook_id'], 'playbook_id')
+        workflow_ids = [workflow_id for workflow_id, in
+                        session.query(Workflow.id).filter(Workflow.playbook_id == playbook_id)]
+        filters.append(WorkflowStatus.workflow_id.in_(workflow_ids) if workflow_ids else false())
+    if args.get('name'):
+        name = args['name'].replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        filters.append(WorkflowStatus.name.like(name + '%', escape='\\'))
+    for arg, column, after in (('started_after', WorkflowStatus.started_at, True),
+                               ('started_before', WorkflowStatus.started_at, False),
+                               ('completed_after', WorkflowStatus.completed_at, True),
+                               ('completed_before', WorkflowStatus.completed_at, False)):
+        if args.get(arg):
+            timestamp = parse_query_timestamp(args[arg], arg)
+            filters.append(column >= timestamp if after else column < timestamp)
+    return filters
+
+
+def read_workflow_status_page(session, filters, limit, statuses=None, cursor=None):
+    """Reads a page of workflow statuses using keyset pagination. The workflow statuses are ordered by status, then by
+        the time they started, most recent first, with those which have not started last. Each status is read
+        separately so that every query is a range scan of the index on the status and start time, no matter how deep
+        the page is.
+
+    Args:
+        session (Session): The execution database session
+        filters (list): The filters on the workflow statuses
+        limit (int): The maximum number of workflow statuses to read
+        statuses (list[str], optional): The names of the statuses to read. Defaults to None, meaning all statuses.
+        cursor (dict, optional): The decoded cursor of the last workflow status of the previous page. Defaults to None,
+            meaning the first page is read.
+
+    Returns:
+        (tuple(list[WorkflowStatus], str)): The workflow statuses and the cursor of the next page, or None if this is
+            the last page
+    """
+    statuses = set(statuses or workflow_status_list_order)
+    # Each status is split into the workflows which have started and those which have not
+    segments = [(status, started) for status in workflow_status_list_order if status in statuses
+                for started in (True, False)]
+    if cursor is not None:
+        cursor_segment = (cursor['status'], cursor['started_at'] is not None)
+        segments = segments[segments.index(cursor_segment):] if cursor_segment in segments else []
+
+    results = []
+    for status, started in segments:
+        query = session.query(WorkflowStatus).filter(WorkflowStatus.status == WorkflowStatusEnum[status], *filters)
+        if started:
+            query = query.filter(WorkflowStatus.started_at.isnot(None)). \
+                order_by(WorkflowStatus.started_at.desc(), WorkflowStatus.execution_id.desc())
+        else:
+            query = query.filter(WorkflowStatus.started_at.is_(None)).order_by(WorkflowStatus.execution_id.desc())
+        if cursor is not None and (status, started) == cursor_segment:
+            if started:
+                query = query.filter(WorkflowStatus.started_at <= cursor['started_at'],
+                                     or_(WorkflowStatus.started_at < cursor['started_at'],
+                                         and_(WorkflowStatus.started_at == cursor['started_at'],
+                                              WorkflowStatus.execution_id < cursor['execution_id'])))
+            else:
+                query = query.filter(WorkflowStatus.execution_id < cursor['execution_id'])
+        results.extend(query.limit(limit + 1 - len(results)).all())
+        if len(results) > limit:
+            return results[:limit], encode_workflow_status_cursor(results[limit - 1])
+    return results, None
+
+
+def encode_workflow_status_cursor(workflow_status):
+    """Encodes the position of a workflow status in the list of workflow statuses
+
+    Args:
+        workflow_status (WorkflowStatus): The workflow status
+
+    Returns:
+        (str): The opaque cursor
+    """
+    cursor = {'status': workflow_status.status.name,
+              'started_at': (workflow_status.started_at.strftime(cursor_timestamp_format)
+                             if workflow_status.started_at else None),
+              'execution_id': str(workflow_status.execution_id)}
+    return encode_cursor(cursor)
+
+
+def decode_workflow_status_cursor(cursor):
+    """Decodes a cursor created by encode_workflow_status_cursor
+
+    Args:
+        cursor (str): The cursor
+
+    Returns:
+        (dict): The status, start time, and execution ID of the workflow status, or None if there is no cursor
+    """
+    cursor = decode_cursor(cursor)
+    if cursor is None:
+        return None
+    try:
+        if (cursor['status'] not in WorkflowStatusEnum.__members__
+                or not isinstance(cursor['execution_id'], string_types)):
+            raise ValueError
+        return {'status': cursor['status'],
+                'started_at': (datetime.strptime(cursor['started_at'], cursor_timestamp_format)
+                               if cursor['started_at'] is not None else None),
+                'execution_id': UUID(cursor['execution_id'])}
+    except (ValueError, TypeError, KeyError):
+        raise ValueError('Invalid cursor')
+
+
+def _parse_uuid(value, name):
+    try:
+        return UUID(value)
+    except ValueError:
+        raise ValueError('{} must be a UUID'.format(name))
 
 
 def get_workflow_status(execution_id):
@@ -12,6 +12,7 @@ INVALID_INPUT_ERROR = 400
 UNAUTHORIZED_ERROR = 401
 FORBIDDEN_ERROR = 403
 OBJECT_DNE_ERROR = 404
+TOO_MANY_REQUESTS = 429
 
 # Server Errors
 SERVER_ERROR = 500
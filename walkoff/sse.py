@@ -1,11 +1,270 @@
 import collections
 import json
-from functools import wraps
-
-from flask import Response, Blueprint
+import logging
+import threading
+from functools import partial, wraps
+
+import gevent
+from flask import Response, Blueprint, has_request_context, request
+from flask_jwt_extended import get_jwt_identity
+from gevent.event import Event
 from six import string_types, binary_type
 
+import walkoff.config
 from walkoff.cache import unsubscribe_message
+from walkoff.server.problem import Problem
+from walkoff.server.returncodes import TOO_MANY_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+overflow_policies = ('drop_oldest', 'coalesce', 'disconnect')
+"""(tuple(str)): What happens to a new event when the queue of a client is full. 'drop_oldest' drops the oldest queued
+event, 'coalesce' replaces the queued event with the same key, and 'disconnect' closes the stream. The default key is
+the event name, which is only safe for streams sending one entity per event name; streams about many executions should
+key their events by the IDs in their data with `get_event_and_fields`.
+"""
+
+default_stream_options = {'max_queue_size': 1000, 'overflow_policy': 'drop_oldest', 'max_streams_per_user': 20}
+
+_streams = {}
+
+
+def get_last_event_id():
+    """Gets the ID of the last event received by a client reconnecting to an SSE stream
+
+    Returns:
+        (int): The ID sent in the Last-Event-ID header of the current request, or None if there is no request or the
+            header is missing or not an integer
+    """
+    if not has_request_context():
+        return None
+    try:
+        return int(request.headers.get('Last-Event-ID'))
+    except (TypeError, ValueError):
+        return None
+
+
+def get_stream_user():
+    """Gets the user opening an SSE stream
+
+    Returns:
+        The identity of the JWT of the current request, or None if there is no request or JWT
+    """
+    if not has_request_context():
+        return None
+    try:
+        return get_jwt_identity()
+    except (KeyError, RuntimeError):
+        return None
+
+
+def get_event_name(serialized):
+    """Gets the event name of a serialized SSE. This is the default key used to coalesce the events queued for a client.
+
+    Args:
+        serialized (str): The event and data lines of the SSE
+
+    Returns:
+        (str): The event name, or None if the SSE has no event
+    """
+    if serialized.startswith('event: '):
+        return serialized[7:serialized.index('\n')]
+    return None
+
+
+def get_event_and_fields(*fields):
+    """Creates a coalesce key which combines the event name of a serialized SSE with fields of its JSON data
+
+    The default key, the event name, replaces a queued event about one execution with a new event about another one.
+    Keying the events of a stream by the IDs in their data only replaces older events about the same entity.
+
+    Args:
+        *fields (str): The keys of the data identifying the entity the event is about
+
+    Returns:
+        (func): Gets the key of a serialized SSE, or None if the SSE has no event or its data is not a JSON object
+    """
+
+    def get_key(serialized):
+        name = get_event_name(serialized)
+        if name is None:
+            return None
+        data_start = serialized.find('data: ')
+        if data_start < 0:
+            return None
+        try:
+            data = json.loads(serialized[data_start + 6:serialized.index('\n', data_start)])
+            return (name, ) + tuple(data.get(field) for field in fields)
+        except (ValueError, AttributeError):
+            return None
+
+    return get_key
+
+
+def get_stream_stats():
+    """Gets the counters of every SSE stream
+
+    Returns:
+        (list[dict]): The channel and counters of each stream
+    """
+    return [dict(channel=channel, **_streams[channel].stats) for channel in sorted(_streams)]
+
+
+class StreamLimiter(object):
+    """Counts the SSE streams each user has open"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._streams = collections.Counter()
+
+    def acquire(self, user, limit):
+        """Counts a stream opened by a user if the user has fewer than limit streams open
+
+        Args:
+            user: The identity of the user
+            limit (int): The number of streams the user may have open. 0 or None for no limit.
+
+        Returns:
+            (bool): Whether the stream may be opened
+        """
+        with self._lock:
+            if limit and self._streams[user] >= limit:
+                return False
+            self._streams[user] += 1
+            return True
+
+    def release(self, user):
+        """Stops counting a stream opened by a user
+
+        Args:
+            user: The identity of the user
+        """
+        with self._lock:
+            self._streams[user] -= 1
+            if self._streams[user] <= 0:
+                del self._streams[user]
+
+    def count(self, user):
+        """Gets the number of streams a user has open
+
+        Args:
+            user: The identity of the user
+
+        Returns:
+            (int): The number of streams
+        """
+        with self._lock:
+            return self._streams[user]
+
+
+stream_limiter = StreamLimiter()
+
+
+class SubscriberQueue(object):
+    """A bounded queue of the events waiting to be sent to one client of an SSE stream
+
+    The queue is filled by a separate greenlet, so a slow client never holds up the publisher or the other clients.
+    When the queue is full, the overflow policy decides what happens to a new event.
+
+    Attributes:
+        max_size (int): The number of events which can be queued
+        overflow_policy (str): One of `overflow_policies`
+        coalesce_key (func): Gets the key of a serialized SSE. With the 'coalesce' policy, a new event replaces the
+            queued event with the same key. The key is computed once when an event is queued.
+        disconnected (bool): Whether the queue was closed because it was full
+
+    Args:
+        max_size (int): The number of events which can be queued
+        overflow_policy (str, optional): One of `overflow_policies`. Defaults to 'drop_oldest'.
+        coalesce_key (func, optional): Gets the key of a serialized SSE. Defaults to the event name, which is only safe
+            when each event name is about a single entity.
+        stats (Counter, optional): The counters of the stream, which are incremented when events are dropped or
+            coalesced or the client is disconnected
+    """
+
+    def __init__(self, max_size, overflow_policy='drop_oldest', coalesce_key=get_event_name, stats=None):
+        if overflow_policy not in overflow_policies:
+            raise ValueError('Unknown overflow policy {}'.format(overflow_policy))
+        self.max_size = max_size
+        self.overflow_policy = overflow_policy
+        self.coalesce_key = coalesce_key
+        self.disconnected = False
+        self._stats = stats if stats is not None else collections.Counter()
+        self._messages = collections.deque()
+        self._ready = Event()
+        self._closed = False
+
+    def __len__(self):
+        return len(self._messages)
+
+    def put(self, event_id, message):
+        """Queues a serialized SSE
+
+        Args:
+            event_id (int): The ID assigned to the event by the channel, or None
+            message (str): The event and data lines of the SSE
+
+        Returns:
+            (bool): False if the queue has been closed, True otherwise
+        """
+        if self._closed:
+            return False
+        key = self.coalesce_key(message) if self.overflow_policy == 'coalesce' else None
+        if len(self._messages) >= self.max_size:
+            if self.overflow_policy == 'disconnect':
+                self._stats['disconnected'] += 1
+                self.disconnected = True
+                self._messages.clear()
+                self.close()
+                return False
+            if not (key is not None and self._coalesce(key)):
+                self._messages.popleft()
+                self._stats['dropped'] += 1
+        self._messages.append((event_id, message, key))
+        self._ready.set()
+        return True
+
+    def _coalesce(self, key):
+        for queued in self._messages:
+            if queued[2] == key:
+                self._messages.remove(queued)
+                self._stats['coalesced'] += 1
+                return True
+        return False
+
+    def fill(self, messages, subscription=None):
+        """Queues the messages of a subscription until the subscription ends or the queue is closed
+
+        Args:
+            messages (iterable): The messages of the subscription
+            subscription (optional): The subscription. If it has an `event_id` attribute, it is used as the ID of each
+                message.
+        """
+        try:
+            for message in messages:
+                if message == 1:
+                    continue
+                if isinstance(message, binary_type):
+                    message = message.decode('utf-8')
+                if not self.put(getattr(subscription, 'event_id', None), message):
+                    break
+        finally:
+            self.close()
+
+    def close(self):
+        """Closes the queue. The queued events can still be read."""
+        self._closed = True
+        self._ready.set()
+
+    def __iter__(self):
+        while True:
+            while not self._messages:
+                if self._closed:
+                    return
+                self._ready.clear()
+                self._ready.wait()
+            event_id, message, _ = self._messages.popleft()
+            yield event_id, message
 
 
 class StreamableBlueprint(Blueprint):
@@ -41,6 +300,70 @@ class StreamableBlueprint(Blueprint):
         self._cache = cache
 
 
+class SerializedJson(object):
+    """A value which has already been serialized to JSON
+
+    When a `dict` containing a SerializedJson is sent through an SSE stream, the JSON is inserted into the data of the
+    event as is instead of being serialized again.
+
+    Attributes:
+        json (str): The JSON of the value
+
+    Args:
+        json_text (str): The JSON of the value
+    """
+    __slots__ = ('json',)
+
+    def __init__(self, json_text):
+        self.json = json_text
+
+    @classmethod
+    def dumps(cls, value):
+        """Serializes a value to JSON. Values which cannot be serialized are serialized as their string form.
+
+        Args:
+            value: The value to serialize
+
+        Returns:
+            (SerializedJson): The serialized value
+        """
+        try:
+            return cls(json.dumps(value))
+        except (TypeError, ValueError):
+            return cls(json.dumps(str(value)))
+
+    def __len__(self):
+        return len(self.json)
+
+    def __eq__(self, other):
+        return isinstance(other, SerializedJson) and self.json == other.json
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'SerializedJson({})'.format(self.json)
+
+
+def format_serialized_event(serialized, event_id, retry=None):
+    """Formats a serialized SSE as needed to send to a client
+
+    Args:
+        serialized (str): The event and data lines of the SSE, as returned by SseEvent.serialize()
+        event_id (int): The ID related to this event.
+        retry (int, optional): The time in milliseconds the client should wait to retry to connect to this SSE stream
+            if the connection is broken.
+
+    Returns:
+        (str): The SSE formatted to be sent to the client
+    """
+    formatted = 'id: {}\n'.format(event_id)
+    if retry is None:
+        return formatted + serialized
+    event_end = serialized.index('\n') + 1 if serialized.startswith('event: ') else 0
+    return '{}{}retry: {}\n{}'.format(formatted, serialized[:event_end], retry, serialized[event_end:])
+
+
 class SseEvent(object):
     """Class which creates and formats Server-Sent Events
 
@@ -57,13 +380,41 @@ class SseEvent(object):
     def __init__(self, event, data):
         self.event = event
         self.data = data
+        self._serialized = None
 
     @staticmethod
     def __convert_dict(data):
+        serialized = {key: value for key, value in data.items() if isinstance(value, SerializedJson)}
         try:
-            return json.dumps(data)
+            if not serialized:
+                return json.dumps(data)
+            converted = json.dumps({key: value for key, value in data.items() if key not in serialized})
         except TypeError:
             return str(data)
+        fields = ['{}: {}'.format(json.dumps(key), value.json) for key, value in serialized.items()]
+        if converted != '{}':
+            fields.insert(0, converted[1:-1])
+        return '{{{}}}'.format(', '.join(fields))
+
+    def serialize(self):
+        """Get the event and data lines of this SSE, which are the same for every client. The data is only serialized
+            the first time this is called.
+
+        Returns:
+            (str): The event and data lines of this SSE
+        """
+        if self._serialized is None:
+            if isinstance(self.data, dict):
+                data = SseEvent.__convert_dict(self.data)
+            else:
+                data = self.data
+            formatted = ''
+            if self.event:
+                formatted += 'event: {}\n'.format(self.event)
+            if self.data:
+                formatted += 'data: {}\n'.format(data)
+            self._serialized = formatted + '\n'
+        return self._serialized
 
     def format(self, event_id, retry=None):
         """Get this SSE formatted as needed to send to the client
@@ -76,18 +427,7 @@ class SseEvent(object):
         Returns:
             (str): This SSE formatted to be sent to the client
         """
-        if isinstance(self.data, dict):
-            data = SseEvent.__convert_dict(self.data)
-        else:
-            data = self.data
-        formatted = 'id: {}\n'.format(event_id)
-        if self.event:
-            formatted += 'event: {}\n'.format(self.event)
-        if retry is not None:
-            formatted += 'retry: {}\n'.format(retry)
-        if self.data:
-            formatted += 'data: {}\n'.format(data)
-        return formatted + '\n'
+        return format_serialized_event(self.serialize(), event_id, retry=retry)
 
 
 class SseStream(object):
@@ -97,18 +437,62 @@ class SseStream(object):
         channel (str): The name of the channel to push the events through
         cache (:obj:, optional): The cache to use for this SSE stream. Defaults to the `walkoff.cache.cache` used
             throughout Walkoff
+        max_queue_size (int): The number of events which can be queued for each client. If None, the
+            `max_queue_size` of `Config.SSE_STREAMS` is used.
+        overflow_policy (str): What happens to a new event when the queue of a client is full. One of
+            `overflow_policies`. If None, the `overflow_policy` of `Config.SSE_STREAMS` is used.
+        coalesce_key (func): Gets the key of a serialized SSE used by the 'coalesce' overflow policy
+        max_streams_per_user (int): The number of streams each user can have open, counting the streams of every
+            SseStream. If None, the `max_streams_per_user` of `Config.SSE_STREAMS` is used.
         _default_headers (dict): The default headers to use in the response.
 
     Args:
         channel (str): The name of the channel to push the events through
         cache (:obj:, optional): The cache to use for this SSE stream. Defaults to the `walkoff.cache.cache` used
             throughout Walkoff
+        max_queue_size (int, optional): The number of events which can be queued for each client
+        overflow_policy (str, optional): What happens to a new event when the queue of a client is full
+        coalesce_key (func, optional): Gets the key of a serialized SSE used by the 'coalesce' overflow policy.
+            Defaults to the event name.
+        max_streams_per_user (int, optional): The number of streams each user can have open
     """
 
-    def __init__(self, channel, cache=None):
+    def __init__(self, channel, cache=None, max_queue_size=None, overflow_policy=None, coalesce_key=get_event_name,
+                 max_streams_per_user=None):
         self.channel = channel
         self.cache = cache
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.coalesce_key = coalesce_key
+        self.max_streams_per_user = max_streams_per_user
+        self._stats = collections.Counter()
         self._default_headers = {'Cache-Control': 'no-cache', 'Connection': 'keep-alive'}
+        _streams[channel] = self
+
+    @property
+    def stats(self):
+        """Gets the counters of the stream
+
+        Returns:
+            (dict): The number of clients connected, events dropped and coalesced because a client's queue was full,
+                clients disconnected because their queue was full, and clients rejected because their user had too
+                many streams open
+        """
+        return {key: self._stats[key] for key in ('subscribers', 'dropped', 'coalesced', 'disconnected', 'rejected')}
+
+    def get_option(self, name):
+        """Gets an option of the stream, falling back to `Config.SSE_STREAMS`
+
+        Args:
+            name (str): The name of the option
+
+        Returns:
+            The value of the option
+        """
+        value = getattr(self, name, None)
+        if value is None:
+            value = walkoff.config.Config.SSE_STREAMS.get(name, default_stream_options[name])
+        return value
 
     def push(self, event=''):
         """Decorator to use to over a function which pushes data to the SSE stream.
@@ -159,8 +543,7 @@ class SseStream(object):
             event (str): The event associated with this data
         """
         self.cache.register_callbacks()
-        response = {'data': data, 'event': kwargs.get('event', '')}
-        self.cache.publish(self.channel, json.dumps(response))
+        self.cache.publish(self.channel, SseEvent(kwargs.get('event', ''), data).serialize())
 
     def stream(self, headers=None, retry=None, **kwargs):
         """Returns a response used by Flask to create an SSE stream.
@@ -173,30 +556,50 @@ class SseStream(object):
             retry (int): The
 
         Returns:
-            (Response): A Flask Response object which creates the SSE stream
+            (Response): A Flask Response object which creates the SSE stream, or a Problem if the user already has
+                `max_streams_per_user` streams open
 
         """
+        user = get_stream_user()
+        if user is not None:
+            max_streams = self.get_option('max_streams_per_user')
+            if not stream_limiter.acquire(user, max_streams):
+                self._stats['rejected'] += 1
+                return Problem(
+                    TOO_MANY_REQUESTS,
+                    'Could not connect to stream',
+                    'A user can have at most {} streams open'.format(max_streams))
         stream_headers = self._default_headers
         if headers:
             stream_headers.update(headers)
-        return Response(self.send(retry=retry, **kwargs),
-                        mimetype='text/event-stream', headers=stream_headers)
+        kwargs.setdefault('last_event_id', get_last_event_id())
+        response = Response(self.send(retry=retry, **kwargs), mimetype='text/event-stream', headers=stream_headers)
+        if user is not None:
+            response.call_on_close(partial(stream_limiter.release, user))
+        return response
 
     def unsubscribe(self, **kwargs):
         """Unsubscribe from and close this stream
         """
         self.cache.publish(self.channel, unsubscribe_message)
 
-    def subscribe(self, **kwargs):
+    def subscribe(self, last_event_id=None, **kwargs):
         """Subscribes to a given channel
 
         Args:
+            last_event_id (int, optional): The ID of the last event received by the client. If the cache buffers the
+                messages of the channel, the messages published after it are sent first. Defaults to None.
             **kwargs: Unused
 
         Returns:
             (DiskSubscription): The subscription for this channel
         """
-        return self.cache.subscribe(self.channel)
+        return self._subscribe_to(self.channel, last_event_id)
+
+    def _subscribe_to(self, channel, last_event_id):
+        if last_event_id is None:
+            return self.cache.subscribe(channel)
+        return self.cache.subscribe(channel, last_event_id=last_event_id)
 
     def send(self, retry=None, **kwargs):
         """Sends data through the SSE stream to the client.
@@ -207,22 +610,33 @@ class SseStream(object):
             retry (int): The time in milliseconds the client should wait to retry to connect to this SSE stream if the
                 connection is broken. Default is 3 seconds (3000 milliseconds)
 
+        The events are published already serialized, so only their ID is added for each client. The ID of each event is
+        the ID assigned by the channel if the cache provides one, so that a client which
+        reconnects with a Last-Event-ID header can resume where it left off. Otherwise events are numbered from 1 for
+        each connection.
+
+        The events of the channel are read by a separate greenlet into a SubscriberQueue, so a slow client only fills
+        its own queue. When the queue is full, the overflow policy of the stream is applied.
+
         Yields:
             (str): The string to push through the SSE stream to the client
         """
         channel_queue = self.subscribe(**kwargs)
-
+        queue = SubscriberQueue(self.get_option('max_queue_size'), overflow_policy=self.get_option('overflow_policy'),
+                                coalesce_key=self.coalesce_key, stats=self._stats)
+        reader = gevent.spawn(queue.fill, channel_queue.listen(), channel_queue)
+        self._stats['subscribers'] += 1
         event_id = 0
-        for response in channel_queue.listen():
-            if response == 1:
-                continue
-            if isinstance(response, binary_type):
-                response = response.decode('utf-8')
-            response = json.loads(response)
-            data, event = response['data'], response['event']
-            sse = SseEvent(event, data)
-            event_id += 1
-            yield sse.format(event_id, retry=retry)
+        try:
+            for channel_event_id, response in queue:
+                event_id = channel_event_id if channel_event_id is not None else event_id + 1
+                yield format_serialized_event(response, event_id, retry=retry)
+            if queue.disconnected:
+                logger.warning('Disconnected a client of SSE stream {} which fell {} events behind'.format(
+                    self.channel, queue.max_size))
+        finally:
+            self._stats['subscribers'] -= 1
+            reader.kill(block=False)
 
 
 class FilteredSseStream(SseStream):
@@ -238,8 +652,8 @@ class FilteredSseStream(SseStream):
             throughout Walkoff
     """
 
-    def __init__(self, channel, cache=None):
-        super(FilteredSseStream, self).__init__(channel, cache)
+    def __init__(self, channel, cache=None, **kwargs):
+        super(FilteredSseStream, self).__init__(channel, cache, **kwargs)
 
     def _publish_response(self, response, default_event):
         """Publish a response to the filtered SSE stream.
@@ -261,12 +675,21 @@ class FilteredSseStream(SseStream):
             self.publish(response[0], subchannels=response[1], event=default_event)
 
     def publish(self, data, **kwargs):
+        """Publishes some data to subchannels of the stream. The data is serialized once for all the subchannels, and
+            is published to all of them at once.
+
+        Args:
+            data: The data to publish
+
+        Keyword Args:
+            subchannels: The identifier or iterable of identifiers of the subchannels to publish the data to
+            event (str): The event associated with this data
+        """
         self.cache.register_callbacks()
         subchannels = kwargs.get('subchannels', [])
-        data = json.dumps({'data': data, 'event': kwargs.get('event', '')})
+        data = SseEvent(kwargs.get('event', ''), data).serialize()
         if not isinstance(subchannels, string_types) and isinstance(subchannels, collections.Iterable):
-            for subchannel in subchannels:
-                self.cache.publish(self.create_subchannel_name(subchannel), data)
+            self.cache.publish_many((self.create_subchannel_name(subchannel), data) for subchannel in subchannels)
         else:
             self.cache.publish(self.create_subchannel_name(subchannels), data)
 
@@ -281,8 +704,8 @@ class FilteredSseStream(SseStream):
         """
         return '{0}.{1}'.format(self.channel, subchannel)
 
-    def subscribe(self, **kwargs):
-        return self.cache.subscribe(self.create_subchannel_name(kwargs.get('subchannel', '')))
+    def subscribe(self, last_event_id=None, **kwargs):
+        return self._subscribe_to(self.create_subchannel_name(kwargs.get('subchannel', '')), last_event_id)
 
     def stream(self, subchannel='', headers=None, retry=None):
         """Returns a response used by Flask to create an SSE stream.
@@ -296,14 +719,11 @@ class FilteredSseStream(SseStream):
             retry (int): The
 
         Returns:
-            (Response): A Flask Response object which creates the SSE stream
+            (Response): A Flask Response object which creates the SSE stream, or a Problem if the user already has
+                `max_streams_per_user` streams open
 
         """
-        stream_headers = self._default_headers
-        if headers:
-            stream_headers.update(headers)
-        return Response(self.send(retry=retry, subchannel=subchannel),
-                        mimetype='text/event-stream', headers=stream_headers)
+        return super(FilteredSseStream, self).stream(headers=headers, retry=retry, subchannel=subchannel)
 
     def unsubscribe(self, subchannel):
         """Unsubscribe from and close this stream
@@ -314,6 +734,68 @@ class FilteredSseStream(SseStream):
         self.cache.publish(self.create_subchannel_name(subchannel), unsubscribe_message)
 
 
+class SnapshotSseStream(SseStream):
+    """An SSE stream which sends periodic snapshots of some state instead of an event for every change
+
+    Each client chooses how often it receives snapshots. Each snapshot only contains the entries which changed since
+    the last snapshot sent to that client, so a client receives at most one event per interval no matter how quickly
+    the state changes.
+
+    Attributes:
+        snapshot (func): Gets the changes to the state. It is called with the version of the state of the last snapshot
+            sent to the client (0 for the first snapshot) and the keyword arguments passed to `stream`, and returns
+            the current version of the state and the data to send, or None if nothing changed.
+        event (str): The event of the snapshots
+
+    Args:
+        channel (str): The name of the stream
+        snapshot (func): Gets the changes to the state
+        event (str, optional): The event of the snapshots. Defaults to 'snapshot'.
+        **kwargs: The options of the SseStream
+    """
+
+    def __init__(self, channel, snapshot, event='snapshot', **kwargs):
+        super(SnapshotSseStream, self).__init__(channel, **kwargs)
+        self.snapshot = snapshot
+        self.event = event
+        self._generation = 0
+
+    def publish(self, data, **kwargs):
+        """Snapshots are computed for each client, so nothing is published"""
+        pass
+
+    def unsubscribe(self, **kwargs):
+        """Closes every open stream after its current interval"""
+        self._generation += 1
+
+    def send(self, retry=None, interval=1, last_event_id=None, **kwargs):
+        """Sends the snapshots through the SSE stream to the client
+
+        Args:
+            retry (int): The time in milliseconds the client should wait to retry to connect to this SSE stream if the
+                connection is broken.
+            interval (float, optional): The number of seconds between snapshots. Defaults to 1.
+            last_event_id (int, optional): Unused. The first snapshot always contains the entire state.
+            **kwargs: Passed to the snapshot function
+
+        Yields:
+            (str): The string to push through the SSE stream to the client
+        """
+        generation = self._generation
+        self._stats['subscribers'] += 1
+        version = 0
+        event_id = 0
+        try:
+            while generation == self._generation:
+                version, data = self.snapshot(version, **kwargs)
+                if data:
+                    event_id += 1
+                    yield SseEvent(self.event, data).format(event_id, retry=retry)
+                gevent.sleep(interval)
+        finally:
+            self._stats['subscribers'] -= 1
+
+
 def create_interface_channel_name(interface, channel):
     """Creates a unique channel name for an SSE stream for an interface.
 
@@ -339,10 +821,12 @@ class InterfaceSseStream(SseStream):
         interface (str): The name of the interface
         channel (str): The name of the channel
         cache (optional): The cache object used for this SSE stream
+        **kwargs: The queue options of the SseStream
     """
 
-    def __init__(self, interface, channel, cache=None):
-        super(InterfaceSseStream, self).__init__(create_interface_channel_name(interface, channel), cache=cache)
+    def __init__(self, interface, channel, cache=None, **kwargs):
+        super(InterfaceSseStream, self).__init__(create_interface_channel_name(interface, channel), cache=cache,
+                                                 **kwargs)
         self.interface = interface
 
 
@@ -356,8 +840,10 @@ class FilteredInterfaceSseStream(FilteredSseStream):
         interface (str): The name of the interface
         channel (str): The name of the channel
         cache (optional): The cache object used for this SSE stream
+        **kwargs: The queue options of the SseStream
     """
 
-    def __init__(self, interface, channel, cache=None):
-        super(FilteredInterfaceSseStream, self).__init__(create_interface_channel_name(interface, channel), cache=cache)
+    def __init__(self, interface, channel, cache=None, **kwargs):
+        super(FilteredInterfaceSseStream, self).__init__(create_interface_channel_name(interface, channel),
+                                                         cache=cache, **kwargs)
         self.interface = interface
@@ -0,0 +1,125 @@
+import logging
+import sys
+import threading
+from datetime import datetime
+from timeit import default_timer
+
+from walkoff.helpers import PhaseTimer
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_name(name, globals_, level):
+    if level <= 0:
+        return name
+    globals_ = globals_ or {}
+    package = globals_.get('__package__') or globals_.get('__name__', '')
+    if level > 1:
+        package = package.rsplit('.', level - 1)[0]
+    return '{0}.{1}'.format(package, name) if name else package
+
+
+class ImportTimer(object):
+    def __init__(self):
+        """Traces the time taken to import each module by wrapping the builtin __import__. Only the first import of a
+            module is timed. Submodules imported through a from-list are included in the time of the module which
+            imported them.
+        """
+        self.modules = {}
+        self._original_import = None
+        self._local = threading.local()
+
+    def install(self):
+        """Starts tracing imports"""
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self.__import
+
+    def uninstall(self):
+        """Stops tracing imports"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def __import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        module_name = _resolve_name(name, globals, level)
+        if module_name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.)
+        start = default_timer()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = default_timer() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += cumulative
+            if module_name not in self.modules:
+                self.modules[module_name] = (cumulative, cumulative - children)
+
+    def sorted_modules(self):
+        """Gets the imported modules sorted by the time taken to import them
+
+        Returns:
+            (list[tuple(str, float, float)]): The name, cumulative time, and self time of each module, slowest first
+        """
+        return sorted(((name, cumulative, self_time) for name, (cumulative, self_time) in self.modules.items()),
+                      key=lambda module: module[1], reverse=True)
+
+
+class StartupProfiler(PhaseTimer):
+    def __init__(self, enabled=False):
+        """Profiles the startup of Walkoff, recording the wall time of each phase and, if enabled, of each module
+            imported during startup
+
+        Args:
+            enabled (bool, optional): Whether to trace imports and write a report. Defaults to False.
+        """
+        super(StartupProfiler, self).__init__()
+        self.enabled = enabled
+        self.import_timer = ImportTimer()
+        self._started = default_timer()
+        if enabled:
+            self.import_timer.install()
+
+    def format_report(self):
+        """Formats the phases and imports, each sorted from slowest to fastest
+
+        Returns:
+            (str): The report
+        """
+        lines = ['WALKOFF startup profile ({})'.format(datetime.utcnow().isoformat()),
+                 '',
+                 'Total wall time: {0:.3f}s'.format(default_timer() - self._started),
+                 '',
+                 'Phases:']
+        for name, duration in sorted(self.phases, key=lambda phase: phase[1], reverse=True):
+            lines.append('{0:>10.3f}s  {1}'.format(duration, name))
+        lines.extend(['', 'Imports:', '{0:>11}  {1:>11}  {2}'.format('cumulative', 'self', 'module')])
+        for name, cumulative, self_time in self.import_timer.sorted_modules():
+            lines.append('{0:>10.4f}s  {1:>10.4f}s  {2}'.format(cumulative, self_time, name))
+        return '\n'.join(lines) + '\n'
+
+    def write_report(self, path):
+        """Stops tracing imports and writes the report, if profiling is enabled
+
+        Args:
+            path (str): The path of the file to write the report to
+        """
+        if not self.enabled:
+            return
+        self.import_timer.uninstall()
+        try:
+            with open(path, 'w') as report_file:
+                report_file.write(self.format_report())
+            logger.info('Wrote startup profile to {}'.format(path))
+        except (IOError, OSError):
+            logger.error('Could not write startup profile to {}'.format(path), exc_info=True)